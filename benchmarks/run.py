@@ -0,0 +1,226 @@
+"""Benchmark each scraper's extraction, validation and CSV export on synthetic pages.
+
+Run from the repository root::
+
+    python -m benchmarks.run --rows 20 1000 10000 100000 --output benchmarks/results.json
+    python -m benchmarks.run --compare benchmarks/results.json --output benchmarks/latest.json
+
+Stages, each timed over ``--repeat`` runs:
+
+- ``extract``: parse the page and read the schema's rows
+- ``validate``: convert the rows and build the Pydantic records
+- ``export``: ``save_to_csv`` of the records
+- ``end_to_end``: ``stream_to_csv`` with the page replayed from a fetch archive
+
+Latencies are per stage run. Peak memory is the Python heap peak
+(tracemalloc) of one extra, untimed run, so tracing does not skew the
+timings; lxml's own allocations are not included.
+"""
+import argparse
+import asyncio
+import gc
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.synthetic import GENERATORS
+from src.app.models.config import SchedulerConfig
+from src.app.scrapers.base_scraper import BaseScraper
+from src.app.scrapers.extraction import extract_snapshot
+from src.app.scrapers.fetch_archive import ARCHIVE_REPLAY, SOURCE_HTTP, configure_fetch_archive
+from src.app.scrapers.formula1_history_scraper import Formula1RaceResultScraper, season_url
+from src.app.scrapers.formula1_scraper import Formula1Scraper
+from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
+from src.app.scrapers.scheduler import configure_scheduler
+from src.app.scrapers.ufc_scraper import UFCScraper
+
+DEFAULT_ROWS = [20, 1000, 10000, 100000]
+
+def make_scraper(name: str) -> BaseScraper:
+    """Scraper for ``name`` with caches, change detection and extra fetches turned off"""
+    if name == "premier_league":
+        scraper = PremierLeagueScraper()
+        scraper.fill_fixtures = False
+    elif name == "formula1":
+        scraper = Formula1Scraper()
+        scraper.fill_fixtures = False
+    elif name == "ufc":
+        scraper = UFCScraper()
+        scraper.enrich_profiles = False
+    elif name == "formula1_race":
+        scraper = Formula1RaceResultScraper()
+        scraper.apply_job(season_url(2024, "races/1/benchmark/race-result"),
+                          {"season": 2024, "race": "Benchmark Grand Prix"})
+    else:
+        raise KeyError(f"Unknown benchmark scraper: {name}")
+    scraper.use_http_cache = False
+    scraper.detect_changes = False
+    return scraper
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of ``samples`` (``q`` in 0-100)"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered), math.ceil(q / 100 * len(ordered))) - 1)
+    return ordered[index]
+
+async def measure(run: Callable[[], Awaitable[Any]], repeat: int) -> Tuple[List[float], int]:
+    """Time ``repeat`` runs, then trace one more for its peak Python heap
+
+    Returns:
+        Tuple[List[float], int]: Seconds per run and the peak heap in bytes
+    """
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        await run()
+        samples.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        await run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return samples, peak
+
+def _result(name: str, rows: int, stage: str, samples: List[float], peak: int) -> Dict[str, Any]:
+    p50 = percentile(samples, 50)
+    return {
+        "scraper": name,
+        "rows": rows,
+        "stage": stage,
+        "runs": len(samples),
+        "rows_per_sec": round(rows / p50, 1) if p50 else None,
+        "p50_ms": round(p50 * 1000, 3),
+        "p99_ms": round(percentile(samples, 99) * 1000, 3),
+        "peak_mb": round(peak / (1024 * 1024), 3),
+    }
+
+async def bench_scraper(name: str, rows: int, repeat: int, workdir: str) -> List[Dict[str, Any]]:
+    """Benchmark every stage of one scraper on a page of ``rows`` rows"""
+    scraper = make_scraper(name)
+    url = scraper.job_url or scraper.get_source_url()
+    html = GENERATORS[name](rows, 0)
+    filename = os.path.join(workdir, f"{name}_{rows}.csv")
+    results = []
+
+    async def extract():
+        return extract_snapshot(html, scraper.schema, scraper.region_selector)
+
+    page = await extract()
+    results.append(_result(name, rows, "extract", *await measure(extract, repeat)))
+
+    async def validate():
+        return [scraper.process_row(row, url) for row in page.rows]
+
+    records = [record for record in await validate() if record is not None]
+    if len(records) != rows:
+        raise RuntimeError(f"{name}: {len(records)} of {rows} synthetic rows validated")
+    results.append(_result(name, rows, "validate", *await measure(validate, repeat)))
+
+    async def export():
+        await scraper.save_to_csv(records, filename)
+
+    results.append(_result(name, rows, "export", *await measure(export, repeat)))
+
+    archive = configure_fetch_archive(os.path.join(workdir, f"{name}_{rows}.jsonl.gz"), ARCHIVE_REPLAY)
+    archive.record(url, SOURCE_HTTP, html, 200)
+    try:
+        async def end_to_end():
+            written = await scraper.stream_to_csv(filename)
+            if written != rows:
+                raise RuntimeError(f"{name}: streamed {written} of {rows} records")
+
+        results.append(_result(name, rows, "end_to_end", *await measure(end_to_end, repeat)))
+    finally:
+        configure_fetch_archive(None)
+    return results
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+async def run(scrapers: List[str], sizes: List[int], repeat: int) -> Dict[str, Any]:
+    """Run the benchmark matrix and build the JSON report"""
+    # Replayed requests must not wait on per-host rate limits
+    configure_scheduler(SchedulerConfig(default_rate=1e9, default_burst=1000000))
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in scrapers:
+            for rows in sizes:
+                for result in await bench_scraper(name, rows, repeat, workdir):
+                    print(
+                        f"{result['scraper']:>15} {result['rows']:>7} {result['stage']:>10}: "
+                        f"{result['rows_per_sec'] or 0:>12,.0f} rows/s  p50 {result['p50_ms']:>10.2f} ms  "
+                        f"p99 {result['p99_ms']:>10.2f} ms  peak {result['peak_mb']:>8.2f} MB"
+                    )
+                    results.append(result)
+    return {
+        "commit": git_commit(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """Describe results whose p50 grew by more than ``threshold`` (a fraction) over the baseline"""
+    previous = {(r["scraper"], r["rows"], r["stage"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = previous.get((result["scraper"], result["rows"], result["stage"]))
+        if before is None or not before["p50_ms"]:
+            continue
+        change = result["p50_ms"] / before["p50_ms"] - 1
+        line = (
+            f"{result['scraper']} {result['rows']} rows {result['stage']}: "
+            f"p50 {before['p50_ms']:.2f} -> {result['p50_ms']:.2f} ms ({change:+.0%})"
+        )
+        print(line)
+        if change > threshold:
+            regressions.append(line)
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark scrapers on synthetic pages")
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS, help="Page sizes in rows")
+    parser.add_argument("--scrapers", nargs="+", choices=sorted(GENERATORS), default=sorted(GENERATORS))
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per stage")
+    parser.add_argument("--output", default="benchmarks/results.json", help="Where to write the JSON report")
+    parser.add_argument("--compare", metavar="BASELINE", help="Report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="p50 growth (fraction) counted as a regression with --compare")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args.scrapers, args.rows, args.repeat))
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(json.load(f), report, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regressions over {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""Synthetic standings, rankings and results pages of any size.
+
+Every generated row is valid for its scraper's model, so a page of ``rows``
+rows yields ``rows`` records. Pages are deterministic for a given seed.
+"""
+import random
+from typing import Callable, Dict
+
+WEIGHT_CLASSES = [
+    "Heavyweight", "Light Heavyweight", "Middleweight", "Welterweight", "Lightweight",
+    "Featherweight", "Bantamweight", "Flyweight", "Women's Bantamweight", "Women's Flyweight",
+]
+
+# Car numbers the Formula1Driver model accepts
+CAR_NUMBERS = [n for n in range(1, 100) if n not in (17, 19)]
+
+def _page(body: str) -> str:
+    # Navigation, scripts and footer around the table, as on the real sites
+    nav = "".join(f'<li><a href="/section-{i}">Section {i}</a></li>' for i in range(30))
+    scripts = "".join(f'<script src="/static/bundle-{i}.js"></script>' for i in range(10))
+    return (
+        f"<html><head><title>Standings</title>{scripts}</head><body>"
+        f"<nav><ul>{nav}</ul></nav><main>{body}</main>"
+        "<footer><p>All rights reserved</p></footer></body></html>"
+    )
+
+def premier_league_table(rows: int, seed: int = 0) -> str:
+    """League table with ``rows`` teams (positions cycle through 1-20)"""
+    rng = random.Random(seed)
+    cells = []
+    for i in range(rows):
+        won, drawn, lost = rng.randint(0, 30), rng.randint(0, 8), rng.randint(0, 8)
+        goals_for, goals_against = rng.randint(0, 90), rng.randint(0, 90)
+        form = "".join(rng.choice("WDL") for _ in range(5))
+        cells.append(
+            f'<tr class="table-row"><td class="position">{i % 20 + 1}</td>'
+            f'<td class="team-name">Team {i}</td><td class="played">{won + drawn + lost}</td>'
+            f'<td class="won">{won}</td><td class="drawn">{drawn}</td><td class="lost">{lost}</td>'
+            f'<td class="for">{goals_for}</td><td class="against">{goals_against}</td>'
+            f'<td class="goal-difference">{goals_for - goals_against}</td>'
+            f'<td class="points">{won * 3 + drawn}</td><td class="form">{form}</td></tr>'
+        )
+    return _page(f'<table class="league-table"><tbody>{"".join(cells)}</tbody></table>')
+
+def formula1_standings(rows: int, seed: int = 0) -> str:
+    """Drivers' championship table with ``rows`` drivers"""
+    rng = random.Random(seed)
+    cells = []
+    for i in range(rows):
+        wins = rng.randint(0, 10)
+        cells.append(
+            f'<tr><td class="position">{i % 20 + 1}</td><td class="driver-name">Driver {i}</td>'
+            f'<td class="nationality">GBR</td><td class="team-name">Team {i % 10}</td>'
+            f'<td class="points">{rng.randint(0, 800) / 2}</td><td class="wins">{wins}</td>'
+            f'<td class="podiums">{wins + rng.randint(0, 10)}</td>'
+            f'<td class="fastest-laps">{rng.randint(0, 5)}</td>'
+            f'<td class="car-number">{CAR_NUMBERS[i % len(CAR_NUMBERS)]}</td></tr>'
+        )
+    return _page(f'<table class="resultsarchive-table"><tbody>{"".join(cells)}</tbody></table>')
+
+def formula1_race_results(rows: int, seed: int = 0) -> str:
+    """Race classification with ``rows`` finishers, some not classified"""
+    rng = random.Random(seed)
+    cells = []
+    for i in range(rows):
+        classified = rng.random() > 0.1
+        cells.append(
+            f'<tr><td class="position">{i + 1 if classified else "NC"}</td>'
+            f'<td class="car-number">{CAR_NUMBERS[i % len(CAR_NUMBERS)]}</td>'
+            f'<td class="driver-name">Driver {i}</td><td class="team-name">Team {i % 10}</td>'
+            f'<td class="laps">{rng.randint(0, 70)}</td>'
+            f'<td class="time-retired">{"+1 Lap" if classified else "DNF"}</td>'
+            f'<td class="points">{max(0, 25 - i) if classified else 0}</td></tr>'
+        )
+    return _page(f'<table class="resultsarchive-table"><tbody>{"".join(cells)}</tbody></table>')
+
+def ufc_rankings(rows: int, seed: int = 0) -> str:
+    """Rankings with ``rows`` fighters spread over the weight classes"""
+    rng = random.Random(seed)
+    per_class = max(1, -(-rows // len(WEIGHT_CLASSES)))
+    groups = []
+    for start in range(0, rows, per_class):
+        weight_class = WEIGHT_CLASSES[(start // per_class) % len(WEIGHT_CLASSES)]
+        fighters = "".join(
+            f'<div class="views-row"><span class="views-field-weight-class-rank">#{i - start + 1}</span>'
+            f'<span class="views-field-title"><a href="/athlete/fighter-{i}">Fighter {i}</a></span>'
+            f'<span class="views-field-record">{rng.randint(0, 30)}-{rng.randint(0, 10)}-{rng.randint(0, 2)}</span></div>'
+            for i in range(start, min(rows, start + per_class))
+        )
+        groups.append(
+            f'<div class="view-grouping"><div class="view-grouping-header">{weight_class}</div>'
+            f'<div class="view-grouping-content">{fighters}</div></div>'
+        )
+    return _page("".join(groups))
+
+# Page generator for each benchmarked scraper
+GENERATORS: Dict[str, Callable[[int, int], str]] = {
+    "premier_league": premier_league_table,
+    "formula1": formula1_standings,
+    "formula1_race": formula1_race_results,
+    "ufc": ufc_rankings,
+}
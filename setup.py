@@ -7,10 +7,14 @@ setup(
     install_requires=[
         "crawl4ai>=0.1.0",
         "beautifulsoup4>=4.12.0",
+        "lxml>=4.9.0",
+        "cssselect>=1.2.0",
         "requests>=2.31.0",
         "pandas>=2.0.0",
         "python-dotenv>=1.0.0",
         "aiohttp>=3.8.0",
+        "httpx>=0.24.0",
+        "psutil>=5.9.0",
         "pytest>=7.0.0",
         "pytest-asyncio>=0.21.0",
         "pytest-cov>=4.0.0",
@@ -0,0 +1,48 @@
+import argparse
+import asyncio
+import logging
+import sys
+from scrapers.backfill import FIRST_SEASON, Formula1Backfill
+from scrapers.browser_pool import get_browser_pool
+from scrapers.fetcher import close_http_client
+from scrapers.offload import shutdown_process_pool
+from scrapers.telemetry import get_telemetry
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+async def main(args) -> bool:
+    backfill = Formula1Backfill(
+        start_season=args.start,
+        end_season=args.end,
+        concurrency=args.concurrency,
+        output_dir=args.output_dir,
+        checkpoint_path=args.checkpoint
+    )
+    # Keep the browser up for pages that need rendering
+    pool = get_browser_pool()
+    await pool.acquire()
+    try:
+        return await backfill.run()
+    except Exception as e:
+        logger.error(f"Error in backfill: {str(e)}")
+        return False
+    finally:
+        await pool.release()
+        await close_http_client()
+        shutdown_process_pool()
+        get_telemetry().export()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill Formula 1 season standings and race results")
+    parser.add_argument("--start", type=int, default=FIRST_SEASON, help="First season to load")
+    parser.add_argument("--end", type=int, default=None, help="Last season to load (default: current)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Pages fetched at once")
+    parser.add_argument("--output-dir", default="data/formula1_history")
+    parser.add_argument("--checkpoint", default="data/state/formula1_backfill.jsonl",
+                        help="Progress file; rerun with the same file to resume")
+    sys.exit(0 if asyncio.run(main(parser.parse_args())) else 1)
@@ -0,0 +1,40 @@
+import argparse
+import asyncio
+import logging
+from models.config import WorkQueueConfig
+from scrapers.distributed import enqueue_sources
+from scrapers.work_queue import create_work_queue
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+async def main(args):
+    queue = create_work_queue(WorkQueueConfig(
+        backend=args.backend,
+        sqlite_path=args.sqlite_path,
+        redis_url=args.redis_url
+    ))
+    try:
+        while True:
+            added = await enqueue_sources(queue, args.sources or None)
+            logger.info(f"Enqueued {len(added)} job(s); queue: {await queue.counts()}")
+            if not args.every:
+                break
+            await asyncio.sleep(args.every)
+    except Exception as e:
+        logger.error(f"Error in coordinator: {str(e)}")
+    finally:
+        await queue.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Enqueue scrape jobs for the workers")
+    parser.add_argument("sources", nargs="*", help="Scrapers to enqueue (default: all registered)")
+    parser.add_argument("--backend", default="sqlite", choices=["sqlite", "redis"])
+    parser.add_argument("--sqlite-path", default=WorkQueueConfig().sqlite_path)
+    parser.add_argument("--redis-url", default=None)
+    parser.add_argument("--every", type=float, default=0, help="Re-enqueue every N seconds")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,53 @@
+import asyncio
+import logging
+import signal
+from scrapers.browser_pool import get_browser_pool
+from scrapers.browser_profiles import get_browser_profiles
+from scrapers.ufc_scraper import UFCScraper
+from scrapers.premier_league_scraper import PremierLeagueScraper
+from scrapers.formula1_scraper import Formula1Scraper
+from scrapers.fetcher import close_http_client
+from scrapers.offload import shutdown_process_pool
+from scrapers.poller import PollingDaemon
+from scrapers.telemetry import get_telemetry
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+async def main():
+    # Browsers and HTTP connections stay warm for the life of the process;
+    # each scraper is polled on its own poll_interval
+    daemon = PollingDaemon([UFCScraper(), PremierLeagueScraper(), Formula1Scraper()])
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, daemon.stop)
+
+    telemetry = get_telemetry()
+    exporter = asyncio.create_task(telemetry.export_periodically())
+    try:
+        get_browser_profiles().prune()
+        logger.info("Scrape daemon started")
+        await daemon.run()
+    except Exception as e:
+        logger.error(f"Error in daemon: {str(e)}")
+    finally:
+        exporter.cancel()
+        await close_http_client()
+        shutdown_process_pool()
+        for stats in daemon.stats.values():
+            logger.info(
+                f"{stats.name}: {stats.polls} polls, {stats.changed} changed, {stats.failures} failed, "
+                f"{stats.missed_deadlines} missed deadlines, {stats.missed_polls} missed polls"
+            )
+        logger.info(f"Browsers recycled: {get_browser_pool().recycled}")
+        for line in telemetry.summary():
+            logger.info(line)
+        telemetry.export()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,9 +1,18 @@
+import argparse
 import asyncio
 import logging
+import os
 from datetime import datetime
 from scrapers.ufc_scraper import UFCScraper
 from scrapers.premier_league_scraper import PremierLeagueScraper
 from scrapers.formula1_scraper import Formula1Scraper
+from scrapers.browser_profiles import get_browser_profiles
+from scrapers.fetch_archive import ARCHIVE_RECORD, ARCHIVE_REPLAY, configure_fetch_archive
+from scrapers.fetcher import close_http_client
+from scrapers.offload import shutdown_process_pool
+from scrapers.cycle import run_cycle
+from scrapers.profiling import ScrapeProfiler
+from scrapers.telemetry import get_telemetry
 
 # Configure logging
 logging.basicConfig(
@@ -12,34 +21,62 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-async def main():
+# Upper bound on a whole scrape cycle, regardless of how slow any one site is
+CYCLE_TIMEOUT = 120
+
+async def main(args):
+    if args.record:
+        configure_fetch_archive(args.record, ARCHIVE_RECORD)
+    elif args.replay:
+        configure_fetch_archive(args.replay, ARCHIVE_REPLAY)
+        
+    # Initialize scrapers; they all lease pages from the shared browser pool
+    ufc_scraper = UFCScraper()
+    premier_league_scraper = PremierLeagueScraper()
+    formula1_scraper = Formula1Scraper()
+    scrapers = [ufc_scraper, premier_league_scraper, formula1_scraper]
+    
     try:
-        # Initialize scrapers
-        ufc_scraper = UFCScraper()
-        premier_league_scraper = PremierLeagueScraper()
-        formula1_scraper = Formula1Scraper()
+        get_browser_profiles().prune()
+        await asyncio.gather(*(scraper.initialize() for scraper in scrapers))
         
         # Create timestamp for filenames
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Run scrapers concurrently
-        ufc_data, premier_league_data, formula1_data = await asyncio.gather(
-            ufc_scraper.scrape(),
-            premier_league_scraper.scrape(),
-            formula1_scraper.scrape()
-        )
-        
-        # Save data to CSV files
-        await asyncio.gather(
-            ufc_scraper.save_to_csv(ufc_data, f"data/ufc_standings_{timestamp}.csv"),
-            premier_league_scraper.save_to_csv(premier_league_data, f"data/premier_league_standings_{timestamp}.csv"),
-            formula1_scraper.save_to_csv(formula1_data, f"data/formula1_standings_{timestamp}.csv")
-        )
+        output = lambda scraper: f"data/{scraper.output_prefix}_{timestamp}.csv"
+        if args.profile:
+            # One source at a time, so samples and allocations belong to a single scraper
+            profiler = ScrapeProfiler(os.path.join(args.profile, timestamp), interval=args.profile_interval)
+            for scraper in scrapers:
+                with profiler.profile(scraper.source_name):
+                    await run_cycle([scraper], CYCLE_TIMEOUT, output=output)
+        else:
+            # Run scrapers concurrently under one cycle deadline, streaming records (including
+            # partial results) to CSV files; sources whose content has not changed write nothing
+            await run_cycle(scrapers, CYCLE_TIMEOUT, output=output)
         
         logger.info("Scraping completed successfully")
         
     except Exception as e:
         logger.error(f"Error in main: {str(e)}")
+    finally:
+        for scraper in scrapers:
+            await scraper.cleanup()
+        await close_http_client()
+        shutdown_process_pool()
+        telemetry = get_telemetry()
+        for line in telemetry.summary():
+            logger.info(line)
+        telemetry.export()
         
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Run one scrape cycle")
+    archive = parser.add_mutually_exclusive_group()
+    archive.add_argument("--record", metavar="ARCHIVE", help="Save every fetched page to a .jsonl.gz archive")
+    archive.add_argument("--replay", metavar="ARCHIVE", help="Serve pages from a recorded archive, offline")
+    parser.add_argument("--profile", nargs="?", const="data/profiles", metavar="DIR",
+                        help="Run the sources one by one under a sampling profiler and tracemalloc, "
+                             "writing folded stacks and allocation sites per scraper (default: data/profiles)")
+    parser.add_argument("--profile-interval", type=float, default=0.005, metavar="SECONDS",
+                        help="Seconds between stack samples with --profile")
+    asyncio.run(main(parser.parse_args())) 
\ No newline at end of file
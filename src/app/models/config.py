@@ -46,4 +46,64 @@ class FeatureFlags(BaseDataModel):
     enable_notifications: bool = Field(default=True, description="Whether notifications are enabled")
     enable_search: bool = Field(default=True, description="Whether search is enabled")
     enable_betting: bool = Field(default=True, description="Whether betting features are enabled")
-    enable_fantasy: bool = Field(default=True, description="Whether fantasy sports features are enabled") 
\ No newline at end of file
+    enable_fantasy: bool = Field(default=True, description="Whether fantasy sports features are enabled")
+
+class BrowserPoolConfig(BaseDataModel):
+    """Model for the shared scraper browser pool."""
+    max_browsers: int = Field(default=4, ge=1, description="Maximum number of headless browsers to launch (the default gives each profiled source its own browser plus one shared browser)")
+    max_contexts: int = Field(default=4, ge=1, description="Maximum concurrent page leases per browser")
+    headless: bool = Field(default=True, description="Whether browsers run headless")
+    lightweight: bool = Field(default=True, description="Launch browsers with images, animations, autoplay and background features disabled")
+    max_navigations: Optional[int] = Field(default=200, ge=1, description="Navigations after which a browser is replaced (None never recycles by count)")
+    max_rss_mb: Optional[int] = Field(default=1536, ge=1, description="Resident memory of all browser processes (MB) above which the most used browser is replaced")
+    rss_check_interval: float = Field(default=30.0, ge=0, description="Minimum seconds between browser memory checks")
+
+class BrowserProfileConfig(BaseDataModel):
+    """Model for the persistent per-source browser profiles."""
+    directory: str = Field(default="data/browser_profiles", description="Directory holding one browser user-data directory per source")
+    max_cache_bytes: int = Field(default=128 * 1024 * 1024, ge=0, description="Size of each profile's HTTP disk cache, passed to the browser")
+    max_profile_bytes: int = Field(default=384 * 1024 * 1024, ge=0, description="Profile size above which its caches are cleared before launch (cookies are kept)")
+    max_idle_days: Optional[float] = Field(default=30, gt=0, description="Days after which an unused profile is deleted")
+
+class HTTPCacheConfig(BaseDataModel):
+    """Model for the on-disk scraper page cache."""
+    directory: str = Field(default="data/cache/http", description="Directory holding cached pages")
+    max_bytes: int = Field(default=256 * 1024 * 1024, ge=0, description="Size above which least recently used entries are evicted")
+    default_ttl: int = Field(default=0, ge=0, description="Seconds a cached page is served without revalidation; 0 revalidates every fetch with a conditional GET")
+
+    @classmethod
+    def from_environment(cls, environment: EnvironmentConfig, **overrides) -> "HTTPCacheConfig":
+        """Build a cache configuration whose TTL is the environment's ``cache_ttl``"""
+        return cls(default_ttl=environment.cache_ttl, **overrides)
+
+class SchedulerConfig(BaseDataModel):
+    """Model for the scraper request scheduler."""
+    max_concurrency: int = Field(default=8, ge=1, description="Maximum requests in flight across all hosts")
+    max_per_host: int = Field(default=2, ge=1, description="Maximum requests in flight to a single host")
+    default_rate: float = Field(default=1.0, gt=0, description="Default requests per second allowed per host")
+    default_burst: int = Field(default=2, ge=1, description="Default token bucket capacity per host")
+    host_rates: Dict[str, float] = Field(default_factory=dict, description="Per-host overrides of requests per second")
+
+class ProcessPoolConfig(BaseDataModel):
+    """Model for the process pool used to offload parsing and validation."""
+    max_workers: Optional[int] = Field(default=None, ge=1, description="Worker processes (defaults to the number of CPUs)")
+    chunk_size: int = Field(default=200, ge=1, description="Rows validated per task sent to a worker")
+
+class WorkQueueConfig(BaseDataModel):
+    """Model for the distributed scrape work queue."""
+    backend: str = Field(default="sqlite", description="Queue backend (sqlite for a single host, redis for several)")
+    sqlite_path: str = Field(default="data/state/work_queue.db", description="SQLite database shared by coordinator and workers on one host (local disk, not a network share)")
+    redis_url: Optional[SecretStr] = Field(None, description="Redis connection URL (see EnvironmentConfig.redis_url)")
+    queue_name: str = Field(default="scrape", description="Name of the queue (Redis key prefix)")
+    visibility_timeout: int = Field(default=300, ge=1, description="Seconds a leased job stays hidden from other workers")
+    max_attempts: int = Field(default=3, ge=1, description="Leases allowed before a job is marked dead")
+    retry_delay: int = Field(default=30, ge=0, description="Seconds before a failed job becomes visible again")
+    poll_interval: float = Field(default=1.0, gt=0, description="Seconds an idle worker waits before polling again")
+
+class TelemetryConfig(BaseDataModel):
+    """Model for scrape stage latency histograms and trace spans."""
+    enabled: bool = Field(default=True, description="Whether stage timings and spans are recorded")
+    directory: str = Field(default="data/telemetry", description="Directory receiving traces.jsonl and metrics.jsonl")
+    max_spans: int = Field(default=10000, ge=0, description="Finished spans kept for export; the oldest are dropped beyond this")
+    precision_bits: int = Field(default=7, ge=2, le=12, description="Histogram sub-bucket bits (relative error 2^-(bits-1))")
+    export_interval: float = Field(default=300.0, gt=0, description="Seconds between exports in long-running processes (daemon, worker)")
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field, validator
 from .base import BaseDataModel
@@ -36,4 +37,46 @@ class Formula1Driver(BaseDataModel):
         reserved_numbers = {17, 19}  # Retired numbers
         if v in reserved_numbers:
             raise ValueError(f'Car number {v} is retired or reserved')
-        return v 
\ No newline at end of file
+        return v
+
+class Formula1SeasonStanding(BaseDataModel):
+    """Model for a driver's final standing in a historical Formula 1 season."""
+    
+    season: int = Field(..., ge=1950, description="Championship year")
+    position: int = Field(..., ge=1, description="Final championship position")
+    name: str = Field(..., min_length=1, description="Driver's full name")
+    nationality: Optional[str] = Field(None, description="Driver's nationality")
+    team: Optional[str] = Field(None, description="Team (constructor) the driver scored for")
+    points: float = Field(..., ge=0, description="Championship points (fractional for shared drives)")
+    source_url: Optional[str] = Field(None, description="Page the standing was scraped from")
+
+class Formula1RaceResult(BaseDataModel):
+    """Model for one driver's result in a Formula 1 race."""
+    
+    season: int = Field(..., ge=1950, description="Championship year")
+    race: str = Field(..., min_length=1, description="Grand Prix name")
+    position: Optional[int] = Field(None, ge=1, description="Finishing position (None if not classified)")
+    name: str = Field(..., min_length=1, description="Driver's full name")
+    car_number: Optional[int] = Field(None, ge=0, description="Car number")
+    team: Optional[str] = Field(None, description="Team (constructor) name")
+    laps: Optional[int] = Field(None, ge=0, description="Laps completed")
+    time_or_status: Optional[str] = Field(None, description="Race time, gap to the winner or retirement reason")
+    points: float = Field(default=0, ge=0, description="Points scored")
+    source_url: Optional[str] = Field(None, description="Page the result was scraped from")
+
+class Formula1Race(BaseDataModel):
+    """Model for a race listed in a Formula 1 season's results archive."""
+    
+    season: int = Field(..., ge=1950, description="Championship year")
+    race: str = Field(..., min_length=1, description="Grand Prix name")
+    url: str = Field(..., description="URL of the race's results page")
+
+class Formula1CalendarRace(BaseDataModel):
+    """Model for a Grand Prix on the current Formula 1 calendar."""
+    
+    round: int = Field(..., ge=1, description="Round of the championship")
+    race: str = Field(..., min_length=1, description="Grand Prix name")
+    circuit: Optional[str] = Field(None, description="Circuit or city hosting the race")
+    race_date: datetime = Field(..., description="Start of the race (UTC)")
+    status: str = Field(default="scheduled", description="Race status (scheduled, live, finished, etc.)")
+    source_url: Optional[str] = Field(None, description="Page the race was scraped from")
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field, validator
 from .base import BaseDataModel
@@ -42,4 +43,14 @@ class PremierLeagueTeam(BaseDataModel):
             expected_points = (values['won'] * 3) + values['drawn']
             if v != expected_points:
                 raise ValueError(f'Points must be {expected_points} (3 * won + drawn)')
-        return v 
\ No newline at end of file
+        return v
+
+class PremierLeagueFixture(BaseDataModel):
+    """Model for a scheduled or played Premier League match."""
+    
+    home_team: str = Field(..., min_length=1, description="Home team's name")
+    away_team: str = Field(..., min_length=1, description="Away team's name")
+    kickoff: datetime = Field(..., description="Kick-off time (UTC)")
+    venue: Optional[str] = Field(None, description="Stadium the match is played at")
+    status: str = Field(default="scheduled", description="Match status (scheduled, live, finished, etc.)")
+    source_url: Optional[str] = Field(None, description="Page the fixture was scraped from")
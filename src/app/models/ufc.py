@@ -14,6 +14,7 @@ class UFCFighter(BaseDataModel):
     height: Optional[str] = Field(None, description="Fighter's height")
     reach: Optional[str] = Field(None, description="Fighter's reach")
     last_fight: Optional[str] = Field(None, description="Date of last fight")
+    profile_url: Optional[str] = Field(None, description="URL of the fighter's profile page")
     
     @validator('record')
     def validate_record(cls, v):
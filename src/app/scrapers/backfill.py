@@ -0,0 +1,171 @@
+import asyncio
+import json
+import os
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import logging
+from .base_scraper import BaseScraper, STATUS_CHANGED
+from .formula1_history_scraper import (
+    Formula1RaceIndexScraper, Formula1RaceResultScraper, Formula1SeasonScraper, season_url
+)
+
+logger = logging.getLogger(__name__)
+
+FIRST_SEASON = 1950
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+class BackfillCheckpoint:
+    """Append-only record of the pages a backfill has finished.
+
+    Each line is a JSON object with the page ``key`` and optional ``data``
+    (e.g. the race list of a season). Lines are flushed and fsynced as they
+    are written, so after a crash everything recorded is known to be done and
+    a torn final line is ignored.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._done: Optional[Dict[str, Any]] = None
+
+    def _load(self) -> Dict[str, Any]:
+        if self._done is None:
+            self._done = {}
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue
+                        self._done[entry["key"]] = entry.get("data")
+            except OSError:
+                pass
+        return self._done
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._load()
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def get(self, key: str) -> Any:
+        """Data recorded with a finished page"""
+        return self._load().get(key)
+
+    def mark_done(self, key: str, data: Any = None) -> None:
+        """Record ``key`` as finished"""
+        done = self._load()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"key": key, "data": data}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        done[key] = data
+
+class Formula1Backfill:
+    """Loads Formula 1 history: season standings and every race's results.
+
+    Seasons and races are fetched concurrently, at most ``concurrency`` pages
+    at a time (on top of the shared scheduler's per-host rate limit). Each
+    page is streamed to ``<output_dir>/<season>/<page>.csv`` and recorded in
+    the checkpoint, so a restarted backfill skips everything already done.
+    Pages of seasons still in progress (the current year or later) keep
+    changing, so they are fetched on every run and never checkpointed.
+    """
+
+    def __init__(self, start_season: int = FIRST_SEASON, end_season: Optional[int] = None,
+                 concurrency: int = 8, output_dir: str = "data/formula1_history",
+                 checkpoint_path: str = "data/state/formula1_backfill.jsonl"):
+        self.start_season = start_season
+        self.current_season = datetime.now().year
+        self.end_season = end_season or self.current_season
+        self.output_dir = output_dir
+        self.checkpoint = BackfillCheckpoint(checkpoint_path)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.fetched = 0
+        self.skipped = 0
+        self.failed: List[str] = []
+
+    def in_progress(self, season: int) -> bool:
+        """Whether ``season`` may still change (its pages are not checkpointed)"""
+        return season >= self.current_season
+
+    async def _run_page(self, scraper: BaseScraper, url: str, params: Dict[str, Any], filename: str,
+                        final: bool = True) -> bool:
+        if final and url in self.checkpoint:
+            self.skipped += 1
+            return True
+        scraper.apply_job(url, params)
+        async with self._semaphore:
+            count = await scraper.stream_to_csv(os.path.join(self.output_dir, filename))
+        if not count or scraper.last_status != STATUS_CHANGED:
+            logger.warning(f"Backfill of {url} did not complete ({scraper.last_status})")
+            self.failed.append(url)
+            return False
+        if final:
+            self.checkpoint.mark_done(url, {"records": count})
+        self.fetched += 1
+        return True
+
+    async def _race_list(self, season: int) -> Optional[List[Dict[str, str]]]:
+        url = season_url(season, "races")
+        final = not self.in_progress(season)
+        races = self.checkpoint.get(url) if final else None
+        if races is not None:
+            self.skipped += 1
+            return races
+        scraper = Formula1RaceIndexScraper()
+        scraper.apply_job(url, {"season": season})
+        try:
+            async with self._semaphore:
+                races = [
+                    {"race": record["race"], "url": record["url"]}
+                    async for record in scraper.iter_records()
+                ]
+        except Exception as e:
+            logger.error(f"Failed to list races for {season}: {str(e)}")
+            races = []
+        if not races:
+            logger.warning(f"No races found for {season}")
+            self.failed.append(url)
+            return None
+        if final:
+            self.checkpoint.mark_done(url, races)
+        self.fetched += 1
+        return races
+
+    async def backfill_season(self, season: int) -> None:
+        """Backfill one season's standings and race results"""
+        final = not self.in_progress(season)
+        _, races = await asyncio.gather(
+            self._run_page(Formula1SeasonScraper(), season_url(season), {"season": season},
+                           f"{season}/drivers.csv", final),
+            self._race_list(season)
+        )
+        await asyncio.gather(*(
+            self._run_page(
+                Formula1RaceResultScraper(),
+                race["url"],
+                {"season": season, "race": race["race"]},
+                f"{season}/{number:02d}_{_slug(race['race'])}.csv",
+                final
+            )
+            for number, race in enumerate(races or [], start=1)
+        ))
+
+    async def run(self) -> bool:
+        """Backfill every season in range
+
+        Returns:
+            bool: True if every page was loaded (now or by an earlier run)
+        """
+        seasons = range(self.start_season, self.end_season + 1)
+        await asyncio.gather(*(self.backfill_season(season) for season in seasons))
+        logger.info(
+            f"Backfill of {self.start_season}-{self.end_season}: {self.fetched} pages fetched, "
+            f"{self.skipped} already done, {len(self.failed)} failed"
+        )
+        return not self.failed
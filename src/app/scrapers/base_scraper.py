@@ -1,27 +1,546 @@
-from crawl4ai import AsyncWebCrawler
 import asyncio
-from typing import Dict, List, Any, Optional
+from collections import deque
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 import logging
 import os
+import time
 from pathlib import Path
+from .browser_pool import BrowserPool, get_browser_pool
+from .extraction import (
+    ExtractedPage, ExtractionSchema, extract_from_page, extract_from_html, extract_snapshot, fingerprint_rows
+)
+from .fetch_archive import archiving, replaying
+from .fetcher import PageSnapshot, fetch_browser, fetch_http
+from .http_cache import CacheEntry, HTTPCache, get_http_cache
+from .fingerprints import FingerprintStore, get_fingerprint_store
+from .offload import OFFLOAD_PROCESS, OFFLOAD_THREAD, get_process_pool, get_process_pool_config, validate_rows, worker_count
+from .pipeline import CSVSink, batched, buffered
+from .polling_policy import AdaptivePollingPolicy
+from .resource_blocking import ResourceBlockRules, run_config
+from .scheduler import PRIORITY_NORMAL, RequestScheduler, get_scheduler
+from .telemetry import Telemetry, get_telemetry
+from src.app.services.resilience import (
+    CircuitBreaker, CircuitOpenError, RetryPolicy, call_with_retry, get_circuit_breaker, get_retry_budget
+)
+from src.app.services.deadline import DeadlineExceeded, child_deadline, current_deadline, within_deadline
+from src.app.models.base import Event
+
+EXTRACTION_PAGE = "page"
+EXTRACTION_HTML = "html"
+
+FETCH_BROWSER = "browser"
+FETCH_HTTP_FIRST = "http_first"
+
+STATUS_CHANGED = "changed"
+STATUS_UNCHANGED = "unchanged"
+STATUS_FAILED = "failed"
+STATUS_PARTIAL = "partial"
+STATUS_TIMED_OUT = "timed_out"
 
 class BaseScraper:
-    def __init__(self, base_url: str):
+    # Table layout for schema-driven scrapers; subclasses without a schema override scrape()
+    schema: Optional[ExtractionSchema] = None
+    # "html" parses the captured snapshot off the event loop and frees the browser
+    # right after navigation; "page" runs the schema inside the live page
+    extraction_mode: str = EXTRACTION_HTML
+    # "http_first" tries a pooled plain GET and only renders in the browser when
+    # the static HTML lacks the schema's rows or their required values; "browser" always renders
+    fetch_strategy: str = FETCH_BROWSER
+    # Pages are cached on disk by URL and revalidated with conditional GETs;
+    # within cache_ttl seconds (the cache's default_ttl when None, capped by
+    # cache_freshness()) cached rows are reused without any request
+    use_http_cache: bool = True
+    cache_ttl: Optional[int] = None
+    # Skip extraction, validation and writes when the fingerprint of
+    # region_selector (the schema's rows when None) matches the previous run.
+    # While fetches are recorded or replayed (see fetch_archive) neither the
+    # page cache nor change detection is used, so every page is fetched,
+    # archived and processed
+    detect_changes: bool = True
+    region_selector: Optional[str] = None
+    # Browser requests aborted by resource type or domain (images, fonts, media,
+    # ads, analytics and video players by default); None loads everything
+    block_resources: Optional[ResourceBlockRules] = ResourceBlockRules()
+    # Render pages in a browser on this source's persistent profile, keeping
+    # its disk cache, TLS sessions and cookie-consent state between runs
+    persistent_profile: bool = False
+    # Admission priority in the shared request scheduler (lower goes first)
+    priority: int = PRIORITY_NORMAL
+    # Failed loads are retried with jittered backoff within the shared retry
+    # budget; repeated failures open this source's circuit breaker
+    retry_policy: RetryPolicy = RetryPolicy(max_retries=2, base_delay=1.0)
+    # Seconds each load attempt may take; always capped by the current deadline
+    request_timeout: Optional[float] = 30.0
+    # Resident daemon: seconds between polls, randomised by +/- poll_jitter
+    # (a fraction of the interval) so sources do not fire in lockstep, and the
+    # deadline for each poll (the interval itself when None)
+    poll_interval: float = 300.0
+    poll_jitter: float = 0.1
+    poll_timeout: Optional[float] = 120.0
+    # Paces polling by the state of get_events() instead (live, upcoming or
+    # idle); poll_interval still applies while no events are known
+    polling_policy: Optional[AdaptivePollingPolicy] = None
+    # Where CPU-bound HTML parsing and row validation run: "thread" keeps them
+    # in this process off the event loop, "process" ships the HTML and raw rows
+    # to the shared process pool so large pages use every core
+    offload: str = OFFLOAD_THREAD
+    # Items buffered between pipeline stages, and records per CSV write
+    pipeline_buffer: int = 100
+    sink_batch_size: int = 100
+    # Output files are written as data/<output_prefix>_<timestamp>.csv
+    output_prefix: str = "records"
+    
+    def __init__(self, base_url: str, pool: Optional[BrowserPool] = None):
         self.base_url = base_url
-        self.crawler = AsyncWebCrawler()
+        self._pool = pool
+        self.last_status: Optional[str] = None
+        # Fingerprint of the last changed page, stored once its records are saved
+        self._pending_fingerprint: Optional[Tuple[str, str]] = None
+        # Events for this source (e.g. from a fixtures feed), read by get_events()
+        self.events: List[Event] = []
+        # Set by apply_job() when running a queued job for a specific URL
+        self.job_url: Optional[str] = None
+        self.job_params: Dict[str, Any] = {}
         self.logger = logging.getLogger(__name__)
         
+    @property
+    def pool(self) -> BrowserPool:
+        """Browser pool this scraper leases pages from (the shared pool by default)"""
+        return self._pool or get_browser_pool()
+        
+    @property
+    def browser_profile(self) -> Optional[str]:
+        """Name of the persistent browser profile this scraper renders pages in, if any"""
+        return self.source_name if self.persistent_profile else None
+        
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """Scheduler enforcing per-host rate limits and the global request cap"""
+        return get_scheduler()
+        
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Circuit breaker guarding this source"""
+        return get_circuit_breaker(self.source_name)
+        
+    @property
+    def telemetry(self) -> Telemetry:
+        """Recorder of this scraper's stage latencies and trace spans"""
+        return get_telemetry()
+        
+    @property
+    def fingerprints(self) -> FingerprintStore:
+        """Store of the content fingerprints recorded by previous runs"""
+        return get_fingerprint_store()
+        
+    def commit_fingerprint(self) -> None:
+        """Record the fingerprint of the last changed page once its records are stored
+        
+        Called by ``stream_to_csv`` and ``save_to_csv`` after the output file is
+        committed; callers keeping ``scrape()`` results elsewhere call it once
+        those are safe. Until then the next run sees the page as changed.
+        """
+        if self._pending_fingerprint is not None:
+            self.fingerprints.set(*self._pending_fingerprint)
+            self._pending_fingerprint = None
+        
     async def initialize(self) -> None:
         """Initialize resources needed for scraping"""
-        await self.crawler.__aenter__()
+        if replaying():
+            # Replayed pages are served from the fetch archive without a browser
+            return
+        await self.pool.acquire(self.browser_profile)
         
     async def cleanup(self) -> None:
         """Clean up resources after scraping"""
-        await self.crawler.__aexit__(None, None, None)
+        await self.pool.release()
+        
+    def current_poll_interval(self) -> float:
+        """Un-jittered seconds between polls of this source right now
+        
+        Scrapers with a ``polling_policy`` are paced by the state of the events
+        returned by ``get_events()``; others (and those with no known events)
+        use their fixed ``poll_interval``.
+        """
+        if self.polling_policy is not None:
+            interval = self.polling_policy.interval(self.get_events())
+            if interval is not None:
+                return interval
+        return self.poll_interval
+        
+    def cache_freshness(self) -> float:
+        """Seconds a cached page may be served without any request
+        
+        ``cache_ttl`` (the cache's ``default_ttl`` when None), capped at half the
+        current poll interval so that a poll never reuses the page fetched by
+        the previous one, even with jitter.
+        """
+        cache = self.http_cache
+        ttl = self.cache_ttl if self.cache_ttl is not None else (cache.default_ttl if cache else 0)
+        return min(ttl, self.current_poll_interval() / 2)
+        
+    def get_source_url(self) -> str:
+        """Get the URL of the page holding the table described by ``schema``"""
+        raise NotImplementedError("Subclasses must implement get_source_url()")
+        
+    def apply_job(self, url: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Point the scraper at a queued job's URL and parameters instead of ``get_source_url()``"""
+        self.job_url = url
+        self.job_params = params or {}
+        
+    def get_events(self) -> List[Event]:
+        """Get the known events (fixtures, races, cards) that drive adaptive polling
+        
+        Returns:
+            List[Event]: Recent and upcoming events; empty when none are known
+        """
+        return self.events
+        
+    def build_record(self, data: Dict[str, Any], source_url: str) -> Any:
+        """Build the validated Pydantic model for one converted row
+        
+        Args:
+            data: Row values after schema conversion
+            source_url: URL the row was scraped from
+        """
+        raise NotImplementedError("Subclasses must implement build_record()")
+        
+    async def extract_rows(self, page) -> List[Dict[str, Optional[str]]]:
+        """Extract every row described by ``schema`` from a page in one round trip"""
+        return await extract_from_page(page, self.schema)
+        
+    async def parse_rows(self, html: str) -> List[Dict[str, Optional[str]]]:
+        """Extract every row described by ``schema`` from an HTML snapshot in a worker thread"""
+        return await asyncio.to_thread(extract_from_html, html, self.schema)
+        
+    async def parse_snapshot(self, html: str, previous_fingerprint: Optional[str] = None) -> ExtractedPage:
+        """Fingerprint and extract an HTML snapshot off the event loop, skipping extraction if unchanged"""
+        with self.telemetry.span("extract", self.source_name, offload=self.offload, bytes=len(html)):
+            if self.offload == OFFLOAD_PROCESS:
+                return await asyncio.get_running_loop().run_in_executor(
+                    get_process_pool(), extract_snapshot, html, self.schema, self.region_selector, previous_fingerprint
+                )
+            return await asyncio.to_thread(
+                extract_snapshot, html, self.schema, self.region_selector, previous_fingerprint
+            )
+        
+    @property
+    def http_cache(self) -> Optional[HTTPCache]:
+        """Page cache used by this scraper, or None when caching is disabled or fetches are archived"""
+        return get_http_cache() if self.use_http_cache and not archiving() else None
+        
+    @property
+    def change_detection(self) -> bool:
+        """Whether unchanged pages are skipped (never while fetches are archived)"""
+        return self.detect_changes and not archiving()
         
+    @property
+    def source_name(self) -> str:
+        """Identifies this source in the page cache, fingerprint store and circuit breakers"""
+        return type(self).__name__
+        
+    def _cache_page(self, snapshot: PageSnapshot, page: ExtractedPage, cached: Optional[CacheEntry]) -> None:
+        cache = self.http_cache
+        if cache is None:
+            return
+        rows = page.rows
+        if rows is None and cached is not None and cached.fingerprint == page.fingerprint:
+            rows = cached.rows
+        headers = {key.lower(): value for key, value in (snapshot.headers or {}).items()}
+        cache.put(CacheEntry(
+            url=snapshot.url,
+            body=snapshot.html,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+            rows=rows,
+            fingerprint=page.fingerprint,
+            namespace=self.source_name,
+        ))
+        
+    @staticmethod
+    def _compare(fingerprint: str, rows: List[Dict[str, Optional[str]]],
+                 previous_fingerprint: Optional[str]) -> ExtractedPage:
+        if fingerprint == previous_fingerprint:
+            return ExtractedPage(fingerprint)
+        return ExtractedPage(fingerprint, rows)
+        
+    async def fetch(self, url: str) -> Optional[PageSnapshot]:
+        """Capture a page's HTML in the browser"""
+        async with self.scheduler.slot(url, self.priority):
+            with self.telemetry.span("render", self.source_name, url=url):
+                return await fetch_browser(self.pool, url, run_config(self.block_resources), self.browser_profile)
+        
+    async def fetch_rows(self, url: str, previous_fingerprint: Optional[str] = None) -> Optional[ExtractedPage]:
+        """Fetch a page using the scraper's fetch strategy and extract its raw rows
+        
+        Args:
+            url: Page to scrape
+            previous_fingerprint: Fingerprint of the last processed version of the page
+            
+        Returns:
+            Optional[ExtractedPage]: The page fingerprint and raw rows (None rows when the
+            fingerprint is unchanged), or None if the page failed to load
+        """
+        cache = self.http_cache
+        cached = cache.get(url, self.source_name) if cache is not None else None
+        fresh_for = self.cache_freshness()
+        if cached is not None and cached.rows is not None and cached.fingerprint and cached.is_fresh(fresh_for):
+            self.logger.debug(f"Serving {url} from cache")
+            return self._compare(cached.fingerprint, cached.rows, previous_fingerprint)
+            
+        # Archived runs render through fetch() so the page is recorded and replayed
+        if self.extraction_mode == EXTRACTION_PAGE and not archiving():
+            async with self.scheduler.slot(url, self.priority), self.pool.lease(self.browser_profile) as crawler:
+                with self.telemetry.span("render", self.source_name, url=url):
+                    result = await crawler.arun(url, config=run_config(self.block_resources))
+                if not result.success:
+                    return None
+                with self.telemetry.span("extract", self.source_name, offload=EXTRACTION_PAGE):
+                    rows = await self.extract_rows(result.page)
+            return self._compare(fingerprint_rows(rows), rows, previous_fingerprint)
+            
+        if self.fetch_strategy == FETCH_HTTP_FIRST:
+            async with self.scheduler.slot(url, self.priority):
+                with self.telemetry.span("fetch", self.source_name, url=url):
+                    snapshot = await fetch_http(url, cached)
+            if snapshot is not None:
+                if snapshot.not_modified and cached.rows is not None and cached.fingerprint:
+                    # Unchanged since the last fetch: reuse the rows without parsing
+                    self.logger.debug(f"{url} not modified, skipping parse")
+                    cached.stored_at = time.time()
+                    cache.put(cached)
+                    return self._compare(cached.fingerprint, cached.rows, previous_fingerprint)
+                page = await self.parse_snapshot(snapshot.html, previous_fingerprint)
+                if page.unchanged or (page.rows and self.has_required_values(page.rows)):
+                    self._cache_page(snapshot, page, cached)
+                    return page
+                self.logger.info(f"Static HTML for {url} is missing required rows or values, falling back to browser")
+                
+        snapshot = await self.fetch(url)
+        if snapshot is None:
+            return None
+        page = await self.parse_snapshot(snapshot.html, previous_fingerprint)
+        if page.unchanged or page.rows:
+            self._cache_page(snapshot, page, cached)
+        return page
+        
+    async def load_page(self, source_url: str, previous_fingerprint: Optional[str]) -> Optional[ExtractedPage]:
+        """Load a page with retries under the current deadline, setting ``last_status`` on failure
+        
+        Returns:
+            Optional[ExtractedPage]: The extracted page, or None if it could not be loaded
+        """
+        try:
+            with self.telemetry.span("load", self.source_name, url=source_url):
+                page = await call_with_retry(
+                    lambda: within_deadline(
+                        self.fetch_rows(source_url, previous_fingerprint),
+                        child_deadline(self.request_timeout)
+                    ),
+                    self.retry_policy,
+                    budget=get_retry_budget(),
+                    breaker=self.circuit_breaker,
+                    description=f"Loading {source_url}",
+                )
+        except CircuitOpenError as e:
+            self.logger.warning(f"Skipping {source_url}: {str(e)}")
+            return None
+        except DeadlineExceeded:
+            self.logger.warning(f"Loading {source_url} missed its deadline")
+            self.last_status = STATUS_TIMED_OUT
+            return None
+        if page is None:
+            self.logger.error(f"Failed to load {source_url}")
+        return page
+        
+    def has_required_values(self, rows: List[Dict[str, Optional[str]]]) -> bool:
+        """Whether every required field the schema extracts has a value in at least one row
+        
+        A server-rendered table skeleton whose cells are filled in by
+        JavaScript yields rows with the required cells all empty.
+        """
+        required = [name for name in self.get_required_fields() if name in self.schema.fields]
+        return all(
+            any(row.get(name) is not None and str(row.get(name)).strip() for row in rows)
+            for name in required
+        )
+        
+    def validate_record(self, data: Dict[str, Any], source_url: str) -> Optional[Dict[str, Any]]:
+        """Validate converted row data and build its record
+        
+        Returns:
+            Optional[Dict[str, Any]]: The record, or None if required fields are missing
+        """
+        if not self.validate_data(data):
+            self.logger.warning(f"Skipping row due to missing required fields: {data}")
+            return None
+        return self.build_record(data, source_url).dict()
+        
+    def process_row(self, row: Dict[str, Optional[str]], source_url: str) -> Optional[Dict[str, Any]]:
+        """Convert a raw row and build its validated record (None if the row is skipped)"""
+        return self.validate_record(self.schema.convert(row), source_url)
+        
+    async def _convert_rows(self, rows: List[Dict[str, Optional[str]]], span: Any) -> AsyncIterator[Dict[str, Any]]:
+        for row in rows:
+            started = time.perf_counter_ns()
+            data = self.schema.convert(row)
+            span.add_busy(time.perf_counter_ns() - started)
+            yield data
+            
+    async def _validate_inline(self, rows: List[Dict[str, Optional[str]]], source_url: str) -> AsyncIterator[Dict[str, Any]]:
+        # Validation interleaves with the stages consuming its records, so the
+        # span records the time spent converting and validating, not its duration
+        with self.telemetry.span("validate", self.source_name, activate=False, rows=len(rows)) as span:
+            span.add_busy(0)
+            async for data in buffered(self._convert_rows(rows, span), self.pipeline_buffer):
+                started = time.perf_counter_ns()
+                try:
+                    record = self.validate_record(data, source_url)
+                except Exception as e:
+                    self.logger.error(f"Error processing row data: {str(e)}")
+                    continue
+                finally:
+                    span.add_busy(time.perf_counter_ns() - started)
+                if record is not None:
+                    yield record
+            
+    async def _validate_offloaded(self, rows: List[Dict[str, Optional[str]]], source_url: str) -> AsyncIterator[Dict[str, Any]]:
+        # Keep one chunk per worker in flight and yield results in row order
+        loop = asyncio.get_running_loop()
+        pool = get_process_pool()
+        size = get_process_pool_config().chunk_size
+        pending = deque()
+        # Chunks run in parallel in the workers, so the span covers the whole stream
+        span = self.telemetry.start_span("validate", self.source_name, offload=OFFLOAD_PROCESS, rows=len(rows))
+        try:
+            for start in range(0, len(rows), size):
+                pending.append(loop.run_in_executor(
+                    pool, validate_rows, type(self), rows[start:start + size], source_url, self.job_params
+                ))
+                if len(pending) >= worker_count():
+                    for record in await pending.popleft():
+                        yield record
+            while pending:
+                for record in await pending.popleft():
+                    yield record
+        finally:
+            for future in pending:
+                future.cancel()
+            self.telemetry.finish(span)
+                
+    async def iter_records(self) -> AsyncIterator[Dict[str, Any]]:
+        """Stream validated records for the table described by ``schema``
+        
+        Conversion and validation run as separate stages joined by queues of
+        at most ``pipeline_buffer`` items, so a consumer (e.g. ``stream_to_csv``)
+        can write records while later rows are still being processed. With
+        ``offload = "process"`` rows are validated in chunks by the shared
+        process pool instead.
+        
+        When change detection is enabled and the page content matches the
+        previous run, nothing is yielded and ``last_status`` is set to
+        ``STATUS_UNCHANGED``. Work is bounded by the current deadline (see
+        ``deadline_scope``): a load that misses it sets ``STATUS_TIMED_OUT``,
+        and rows not yet validated when it passes are dropped with
+        ``STATUS_PARTIAL``. Once every row has been consumed the page's
+        fingerprint is held until ``commit_fingerprint()`` confirms the records
+        were stored.
+        """
+        if self.schema is None:
+            if type(self).scrape is BaseScraper.scrape:
+                raise NotImplementedError("Subclasses must implement scrape() or define a schema")
+            # Scrapers with their own scrape() are streamed once it returns
+            for record in await self.scrape():
+                yield record
+            return
+            
+        source_url = self.job_url or self.get_source_url()
+        fingerprint_key = f"{self.source_name}:{source_url}"
+        previous_fingerprint = self.fingerprints.get(fingerprint_key) if self.change_detection else None
+        self.last_status = STATUS_FAILED
+        self._pending_fingerprint = None
+        
+        page = await self.load_page(source_url, previous_fingerprint)
+        if page is None:
+            return
+        if page.unchanged:
+            self.logger.info(f"{source_url} unchanged since the last run, skipping")
+            self.last_status = STATUS_UNCHANGED
+            return
+            
+        deadline = current_deadline()
+        partial = False
+        count = 0
+        if self.offload == OFFLOAD_PROCESS:
+            records = self._validate_offloaded(page.rows, source_url)
+        else:
+            records = self._validate_inline(page.rows, source_url)
+        try:
+            async for record in records:
+                if deadline is not None and deadline.expired:
+                    partial = True
+                    break
+                count += 1
+                yield record
+        finally:
+            await records.aclose()
+            
+        if partial:
+            self.logger.warning(
+                f"Deadline passed while processing {source_url}; kept {count} of {len(page.rows)} rows"
+            )
+            self.last_status = STATUS_PARTIAL
+        elif count:
+            self.last_status = STATUS_CHANGED
+            if self.change_detection:
+                self._pending_fingerprint = (fingerprint_key, page.fingerprint)
+                
     async def scrape(self) -> List[Dict[str, Any]]:
-        """Base scrape method to be implemented by child classes"""
-        raise NotImplementedError("Subclasses must implement scrape()")
+        """Scrape the table described by ``schema`` into a list of validated records
+        
+        Collects ``iter_records()``; see there for how ``last_status`` is set.
+        The page's fingerprint is not recorded until ``save_to_csv()`` or
+        ``commit_fingerprint()`` confirms the records were stored.
+        """
+        records = []
+        try:
+            async for record in self.iter_records():
+                records.append(record)
+        except NotImplementedError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error during scraping: {str(e)}")
+        return records
+        
+    async def stream_to_csv(self, filename: str) -> int:
+        """Scrape straight into a CSV file, writing batches while rows are still processed
+        
+        The file is only created when there are records, and it replaces
+        ``filename`` atomically once the scrape finishes.
+        
+        Returns:
+            int: Number of records written
+        """
+        sink = CSVSink(filename)
+        try:
+            # Not made current: the stages producing the records run alongside the writes
+            with self.telemetry.span("write", self.source_name, activate=False, filename=filename) as span:
+                span.add_busy(0)
+                async with sink:
+                    records = buffered(self.iter_records(), self.pipeline_buffer)
+                    async for batch in batched(records, self.sink_batch_size):
+                        started = time.perf_counter_ns()
+                        await sink.write(batch)
+                        span.add_busy(time.perf_counter_ns() - started)
+                span.set("records", sink.count)
+            self.commit_fingerprint()
+        except Exception as e:
+            self.logger.error(f"Failed to stream data to {filename}: {str(e)}")
+            self.last_status = STATUS_FAILED
+            return 0
+        if sink.count:
+            self.logger.info(f"Saved {sink.count} records to {filename}")
+        return sink.count
         
     async def save_to_csv(self, data: List[Dict[str, Any]], filename: str) -> bool:
         """Save scraped data to CSV
@@ -37,21 +556,26 @@ class BaseScraper:
             self.logger.warning("No data to save")
             return False
             
+        sink = CSVSink(filename)
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-            
-            import csv
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=data[0].keys())
-                writer.writeheader()
-                writer.writerows(data)
-                
+            with self.telemetry.span("write", self.source_name, filename=filename, records=len(data)):
+                await within_deadline(self._write_all(sink, data))
+            self.commit_fingerprint()
             self.logger.info(f"Saved {len(data)} records to {filename}")
             return True
+        except DeadlineExceeded:
+            sink.abort()
+            self.logger.error(f"Deadline passed before {filename} was written")
+            return False
         except Exception as e:
+            sink.abort()
             self.logger.error(f"Failed to save data to {filename}: {str(e)}")
             return False
+            
+    @staticmethod
+    async def _write_all(sink: CSVSink, data: List[Dict[str, Any]]) -> None:
+        await sink.write(data)
+        await sink.commit()
         
     def validate_data(self, data: Dict[str, Any]) -> bool:
         """Validate scraped data
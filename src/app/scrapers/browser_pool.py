@@ -0,0 +1,353 @@
+from crawl4ai import AsyncWebCrawler, BrowserConfig
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Set
+import logging
+import psutil
+from src.app.models.config import BrowserPoolConfig
+from .browser_profiles import get_browser_profiles
+from .resource_blocking import block_resources
+
+# Chromium flags of the lightweight profile; JavaScript stays on because
+# client-rendered tables need it
+LIGHTWEIGHT_ARGS = [
+    "--blink-settings=imagesEnabled=false",
+    "--force-prefers-reduced-motion",
+    "--autoplay-policy=user-gesture-required",
+    "--disable-remote-fonts",
+]
+
+def _is_browser_process(process: psutil.Process) -> bool:
+    name = process.name().lower()
+    return "chrom" in name or "headless_shell" in name
+
+def browser_rss_bytes() -> int:
+    """Resident memory of the browser processes started by this process
+
+    Counts every Chromium process (browser, renderers, GPU and utility
+    processes) below this one, but not the Playwright driver or process
+    pool workers.
+    """
+    total = 0
+    for child in psutil.Process(os.getpid()).children(recursive=True):
+        try:
+            if _is_browser_process(child):
+                total += child.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return total
+
+class PooledBrowser:
+    """A launched crawler together with its lease bookkeeping."""
+
+    def __init__(self, crawler: AsyncWebCrawler, profile: Optional[str] = None):
+        self.crawler = crawler
+        # Persistent user-data profile the browser runs on (None for a throwaway one)
+        self.profile = profile
+        self.active_leases = 0
+        self.navigations = 0
+        # Set while a replacement launches, and once it has taken over
+        self.replacing = False
+        self.retiring = False
+        self.closed = False
+
+class BrowserPool:
+    """Process-wide pool of headless browsers shared by all scrapers.
+
+    Browsers are launched lazily up to ``max_browsers``; each one serves at
+    most ``max_contexts`` concurrent leases. Scrapers register with
+    ``acquire()``/``release()`` and the browsers are closed once the last
+    scraper has released the pool.
+
+    Long-running processes recycle browsers so their memory stays bounded: a
+    browser that has served ``max_navigations`` leases, or the most used one
+    when all browser processes together exceed ``max_rss_mb``, is replaced.
+    The replacement launches while the old browser keeps serving; once it is
+    ready new leases go to it and the old browser closes after its last
+    lease, so no lease ever waits on a cold launch (at the cost of briefly
+    running one browser more than ``max_browsers``).
+
+    Leases may ask for a persistent ``profile`` (see ``BrowserProfiles``).
+    Each profile runs in its own browser, because a user-data directory can
+    only be opened by one browser at a time; such browsers count towards
+    ``max_browsers``, and an idle browser of another profile is closed to make
+    room when the pool is full. For the same reason a profile's browser is
+    recycled by closing it after its last lease and relaunching on the warm
+    profile, rather than by a replacement launched alongside it.
+    """
+
+    def __init__(self, config: Optional[BrowserPoolConfig] = None):
+        self.config = config or BrowserPoolConfig()
+        self.logger = logging.getLogger(__name__)
+        self._browsers: List[PooledBrowser] = []
+        self._users = 0
+        self._launching = 0
+        self._launching_profiles: Set[str] = set()
+        self._condition: Optional[asyncio.Condition] = None
+        self._replacements: Set[asyncio.Task] = set()
+        self._retiring: List[PooledBrowser] = []
+        self._last_rss_check = 0.0
+        self.recycled = 0
+
+    @property
+    def size(self) -> int:
+        """Number of browsers currently launched"""
+        return len(self._browsers)
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    def _browser_config(self, user_data_dir: Optional[str] = None) -> BrowserConfig:
+        options = {"headless": self.config.headless, "verbose": False}
+        extra_args = []
+        if self.config.lightweight:
+            options["light_mode"] = True
+            extra_args.extend(LIGHTWEIGHT_ARGS)
+        if user_data_dir is not None:
+            options["use_persistent_context"] = True
+            options["user_data_dir"] = user_data_dir
+            extra_args.extend(get_browser_profiles().browser_args())
+        if extra_args:
+            options["extra_args"] = extra_args
+        return BrowserConfig(**options)
+
+    async def _launch(self, profile: Optional[str] = None) -> PooledBrowser:
+        user_data_dir = None
+        if profile is not None:
+            user_data_dir = await asyncio.to_thread(get_browser_profiles().prepare, profile)
+        crawler = AsyncWebCrawler(config=self._browser_config(user_data_dir))
+        # Pages apply the resource block rules passed with each run (see fetch_browser)
+        strategy = getattr(crawler, "crawler_strategy", None)
+        if strategy is not None:
+            strategy.set_hook("on_page_context_created", block_resources)
+        await crawler.__aenter__()
+        self.logger.info(
+            f"Launched pooled browser {len(self._browsers) + 1}/{self.config.max_browsers}"
+            + (f" on profile {profile}" if profile is not None else "")
+        )
+        return PooledBrowser(crawler, profile)
+
+    async def acquire(self, profile: Optional[str] = None) -> None:
+        """Register a scraper with the pool, launching a browser (on ``profile``) if needed
+
+        A profile's browser is only launched here while the pool has room;
+        otherwise it is launched by the first lease that needs it.
+        """
+        self._users += 1
+        if not self._browsers or (
+            not any(b.profile == profile for b in self._browsers)
+            and len(self._browsers) + self._launching < self.config.max_browsers
+        ):
+            async with self.lease(profile):
+                pass
+
+    async def release(self) -> None:
+        """Unregister a scraper and close all browsers when none remain"""
+        if self._users == 0:
+            return
+        self._users -= 1
+        if self._users == 0:
+            await self.shutdown()
+
+    async def shutdown(self) -> None:
+        """Close every browser in the pool regardless of registered users"""
+        for task in self._replacements:
+            task.cancel()
+        browsers, self._browsers = self._browsers + self._retiring, []
+        self._retiring = []
+        self._users = 0
+        self._condition = None
+        for browser in browsers:
+            await self._close(browser)
+
+    async def _close(self, browser: PooledBrowser) -> None:
+        if browser.closed:
+            return
+        browser.closed = True
+        try:
+            await browser.crawler.__aexit__(None, None, None)
+        except Exception as e:
+            self.logger.error(f"Error closing pooled browser: {str(e)}")
+
+    async def _recycle_candidate(self, browser: PooledBrowser) -> Optional[PooledBrowser]:
+        if self.config.max_navigations is not None and browser.navigations >= self.config.max_navigations:
+            return browser
+        if self.config.max_rss_mb is None or time.monotonic() - self._last_rss_check < self.config.rss_check_interval:
+            return None
+        self._last_rss_check = time.monotonic()
+        try:
+            rss = await asyncio.to_thread(browser_rss_bytes)
+        except Exception as e:
+            self.logger.warning(f"Could not measure browser memory: {str(e)}")
+            return None
+        if rss <= self.config.max_rss_mb * 1024 * 1024:
+            return None
+        candidates = [b for b in self._browsers if not b.replacing]
+        if not candidates:
+            return None
+        self.logger.info(f"Browser memory at {rss // (1024 * 1024)} MB exceeds {self.config.max_rss_mb} MB")
+        # Memory grows with use, so the browser with the most navigations goes first
+        return max(candidates, key=lambda b: b.navigations)
+
+    async def _replace(self, browser: PooledBrowser) -> None:
+        try:
+            replacement = await self._launch()
+        except Exception as e:
+            self.logger.error(f"Failed to launch a replacement browser: {str(e)}")
+            browser.replacing = False
+            return
+        condition = self._get_condition()
+        async with condition:
+            if browser not in self._browsers:
+                # The pool was shut down while the replacement launched
+                retired = False
+            else:
+                self._browsers[self._browsers.index(browser)] = replacement
+                browser.retiring = True
+                self._retiring.append(browser)
+                self.recycled += 1
+                retired = True
+                condition.notify_all()
+        if not retired:
+            await self._close(replacement)
+            return
+        self.logger.info(f"Recycled pooled browser after {browser.navigations} navigations")
+        if browser.active_leases == 0:
+            await self._retire(browser)
+
+    async def _retire(self, browser: PooledBrowser) -> None:
+        await self._close(browser)
+        # Leases waiting to relaunch this browser's profile can go ahead now
+        condition = self._get_condition()
+        async with condition:
+            if browser in self._retiring:
+                self._retiring.remove(browser)
+            condition.notify_all()
+
+    async def _retire_profile_browser(self, browser: PooledBrowser) -> None:
+        condition = self._get_condition()
+        async with condition:
+            if browser not in self._browsers:
+                return
+            self._browsers.remove(browser)
+            browser.retiring = True
+            self._retiring.append(browser)
+            self.recycled += 1
+        self.logger.info(f"Recycling browser on profile {browser.profile} after {browser.navigations} navigations")
+        if browser.active_leases == 0:
+            await self._retire(browser)
+
+    async def _after_lease(self, browser: PooledBrowser) -> None:
+        if browser.retiring:
+            if browser.active_leases == 0:
+                await self._retire(browser)
+            return
+        if browser.closed or browser not in self._browsers:
+            return
+        candidate = await self._recycle_candidate(browser)
+        if candidate is None or candidate.replacing:
+            return
+        candidate.replacing = True
+        if candidate.profile is not None:
+            await self._retire_profile_browser(candidate)
+        else:
+            task = asyncio.create_task(self._replace(candidate))
+            self._replacements.add(task)
+            task.add_done_callback(self._replacements.discard)
+
+    def _pick_browser(self, profile: Optional[str] = None) -> Optional[PooledBrowser]:
+        candidates = [
+            b for b in self._browsers if b.profile == profile and b.active_leases < self.config.max_contexts
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda b: b.active_leases)
+
+    def _idle_browser(self, profile: Optional[str]) -> Optional[PooledBrowser]:
+        # An unused browser of another profile that can be closed to make room
+        for browser in self._browsers:
+            if browser.profile != profile and browser.active_leases == 0 and not browser.replacing:
+                return browser
+        return None
+
+    def _profile_open(self, profile: str) -> bool:
+        return profile in self._launching_profiles or any(
+            b.profile == profile for b in self._browsers + self._retiring
+        )
+
+    @asynccontextmanager
+    async def lease(self, profile: Optional[str] = None) -> AsyncIterator[AsyncWebCrawler]:
+        """Lease a page slot on the least busy browser (running ``profile``, if given)
+
+        Yields:
+            AsyncWebCrawler: The crawler to run the navigation on
+        """
+        condition = self._get_condition()
+        browser = None
+        evicted = None
+        async with condition:
+            while browser is None:
+                browser = self._pick_browser(profile)
+                if browser is not None:
+                    browser.active_leases += 1
+                    break
+                if profile is None or not self._profile_open(profile):
+                    if len(self._browsers) + self._launching < self.config.max_browsers:
+                        break
+                    evicted = self._idle_browser(profile)
+                    if evicted is not None:
+                        self._browsers.remove(evicted)
+                        break
+                await condition.wait()
+            if browser is None:
+                self._launching += 1
+                if profile is not None:
+                    self._launching_profiles.add(profile)
+
+        if browser is None:
+            if evicted is not None:
+                await self._close(evicted)
+            # Launch outside the lock so releases on other browsers are not blocked
+            try:
+                browser = await self._launch(profile)
+            finally:
+                async with condition:
+                    self._launching -= 1
+                    self._launching_profiles.discard(profile)
+                    if browser is not None:
+                        self._browsers.append(browser)
+                        browser.active_leases += 1
+                    condition.notify_all()
+        browser.navigations += 1
+
+        try:
+            yield browser.crawler
+        finally:
+            async with condition:
+                browser.active_leases -= 1
+                condition.notify_all()
+            await self._after_lease(browser)
+
+_shared_pool: Optional[BrowserPool] = None
+
+def get_browser_pool() -> BrowserPool:
+    """Get the process-wide browser pool, creating it with defaults if needed"""
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = BrowserPool()
+    return _shared_pool
+
+def configure_browser_pool(config: BrowserPoolConfig) -> BrowserPool:
+    """Replace the process-wide browser pool with one built from ``config``
+
+    Must be called before any scraper has acquired the pool.
+    """
+    global _shared_pool
+    if _shared_pool is not None and _shared_pool.size:
+        raise RuntimeError("Cannot reconfigure the browser pool while browsers are running")
+    _shared_pool = BrowserPool(config)
+    return _shared_pool
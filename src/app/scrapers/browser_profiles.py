@@ -0,0 +1,132 @@
+import os
+import re
+import shutil
+import time
+from typing import List, Optional
+import logging
+from src.app.models.config import BrowserProfileConfig
+
+# Profile subdirectories that only hold caches; clearing them keeps cookies,
+# local storage and preferences (e.g. accepted cookie banners)
+CACHE_DIRS = (
+    os.path.join("Default", "Cache"),
+    os.path.join("Default", "Code Cache"),
+    os.path.join("Default", "GPUCache"),
+    os.path.join("Default", "Service Worker", "CacheStorage"),
+    os.path.join("Default", "Service Worker", "ScriptCache"),
+    "GrShaderCache",
+    "GraphiteDawnCache",
+    "ShaderCache",
+)
+
+# Touched whenever a profile is launched; its mtime drives idle cleanup
+LAST_USED_MARKER = ".last_used"
+
+def _dir_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
+
+class BrowserProfiles:
+    """Persistent browser user-data directories, one per source.
+
+    A profile keeps the browser's HTTP disk cache, TLS session state, cookies
+    (including cookie-consent choices) and local storage between runs, so
+    repeat loads of a site skip the cold start. Sizes are bounded in two ways:
+    the browser's own disk cache is capped at ``max_cache_bytes``, and a
+    profile that has grown past ``max_profile_bytes`` has its caches cleared
+    before the next launch. Profiles unused for ``max_idle_days`` are deleted
+    by ``prune()``.
+    """
+
+    def __init__(self, config: Optional[BrowserProfileConfig] = None):
+        self.config = config or BrowserProfileConfig()
+        self.directory = self.config.directory
+        self.logger = logging.getLogger(__name__)
+
+    def path(self, name: str) -> str:
+        """User-data directory of profile ``name``"""
+        return os.path.join(self.directory, re.sub(r"[^A-Za-z0-9_.-]+", "_", name))
+
+    def browser_args(self) -> List[str]:
+        """Browser flags applying this policy to a profile"""
+        return [f"--disk-cache-size={self.config.max_cache_bytes}"]
+
+    def size_bytes(self, name: str) -> int:
+        """Bytes used by profile ``name`` on disk"""
+        return _dir_size(self.path(name))
+
+    def clear_caches(self, name: str) -> None:
+        """Delete the cache directories of profile ``name``, keeping cookies and storage"""
+        for cache_dir in CACHE_DIRS:
+            shutil.rmtree(os.path.join(self.path(name), cache_dir), ignore_errors=True)
+
+    def prepare(self, name: str) -> str:
+        """Get profile ``name`` ready for a browser launch
+
+        Creates the directory, clears its caches when it has outgrown
+        ``max_profile_bytes`` and marks it as used.
+
+        Returns:
+            str: The user-data directory to launch the browser with
+        """
+        path = self.path(name)
+        os.makedirs(path, exist_ok=True)
+        size = self.size_bytes(name)
+        if size > self.config.max_profile_bytes:
+            self.logger.info(
+                f"Browser profile {name} uses {size // (1024 * 1024)} MB, clearing its caches"
+            )
+            self.clear_caches(name)
+        with open(os.path.join(path, LAST_USED_MARKER), "w"):
+            pass
+        return path
+
+    def prune(self) -> List[str]:
+        """Delete profiles that have not been launched for ``max_idle_days``
+
+        Returns:
+            List[str]: Names of the deleted profiles
+        """
+        if self.config.max_idle_days is None:
+            return []
+        cutoff = time.time() - self.config.max_idle_days * 86400
+        removed = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        for name in names:
+            path = os.path.join(self.directory, name)
+            if not os.path.isdir(path):
+                continue
+            try:
+                last_used = os.path.getmtime(os.path.join(path, LAST_USED_MARKER))
+            except OSError:
+                last_used = os.path.getmtime(path)
+            if last_used < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+                removed.append(name)
+        if removed:
+            self.logger.info(f"Deleted idle browser profiles: {', '.join(removed)}")
+        return removed
+
+_shared_profiles: Optional[BrowserProfiles] = None
+
+def get_browser_profiles() -> BrowserProfiles:
+    """Get the process-wide browser profiles, creating them with defaults if needed"""
+    global _shared_profiles
+    if _shared_profiles is None:
+        _shared_profiles = BrowserProfiles()
+    return _shared_profiles
+
+def configure_browser_profiles(config: BrowserProfileConfig) -> BrowserProfiles:
+    """Replace the process-wide browser profiles with ones built from ``config``"""
+    global _shared_profiles
+    _shared_profiles = BrowserProfiles(config)
+    return _shared_profiles
@@ -0,0 +1,90 @@
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import logging
+from .base_scraper import BaseScraper, STATUS_CHANGED, STATUS_FAILED, STATUS_TIMED_OUT
+from .telemetry import get_telemetry
+from src.app.services.deadline import Deadline, DeadlineExceeded, deadline_scope, within_deadline
+
+logger = logging.getLogger(__name__)
+
+# Extra time a source gets past the cycle deadline to return its partial results
+DEFAULT_GRACE = 1.0
+
+class SourceResult:
+    """Outcome of one source in a scrape cycle."""
+
+    def __init__(self, scraper: BaseScraper, records: List[Dict[str, Any]], status: str, elapsed: float,
+                 written: int = 0):
+        self.scraper = scraper
+        self.records = records
+        self.status = status
+        self.elapsed = elapsed
+        # Records streamed to the output file (records is empty when streaming)
+        self.written = written
+        
+    @property
+    def count(self) -> int:
+        return self.written or len(self.records)
+
+    @property
+    def name(self) -> str:
+        return type(self.scraper).__name__
+
+async def scrape_source(scraper: BaseScraper, deadline: Optional[Deadline], grace: float = DEFAULT_GRACE,
+                        filename: Optional[str] = None) -> SourceResult:
+    """Run one scraper under ``deadline``
+
+    The scraper sees the deadline through ``current_deadline()`` and normally
+    returns partial results on its own; if it overruns by more than ``grace``
+    seconds it is cancelled and reported as timed out.
+
+    With ``filename`` the records are streamed into that CSV file as they are
+    validated instead of being returned. The run is traced as a "scrape"
+    span with every stage of the scraper nested under it.
+    """
+    start = time.monotonic()
+    hard_deadline = Deadline(deadline.expires_at + grace) if deadline is not None else None
+    written = 0
+    with deadline_scope(deadline), get_telemetry().span("scrape", scraper.source_name) as span:
+        try:
+            if filename is not None:
+                records = []
+                written = await within_deadline(scraper.stream_to_csv(filename), hard_deadline)
+            else:
+                records = await within_deadline(scraper.scrape(), hard_deadline)
+            status = getattr(scraper, "last_status", None) or (STATUS_CHANGED if records or written else STATUS_FAILED)
+        except DeadlineExceeded:
+            records = []
+            status = STATUS_TIMED_OUT
+        except Exception as e:
+            logger.error(f"{type(scraper).__name__} failed: {str(e)}")
+            records = []
+            status = STATUS_FAILED
+        span.set("status", status)
+        span.set("records", written or len(records))
+    return SourceResult(scraper, records, status, time.monotonic() - start, written)
+
+async def run_cycle(scrapers: Sequence[BaseScraper], timeout: Optional[float],
+                    grace: float = DEFAULT_GRACE,
+                    output: Optional[Callable[[BaseScraper], str]] = None) -> List[SourceResult]:
+    """Scrape all sources concurrently within a single cycle deadline
+
+    Cycle latency is bounded by ``timeout`` (plus ``grace``) rather than by
+    the slowest site; sources that miss the deadline are reported, not awaited.
+
+    Args:
+        output: Maps each scraper to the CSV file its records are streamed to;
+            when omitted the records are returned in each ``SourceResult``
+    """
+    deadline = Deadline.after(timeout) if timeout is not None else None
+    results = await asyncio.gather(*(
+        scrape_source(scraper, deadline, grace, output(scraper) if output is not None else None)
+        for scraper in scrapers
+    ))
+    for result in results:
+        if result.status not in (STATUS_CHANGED,):
+            logger.warning(f"{result.name}: {result.status} after {result.elapsed:.1f}s ({result.count} records)")
+        else:
+            logger.info(f"{result.name}: {result.count} records in {result.elapsed:.1f}s")
+    return list(results)
@@ -0,0 +1,131 @@
+import asyncio
+import os
+import socket
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+import logging
+from .base_scraper import STATUS_CHANGED, STATUS_PARTIAL, STATUS_UNCHANGED
+from .browser_pool import get_browser_pool
+from .cycle import SourceResult, scrape_source
+from .registry import SCRAPERS, get_scraper_class
+from .work_queue import Job, WorkQueue
+from src.app.services.deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+# Outcomes that complete a job; anything else is retried
+COMPLETED_STATUSES = (STATUS_CHANGED, STATUS_UNCHANGED, STATUS_PARTIAL)
+
+async def enqueue_sources(queue: WorkQueue, names: Optional[Iterable[str]] = None) -> List[str]:
+    """Enqueue one job per registered scraper (or per name in ``names``)
+
+    Sources that already have a queued or running job are skipped, so the
+    coordinator can run on a timer without piling up duplicate work.
+
+    Returns:
+        List[str]: Ids of the jobs that were added
+    """
+    added = []
+    for name in (names if names is not None else SCRAPERS):
+        scraper = get_scraper_class(name)()
+        job_id = await queue.enqueue(Job(name, scraper.get_source_url()))
+        if job_id is None:
+            logger.info(f"{name} already has a pending job, skipping")
+        else:
+            added.append(job_id)
+    return added
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+class QueueWorker:
+    """Leases scrape jobs from a work queue and runs them.
+
+    Up to ``concurrency`` jobs run at once, sharing this process's browser
+    pool, HTTP client and request scheduler. While a job runs its lease is
+    extended periodically; it is acked when the scrape completes (changed,
+    unchanged or partial) and handed back for a retry otherwise.
+    """
+
+    def __init__(self, queue: WorkQueue, concurrency: int = 2, output_dir: str = "data",
+                 worker_id: Optional[str] = None):
+        self.queue = queue
+        self.concurrency = concurrency
+        self.output_dir = output_dir
+        self.worker_id = worker_id or default_worker_id()
+        self.processed: Dict[str, int] = {"acked": 0, "retried": 0, "lost": 0}
+        self._stop = asyncio.Event()
+        self._running: Set[asyncio.Task] = set()
+
+    def stop(self) -> None:
+        """Stop leasing new jobs; running jobs are finished first"""
+        self._stop.set()
+
+    async def _heartbeat(self, job: Job) -> None:
+        interval = max(1.0, self.queue.config.visibility_timeout / 3)
+        while True:
+            await asyncio.sleep(interval)
+            if not await self.queue.extend(job):
+                logger.warning(f"Lost the lease on {job}")
+                return
+
+    async def run_job(self, job: Job) -> SourceResult:
+        """Run one leased job and ack or retry it"""
+        scraper = get_scraper_class(job.scraper)()
+        scraper.apply_job(job.url, job.params)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"{self.output_dir}/{scraper.output_prefix}_{timestamp}_{job.job_id}.csv"
+        timeout = scraper.poll_timeout if scraper.poll_timeout is not None else scraper.poll_interval
+
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        await scraper.initialize()
+        try:
+            result = await scrape_source(scraper, Deadline.after(timeout), filename=filename)
+        finally:
+            heartbeat.cancel()
+            await scraper.cleanup()
+
+        if result.status in COMPLETED_STATUSES:
+            if await self.queue.ack(job):
+                self.processed["acked"] += 1
+            else:
+                # Another worker took the job over after our lease expired
+                self.processed["lost"] += 1
+                logger.warning(f"{job} finished after its lease was lost")
+        else:
+            self.processed["retried"] += 1
+            await self.queue.nack(job, error=result.status)
+        logger.info(f"{job}: {result.status}, {result.count} records in {result.elapsed:.1f}s")
+        return result
+
+    async def _run_safely(self, job: Job) -> None:
+        try:
+            await self.run_job(job)
+        except Exception as e:
+            logger.error(f"{job} failed: {str(e)}")
+            await self.queue.nack(job, error=str(e))
+
+    async def run(self) -> None:
+        """Lease and run jobs until ``stop()`` is called"""
+        pool = get_browser_pool()
+        # Hold a reference so the browser stays up between jobs
+        await pool.acquire()
+        try:
+            while not self._stop.is_set():
+                if len(self._running) >= self.concurrency:
+                    await asyncio.wait(self._running, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+                job = await self.queue.lease(self.worker_id)
+                if job is None:
+                    try:
+                        await asyncio.wait_for(self._stop.wait(), timeout=self.queue.config.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                task = asyncio.create_task(self._run_safely(job))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+            if self._running:
+                await asyncio.wait(self._running)
+        finally:
+            await pool.release()
@@ -0,0 +1,264 @@
+from datetime import datetime, timezone
+from functools import lru_cache
+import hashlib
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional
+import lxml.html
+from lxml.cssselect import CSSSelector
+
+def safe_str(text: Optional[str]) -> str:
+    """Strip surrounding whitespace, mapping missing values to an empty string"""
+    return text.strip() if text else ""
+
+def safe_int(text: Optional[str]) -> int:
+    """Convert text to int, falling back to 0 for missing or malformed values"""
+    try:
+        return int(text) if text else 0
+    except ValueError:
+        return 0
+
+def optional_int(text: Optional[str]) -> Optional[int]:
+    """Convert text to int, or None for missing or non-numeric values (e.g. "NC", "DQ")"""
+    try:
+        return int(text) if text else None
+    except ValueError:
+        return None
+
+def safe_float(text: Optional[str]) -> float:
+    """Convert text to float, falling back to 0.0 for missing or malformed values"""
+    try:
+        return float(text) if text else 0.0
+    except ValueError:
+        return 0.0
+
+def optional_datetime(text: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp as naive UTC, or None for missing or malformed values"""
+    try:
+        value = datetime.fromisoformat(text.strip().replace("Z", "+00:00")) if text else None
+    except ValueError:
+        return None
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+class FieldSpec:
+    """How to read one field from a row element.
+
+    Args:
+        selector: CSS selector relative to the row; empty selects the row itself
+        convert: Converter applied to the raw text
+        attribute: Read this attribute instead of the element's text content
+    """
+
+    def __init__(self, selector: str, convert: Callable[[Optional[str]], Any] = safe_str,
+                 attribute: Optional[str] = None):
+        self.selector = selector
+        self.convert = convert
+        self.attribute = attribute
+
+class ExtractionSchema:
+    """Declarative mapping from a table's rows and cells to record fields.
+
+    With ``group_selector``, rows are grouped under headers in document order:
+    each row gets the text of the closest group header before it as its
+    ``group_field`` (e.g. the weight class heading a rankings list).
+    """
+
+    def __init__(self, row_selector: str, fields: Dict[str, FieldSpec],
+                 group_selector: Optional[str] = None, group_field: str = "group"):
+        self.row_selector = row_selector
+        self.fields = fields
+        self.group_selector = group_selector
+        self.group_field = group_field
+
+    @property
+    def scan_selector(self) -> str:
+        """Selector matching the rows and, when grouping, their headers"""
+        if self.group_selector:
+            return f"{self.group_selector}, {self.row_selector}"
+        return self.row_selector
+
+    def to_js_arg(self) -> Dict[str, Any]:
+        """Serializable form of the schema passed into the page"""
+        return {
+            "row_selector": self.row_selector,
+            "group_selector": self.group_selector,
+            "group_field": self.group_field,
+            "fields": [[name, spec.selector, spec.attribute] for name, spec in self.fields.items()],
+        }
+
+    def convert(self, raw: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        """Apply each field's converter to a row of raw strings"""
+        data = {name: spec.convert(raw.get(name)) for name, spec in self.fields.items()}
+        if self.group_selector:
+            data[self.group_field] = safe_str(raw.get(self.group_field))
+        return data
+
+# Runs inside the page: collects every row and cell in a single evaluation so
+# the table costs one browser round trip instead of one per cell. Group headers
+# and rows are matched by one query and walked once in document order.
+EXTRACT_ROWS_JS = """
+(schema) => {
+    const rows = [];
+    const grouped = Boolean(schema.group_selector);
+    const selector = grouped ? `${schema.group_selector}, ${schema.row_selector}` : schema.row_selector;
+    let group = null;
+    for (const row of document.querySelectorAll(selector)) {
+        if (grouped && row.matches(schema.group_selector)) {
+            group = row.textContent;
+            continue;
+        }
+        const record = {};
+        for (const [name, selector, attribute] of schema.fields) {
+            const elem = selector ? row.querySelector(selector) : row;
+            if (!elem) {
+                record[name] = null;
+            } else if (attribute) {
+                record[name] = elem.getAttribute(attribute);
+            } else {
+                record[name] = elem.textContent;
+            }
+        }
+        if (grouped) {
+            record[schema.group_field] = group;
+        }
+        rows.push(record);
+    }
+    return rows;
+}
+"""
+
+async def extract_from_page(page, schema: ExtractionSchema) -> List[Dict[str, Optional[str]]]:
+    """Extract raw row values from a live page in one round trip
+
+    Args:
+        page: Browser page exposing ``evaluate``
+        schema: Rows and fields to extract
+
+    Returns:
+        List[Dict[str, Optional[str]]]: One dict of raw strings per row
+    """
+    rows = await page.evaluate(EXTRACT_ROWS_JS, schema.to_js_arg())
+    return list(rows or [])
+
+@lru_cache(maxsize=256)
+def _compile(selector: str) -> CSSSelector:
+    return CSSSelector(selector)
+
+def _read_field(row, spec: FieldSpec) -> Optional[str]:
+    if spec.selector:
+        # Like querySelector, only descendants of the row may match
+        elem = next((m for m in _compile(spec.selector)(row) if m is not row), None)
+        if elem is None:
+            return None
+    else:
+        elem = row
+    if spec.attribute:
+        return elem.get(spec.attribute)
+    return elem.text_content()
+
+class ExtractedPage:
+    """Content fingerprint of a page plus its raw rows.
+
+    ``rows`` is None when the fingerprint matched the previous run and
+    extraction was skipped.
+    """
+
+    def __init__(self, fingerprint: str, rows: Optional[List[Dict[str, Optional[str]]]] = None):
+        self.fingerprint = fingerprint
+        self.rows = rows
+
+    @property
+    def unchanged(self) -> bool:
+        return self.rows is None
+
+_WHITESPACE = re.compile(r"\s+")
+
+def _region_text(elem) -> str:
+    # Text only: attribute churn (tracking ids, lazy-load classes) is not a change
+    chunks = []
+    for node in elem.iter():
+        skip_text = not isinstance(node.tag, str) or node.tag in ("script", "style")
+        if node.text and not skip_text:
+            chunks.append(node.text)
+        if node.tail and node is not elem:
+            chunks.append(node.tail)
+    return " ".join(chunks)
+
+def _fingerprint_root(root, selector: str) -> str:
+    digest = hashlib.sha256()
+    for elem in _compile(selector)(root):
+        text = _region_text(elem)
+        digest.update(_WHITESPACE.sub(" ", text).strip().encode("utf-8"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+def fingerprint_rows(rows: List[Dict[str, Optional[str]]]) -> str:
+    """Fingerprint already extracted rows (used when extracting in the page)"""
+    normalized = [
+        {name: _WHITESPACE.sub(" ", value).strip() if value else value for name, value in row.items()}
+        for row in rows
+    ]
+    return hashlib.sha256(json.dumps(normalized, sort_keys=True).encode("utf-8")).hexdigest()
+
+def _extract_root(root, schema: ExtractionSchema) -> List[Dict[str, Optional[str]]]:
+    if not schema.group_selector:
+        return [
+            {name: _read_field(row, spec) for name, spec in schema.fields.items()}
+            for row in _compile(schema.row_selector)(root)
+        ]
+    # One pass over headers and rows in document order
+    headers = set(_compile(schema.group_selector)(root))
+    rows = []
+    group = None
+    for elem in _compile(schema.scan_selector)(root):
+        if elem in headers:
+            group = elem.text_content()
+            continue
+        row = {name: _read_field(elem, spec) for name, spec in schema.fields.items()}
+        row[schema.group_field] = group
+        rows.append(row)
+    return rows
+
+def extract_from_html(html: str, schema: ExtractionSchema) -> List[Dict[str, Optional[str]]]:
+    """Extract raw row values from an HTML snapshot without a browser
+
+    Produces the same rows as ``extract_from_page`` for the same schema, so the
+    browser page can be released as soon as its HTML has been captured.
+
+    Args:
+        html: Rendered page HTML
+        schema: Rows and fields to extract
+
+    Returns:
+        List[Dict[str, Optional[str]]]: One dict of raw strings per row
+    """
+    if not html:
+        return []
+    return _extract_root(lxml.html.fromstring(html), schema)
+
+def extract_snapshot(html: str, schema: ExtractionSchema, region_selector: Optional[str] = None,
+                     previous_fingerprint: Optional[str] = None) -> ExtractedPage:
+    """Fingerprint the relevant region of a snapshot and extract its rows
+
+    The document is parsed once. When the fingerprint equals
+    ``previous_fingerprint`` row extraction is skipped entirely.
+
+    Args:
+        html: Rendered page HTML
+        schema: Rows and fields to extract
+        region_selector: Elements whose normalized text is fingerprinted; defaults to the
+            rows (and group headers)
+        previous_fingerprint: Fingerprint recorded by the previous run
+
+    Returns:
+        ExtractedPage: The fingerprint and, if it changed, the raw rows
+    """
+    if not html:
+        return ExtractedPage(fingerprint_rows([]), [])
+    root = lxml.html.fromstring(html)
+    fingerprint = _fingerprint_root(root, region_selector or schema.scan_selector)
+    if fingerprint == previous_fingerprint:
+        return ExtractedPage(fingerprint)
+    return ExtractedPage(fingerprint, _extract_root(root, schema))
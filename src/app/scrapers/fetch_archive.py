@@ -0,0 +1,119 @@
+import gzip
+import json
+import os
+import time
+import zlib
+from typing import Any, Dict, List, Optional
+import logging
+
+ARCHIVE_RECORD = "record"
+ARCHIVE_REPLAY = "replay"
+
+SOURCE_HTTP = "http"
+SOURCE_BROWSER = "browser"
+
+logger = logging.getLogger(__name__)
+
+class FetchArchive:
+    """Gzip-compressed archive of page fetches for offline, deterministic runs.
+
+    In record mode every fetch, by plain HTTP or in the browser, is appended
+    with its HTML, status code and headers (failed fetches are recorded too).
+    In replay mode those responses are served instead of touching the network
+    or launching a browser.
+
+    Each entry is one JSON line written as its own gzip member, so the archive
+    stays readable if a recording is interrupted. When a URL was fetched
+    several times, replay serves the responses in recorded order and then
+    keeps serving the last one. A URL recorded only by the other fetch path
+    (e.g. by HTTP when the browser asks for it) is served from that path.
+    """
+
+    def __init__(self, path: str, mode: str = ARCHIVE_REPLAY):
+        if mode not in (ARCHIVE_RECORD, ARCHIVE_REPLAY):
+            raise ValueError(f"Unknown archive mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self._entries: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._served: Dict[str, int] = {}
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == ARCHIVE_REPLAY
+
+    @staticmethod
+    def _key(source: str, url: str) -> str:
+        return f"{source} {url}"
+
+    def _load(self) -> Dict[str, List[Dict[str, Any]]]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                    for line in f:
+                        entry = json.loads(line)
+                        self._entries.setdefault(self._key(entry["source"], entry["url"]), []).append(entry)
+            except FileNotFoundError:
+                pass
+            except (OSError, EOFError, ValueError, zlib.error) as e:
+                # A torn final member from an interrupted recording
+                logger.warning(f"Ignoring the unreadable end of {self.path}: {str(e)}")
+        return self._entries
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._load().values())
+
+    def record(self, url: str, source: str, html: Optional[str], status_code: Optional[int] = None,
+               headers: Optional[Dict[str, str]] = None) -> None:
+        """Append a fetch response (``html`` None for a failed fetch)"""
+        entry = {
+            "url": url,
+            "source": source,
+            "html": html,
+            "status_code": status_code,
+            "headers": dict(headers or {}),
+            "recorded_at": time.time(),
+        }
+        entries = self._load()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with gzip.open(self.path, "at", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        entries.setdefault(self._key(source, url), []).append(entry)
+
+    def replay(self, url: str, source: str) -> Optional[Dict[str, Any]]:
+        """Next recorded response for ``url``
+
+        Returns:
+            Optional[Dict[str, Any]]: The entry (``html`` None if the fetch failed),
+            or None if the URL was never recorded
+        """
+        entries = self._load()
+        other = SOURCE_BROWSER if source == SOURCE_HTTP else SOURCE_HTTP
+        for key in (self._key(source, url), self._key(other, url)):
+            recorded = entries.get(key)
+            if recorded:
+                served = self._served.get(key, 0)
+                self._served[key] = served + 1
+                return recorded[min(served, len(recorded) - 1)]
+        logger.warning(f"{url} is not in the fetch archive {self.path}")
+        return None
+
+_shared_archive: Optional[FetchArchive] = None
+
+def get_fetch_archive() -> Optional[FetchArchive]:
+    """Get the process-wide fetch archive, or None when fetches go to the live sites"""
+    return _shared_archive
+
+def configure_fetch_archive(path: Optional[str], mode: str = ARCHIVE_REPLAY) -> Optional[FetchArchive]:
+    """Record fetches to, or replay them from, the archive at ``path`` (None goes live again)"""
+    global _shared_archive
+    _shared_archive = FetchArchive(path, mode) if path is not None else None
+    return _shared_archive
+
+def archiving() -> bool:
+    """Whether fetches are currently recorded to or replayed from an archive"""
+    return _shared_archive is not None
+
+def replaying() -> bool:
+    """Whether fetches are currently served from an archive"""
+    return _shared_archive is not None and _shared_archive.replaying
@@ -0,0 +1,148 @@
+import httpx
+from crawl4ai import CrawlerRunConfig
+from typing import Dict, Optional
+import logging
+from .browser_pool import BrowserPool
+from .fetch_archive import SOURCE_BROWSER, SOURCE_HTTP, FetchArchive, get_fetch_archive
+from .http_cache import CacheEntry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-GB,en;q=0.9",
+}
+
+class PageSnapshot:
+    """HTML captured for a URL, by plain HTTP or by the browser."""
+
+    def __init__(self, url: str, html: str, status_code: Optional[int] = None,
+                 headers: Optional[Dict[str, str]] = None, source: str = "browser",
+                 not_modified: bool = False):
+        self.url = url
+        self.html = html
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.source = source
+        # True when the origin confirmed the cached copy is still current
+        self.not_modified = not_modified
+
+def _replayed(archive: FetchArchive, url: str, source: str) -> Optional[PageSnapshot]:
+    entry = archive.replay(url, source)
+    if entry is None or entry["html"] is None:
+        return None
+    return PageSnapshot(
+        url=url,
+        html=entry["html"],
+        status_code=entry["status_code"],
+        headers=entry["headers"],
+        source=entry["source"],
+    )
+
+def _record(url: str, source: str, snapshot: Optional[PageSnapshot], status_code: Optional[int] = None) -> None:
+    archive = get_fetch_archive()
+    if archive is None:
+        return
+    if snapshot is None:
+        archive.record(url, source, None, status_code)
+    else:
+        archive.record(url, source, snapshot.html, snapshot.status_code, snapshot.headers)
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide pooled HTTP client used for static fetches"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            follow_redirects=True,
+            timeout=httpx.Timeout(15.0, connect=5.0),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _shared_client
+
+async def close_http_client() -> None:
+    """Close the process-wide HTTP client and its pooled connections"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+async def fetch_http(url: str, cached: Optional[CacheEntry] = None) -> Optional[PageSnapshot]:
+    """Fetch a page with a plain pooled HTTP GET
+
+    Args:
+        url: Page to fetch
+        cached: Previously cached copy; its validators make the request conditional
+
+    Returns:
+        Optional[PageSnapshot]: The snapshot, or None if the request failed
+    """
+    archive = get_fetch_archive()
+    if archive is not None and archive.replaying:
+        return _replayed(archive, url, SOURCE_HTTP)
+    headers = cached.conditional_headers() if cached is not None else {}
+    try:
+        response = await get_http_client().get(url, headers=headers)
+    except httpx.HTTPError as e:
+        logger.warning(f"HTTP fetch of {url} failed: {str(e)}")
+        _record(url, SOURCE_HTTP, None)
+        return None
+    if response.status_code == 304 and cached is not None:
+        snapshot = PageSnapshot(
+            url=url,
+            html=cached.body,
+            status_code=304,
+            headers=dict(response.headers),
+            source="http",
+            not_modified=True,
+        )
+        # Archived with the cached body, so a replay has the full page
+        _record(url, SOURCE_HTTP, snapshot)
+        return snapshot
+    if response.status_code != 200:
+        logger.warning(f"HTTP fetch of {url} returned status {response.status_code}")
+        _record(url, SOURCE_HTTP, None, response.status_code)
+        return None
+    snapshot = PageSnapshot(
+        url=url,
+        html=response.text,
+        status_code=response.status_code,
+        headers=dict(response.headers),
+        source="http",
+    )
+    _record(url, SOURCE_HTTP, snapshot)
+    return snapshot
+
+async def fetch_browser(pool: BrowserPool, url: str, config: Optional[CrawlerRunConfig] = None,
+                        profile: Optional[str] = None) -> Optional[PageSnapshot]:
+    """Render a page in a pooled browser and capture its HTML
+
+    Args:
+        pool: Browser pool to lease the page from
+        url: Page to render
+        config: Run config for the navigation (e.g. resource block rules)
+        profile: Persistent browser profile to render the page in
+
+    Returns:
+        Optional[PageSnapshot]: The snapshot, or None if the navigation failed
+    """
+    archive = get_fetch_archive()
+    if archive is not None and archive.replaying:
+        return _replayed(archive, url, SOURCE_BROWSER)
+    async with pool.lease(profile) as crawler:
+        result = await crawler.arun(url, config=config)
+    if not result.success:
+        _record(url, SOURCE_BROWSER, None, getattr(result, "status_code", None))
+        return None
+    snapshot = PageSnapshot(
+        url=url,
+        html=result.html,
+        status_code=getattr(result, "status_code", None),
+        headers=getattr(result, "response_headers", None),
+        source="browser",
+    )
+    _record(url, SOURCE_BROWSER, snapshot)
+    return snapshot
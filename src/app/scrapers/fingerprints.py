@@ -0,0 +1,61 @@
+import json
+import os
+from typing import Dict, Optional
+import logging
+
+class FingerprintStore:
+    """Persistent record of the content fingerprint each source last produced.
+
+    Keys are ``"<scraper>:<url>"``; the whole store is a single small JSON file
+    rewritten on every update.
+    """
+
+    def __init__(self, path: str = "data/state/fingerprints.json"):
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+        self._fingerprints: Optional[Dict[str, str]] = None
+
+    def _load(self) -> Dict[str, str]:
+        if self._fingerprints is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._fingerprints = json.load(f)
+            except (OSError, ValueError):
+                self._fingerprints = {}
+        return self._fingerprints
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the last recorded fingerprint for ``key``"""
+        return self._load().get(key)
+
+    def set(self, key: str, fingerprint: str) -> None:
+        """Record ``fingerprint`` for ``key`` and persist the store"""
+        fingerprints = self._load()
+        if fingerprints.get(key) == fingerprint:
+            return
+        fingerprints[key] = fingerprint
+        self._persist()
+
+    def forget(self, key: str) -> None:
+        """Drop the fingerprint for ``key`` so the next run is treated as changed"""
+        if self._load().pop(key, None) is not None:
+            self._persist()
+
+    def _persist(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._load(), f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.error(f"Failed to persist fingerprints to {self.path}: {str(e)}")
+
+_shared_store: Optional[FingerprintStore] = None
+
+def get_fingerprint_store() -> FingerprintStore:
+    """Get the process-wide fingerprint store"""
+    global _shared_store
+    if _shared_store is None:
+        _shared_store = FingerprintStore()
+    return _shared_store
@@ -0,0 +1,187 @@
+import asyncio
+import json
+import os
+import re
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, List, Optional, Type
+import logging
+from .fixtures_scraper import ALL_PARTICIPANTS, _FixturesScraper
+from .polling_policy import FINISHED_STATUSES
+from src.app.models.base import Event
+
+logger = logging.getLogger(__name__)
+
+def normalize_key(name: str) -> str:
+    """Normalise a team or driver name for index lookups"""
+    return re.sub(r"\s+", " ", name or "").strip().lower()
+
+class FixturesIndex:
+    """Fixtures of one source indexed by team or driver.
+
+    Built once per load so each table row's next fixture is a dict lookup.
+    Fixtures that have started are dropped from the front of each key's queue
+    as lookups move past them.
+    """
+
+    def __init__(self, entries: List[Dict[str, Any]], sport_id: int = 0):
+        self.sport_id = sport_id
+        self.entries = sorted(entries, key=lambda entry: entry["start"])
+        self._upcoming: Dict[str, Deque[Dict[str, Any]]] = {}
+        for entry in self.entries:
+            if (entry.get("status") or "").strip().lower() in FINISHED_STATUSES:
+                continue
+            for key in entry["keys"]:
+                self._upcoming.setdefault(normalize_key(key), deque()).append(entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def next_for(self, name: str, now: Optional[datetime] = None) -> Optional[str]:
+        """Label of the next fixture of ``name`` that has not started yet
+
+        Args:
+            name: Team or driver name as it appears in the table
+            now: Current time in UTC (defaults to now)
+        """
+        now = (now or datetime.utcnow()).isoformat()
+        upcoming = self._upcoming.get(normalize_key(name))
+        if upcoming is None:
+            upcoming = self._upcoming.get(ALL_PARTICIPANTS)
+        while upcoming and upcoming[0]["start"] < now:
+            upcoming.popleft()
+        return upcoming[0]["label"] if upcoming else None
+
+    def in_progress(self, window: timedelta, now: Optional[datetime] = None) -> bool:
+        """Whether a fixture has started less than ``window`` ago and not finished
+
+        Args:
+            window: How long after its start a fixture may still be running
+            now: Current time in UTC (defaults to now)
+        """
+        now = now or datetime.utcnow()
+        earliest = (now - window).isoformat()
+        latest = now.isoformat()
+        return any(
+            earliest <= entry["start"] <= latest
+            and (entry.get("status") or "").strip().lower() not in FINISHED_STATUSES
+            for entry in self.entries
+        )
+
+    def events(self) -> List[Event]:
+        """The fixtures as events for adaptive polling"""
+        return [
+            Event(
+                event_id=number,
+                sport_id=self.sport_id,
+                event_date=datetime.fromisoformat(entry["start"]),
+                location=entry.get("location") or "",
+                status=entry.get("status") or "scheduled"
+            )
+            for number, entry in enumerate(self.entries, start=1)
+        ]
+
+class FixturesCache:
+    """Fixture calendars loaded once per day, and more often during events,
+    shared by all scrapers.
+
+    Each calendar is stored as ``<directory>/<output_prefix>.json`` together
+    with the day and time it was scraped. The first lookup of a day scrapes it
+    again; concurrent lookups wait for that one scrape. While a fixture is in
+    progress (started less than ``event_window`` ago and not finished) the
+    calendar is scraped again every ``live_refresh`` seconds, so fixtures
+    turn live and finished and polling policies can switch to their live
+    interval. When the scrape fails the last stored calendar is used.
+    """
+
+    def __init__(self, directory: str = "data/state/fixtures", live_refresh: float = 120.0,
+                 event_window: timedelta = timedelta(hours=3)):
+        self.directory = directory
+        self.live_refresh = live_refresh
+        self.event_window = event_window
+        self._indexes: Dict[str, FixturesIndex] = {}
+        self._days: Dict[str, str] = {}
+        self._scraped_at: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.json")
+
+    def _read(self, name: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(name), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, name: str, day: str, entries: List[Dict[str, Any]], scraped_at: float = 0.0) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{self._path(name)}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"day": day, "scraped_at": scraped_at, "fixtures": entries}, f)
+            os.replace(tmp_path, self._path(name))
+        except OSError as e:
+            logger.error(f"Failed to persist fixtures for {name}: {str(e)}")
+
+    async def _scrape(self, scraper_cls: Type[_FixturesScraper]) -> Optional[List[Dict[str, Any]]]:
+        scraper = scraper_cls()
+        try:
+            records = await scraper.scrape()
+        except Exception as e:
+            logger.error(f"Failed to scrape fixtures with {scraper_cls.__name__}: {str(e)}")
+            return None
+        if not records:
+            return None
+        return [scraper.fixture_entry(record) for record in records]
+
+    def _current(self, index: FixturesIndex, day: str, scraped_at: float, today: str) -> bool:
+        if day != today:
+            return False
+        return time.time() - scraped_at < self.live_refresh or not index.in_progress(self.event_window)
+
+    async def get_index(self, scraper_cls: Type[_FixturesScraper]) -> FixturesIndex:
+        """Get the current fixtures for the calendar scraped by ``scraper_cls``
+
+        Returns:
+            FixturesIndex: The calendar, or an empty index if it has never loaded
+        """
+        name = scraper_cls.output_prefix
+        today = datetime.utcnow().date().isoformat()
+        index = self._indexes.get(name)
+        if index is not None and self._current(index, self._days[name], self._scraped_at[name], today):
+            return index
+        lock = self._locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            index = self._indexes.get(name)
+            if index is not None and self._current(index, self._days[name], self._scraped_at[name], today):
+                return index
+            stored = self._read(name)
+            if stored is not None:
+                index = FixturesIndex(stored["fixtures"], scraper_cls.sport_id)
+                scraped_at = stored.get("scraped_at", 0.0)
+            if stored is None or not self._current(index, stored.get("day"), scraped_at, today):
+                entries = await self._scrape(scraper_cls)
+                scraped_at = time.time()
+                if entries is not None:
+                    self._write(name, today, entries, scraped_at)
+                    index = FixturesIndex(entries, scraper_cls.sport_id)
+                elif stored is not None:
+                    logger.warning(f"Using fixtures for {name} from {stored.get('day')}")
+                else:
+                    index = FixturesIndex([], scraper_cls.sport_id)
+            self._indexes[name] = index
+            self._days[name] = today
+            # A failed scrape also waits live_refresh before the next attempt
+            self._scraped_at[name] = scraped_at
+            return index
+
+_shared_cache: Optional[FixturesCache] = None
+
+def get_fixtures_cache() -> FixturesCache:
+    """Get the process-wide fixtures cache"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = FixturesCache()
+    return _shared_cache
@@ -0,0 +1,128 @@
+from .base_scraper import BaseScraper, FETCH_HTTP_FIRST
+from .extraction import ExtractionSchema, FieldSpec, optional_datetime, safe_int
+from datetime import datetime
+from typing import Dict, List, Any
+import logging
+from src.app.models.formula1 import Formula1CalendarRace
+from src.app.models.premier_league import PremierLeagueFixture
+
+# Key of calendar entries that apply to every participant (e.g. every driver
+# takes part in every Grand Prix)
+ALL_PARTICIPANTS = "*"
+
+class _FixturesScraper(BaseScraper):
+    # The whole calendar is needed every time it is loaded, so unchanged pages
+    # are not skipped; the fixtures cache decides how often it is refreshed
+    fetch_strategy = FETCH_HTTP_FIRST
+    detect_changes = False
+    sport_id: int = 0
+
+    def fixture_keys(self, record: Dict[str, Any]) -> List[str]:
+        """Names of the teams or drivers a fixture record belongs to"""
+        raise NotImplementedError("Subclasses must implement fixture_keys()")
+
+    def fixture_entry(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Describe a fixture record for the fixtures cache
+
+        Returns:
+            Dict[str, Any]: ``keys``, ``label``, ``start`` (ISO 8601), ``status`` and ``location``
+        """
+        raise NotImplementedError("Subclasses must implement fixture_entry()")
+
+class PremierLeagueFixturesScraper(_FixturesScraper):
+    """Premier League fixtures, indexed by home and away team."""
+
+    schema = ExtractionSchema(
+        row_selector=".fixture",
+        fields={
+            "home_team": FieldSpec(".team.home .team-name"),
+            "away_team": FieldSpec(".team.away .team-name"),
+            "kickoff": FieldSpec("time", optional_datetime, attribute="datetime"),
+            "venue": FieldSpec(".venue"),
+            "status": FieldSpec(".status"),
+        }
+    )
+    output_prefix = "premier_league_fixtures"
+    sport_id = 1
+
+    def __init__(self):
+        super().__init__("https://www.premierleague.com")
+        self.logger = logging.getLogger(__name__)
+
+    def get_required_fields(self) -> List[str]:
+        return ["home_team", "away_team", "kickoff"]
+
+    def get_source_url(self) -> str:
+        return "https://www.premierleague.com/fixtures"
+
+    def build_record(self, data: Dict[str, Any], source_url: str) -> PremierLeagueFixture:
+        """Create and validate a fixture using the Pydantic model."""
+        return PremierLeagueFixture(
+            source_url=source_url,
+            home_team=data["home_team"],
+            away_team=data["away_team"],
+            kickoff=data["kickoff"],
+            venue=data["venue"] or None,
+            status=data["status"] or "scheduled"
+        )
+
+    def fixture_keys(self, record: Dict[str, Any]) -> List[str]:
+        return [record["home_team"], record["away_team"]]
+
+    def fixture_entry(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "keys": self.fixture_keys(record),
+            "label": f"{record['home_team']} vs {record['away_team']}, {record['kickoff']:%Y-%m-%d %H:%M}",
+            "start": record["kickoff"].isoformat(),
+            "status": record["status"],
+            "location": record["venue"] or "",
+        }
+
+class Formula1CalendarScraper(_FixturesScraper):
+    """Grands Prix of the current season; every driver takes part in each."""
+
+    schema = ExtractionSchema(
+        row_selector=".event-item",
+        fields={
+            "round": FieldSpec(".event-round", safe_int),
+            "race": FieldSpec(".event-title"),
+            "circuit": FieldSpec(".event-place"),
+            "race_date": FieldSpec("time", optional_datetime, attribute="datetime"),
+            "status": FieldSpec(".event-status"),
+        }
+    )
+    output_prefix = "formula1_calendar"
+    sport_id = 2
+
+    def __init__(self):
+        super().__init__("https://www.formula1.com")
+        self.logger = logging.getLogger(__name__)
+
+    def get_required_fields(self) -> List[str]:
+        return ["round", "race", "race_date"]
+
+    def get_source_url(self) -> str:
+        return f"https://www.formula1.com/en/racing/{datetime.now().year}.html"
+
+    def build_record(self, data: Dict[str, Any], source_url: str) -> Formula1CalendarRace:
+        """Create and validate a calendar race using the Pydantic model."""
+        return Formula1CalendarRace(
+            source_url=source_url,
+            round=data["round"],
+            race=data["race"],
+            circuit=data["circuit"] or None,
+            race_date=data["race_date"],
+            status=data["status"] or "scheduled"
+        )
+
+    def fixture_keys(self, record: Dict[str, Any]) -> List[str]:
+        return [ALL_PARTICIPANTS]
+
+    def fixture_entry(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "keys": self.fixture_keys(record),
+            "label": f"{record['race']}, {record['race_date']:%Y-%m-%d}",
+            "start": record["race_date"].isoformat(),
+            "status": record["status"],
+            "location": record["circuit"] or "",
+        }
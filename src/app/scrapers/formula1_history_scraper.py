@@ -0,0 +1,123 @@
+from .base_scraper import BaseScraper, FETCH_HTTP_FIRST
+from .extraction import ExtractionSchema, FieldSpec, optional_int, safe_int, safe_float
+from typing import Dict, List, Any
+from urllib.parse import urljoin
+import logging
+from src.app.models.formula1 import Formula1Race, Formula1RaceResult, Formula1SeasonStanding
+
+RESULTS_URL = "https://www.formula1.com/en/results.html"
+
+def season_url(season: int, page: str = "drivers") -> str:
+    return f"{RESULTS_URL}/{season}/{page}.html"
+
+class _Formula1HistoryScraper(BaseScraper):
+    # Archive pages never change once a season is over and are only read once
+    # per backfill, so they are neither cached nor fingerprinted
+    fetch_strategy = FETCH_HTTP_FIRST
+    use_http_cache = False
+    detect_changes = False
+
+    def __init__(self):
+        super().__init__("https://www.formula1.com")
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def season(self) -> int:
+        return int(self.job_params["season"])
+
+class Formula1SeasonScraper(_Formula1HistoryScraper):
+    """Final drivers' championship standings of one season (job param ``season``)."""
+
+    schema = ExtractionSchema(
+        row_selector=".resultsarchive-table tbody tr",
+        fields={
+            "position": FieldSpec(".position", safe_int),
+            "driver_name": FieldSpec(".driver-name"),
+            "nationality": FieldSpec(".nationality"),
+            "team": FieldSpec(".team-name"),
+            "points": FieldSpec(".points", safe_float),
+        }
+    )
+    output_prefix = "formula1_season"
+
+    def get_required_fields(self) -> List[str]:
+        return ["position", "driver_name", "points"]
+
+    def get_source_url(self) -> str:
+        return season_url(self.season)
+
+    def build_record(self, data: Dict[str, Any], source_url: str) -> Formula1SeasonStanding:
+        """Create and validate a season standing using the Pydantic model."""
+        return Formula1SeasonStanding(
+            source_url=source_url,
+            season=self.season,
+            position=data["position"],
+            name=data["driver_name"],
+            nationality=data["nationality"],
+            team=data["team"],
+            points=data["points"]
+        )
+
+class Formula1RaceIndexScraper(_Formula1HistoryScraper):
+    """Races of one season with links to their results (job param ``season``)."""
+
+    schema = ExtractionSchema(
+        row_selector=".resultsarchive-table tbody tr",
+        fields={
+            "race": FieldSpec(".race-name"),
+            "url": FieldSpec("a", attribute="href"),
+        }
+    )
+    output_prefix = "formula1_races"
+
+    def get_required_fields(self) -> List[str]:
+        return ["race", "url"]
+
+    def get_source_url(self) -> str:
+        return season_url(self.season, "races")
+
+    def build_record(self, data: Dict[str, Any], source_url: str) -> Formula1Race:
+        """Create and validate a race listing using the Pydantic model."""
+        return Formula1Race(
+            season=self.season,
+            race=data["race"],
+            url=urljoin(source_url, data["url"])
+        )
+
+class Formula1RaceResultScraper(_Formula1HistoryScraper):
+    """Classification of one race (job params ``season`` and ``race``; URL from the job)."""
+
+    schema = ExtractionSchema(
+        row_selector=".resultsarchive-table tbody tr",
+        fields={
+            "position": FieldSpec(".position", optional_int),
+            "car_number": FieldSpec(".car-number", optional_int),
+            "driver_name": FieldSpec(".driver-name"),
+            "team": FieldSpec(".team-name"),
+            "laps": FieldSpec(".laps", optional_int),
+            "time_or_status": FieldSpec(".time-retired"),
+            "points": FieldSpec(".points", safe_float),
+        }
+    )
+    output_prefix = "formula1_race"
+
+    def get_required_fields(self) -> List[str]:
+        return ["driver_name"]
+
+    def get_source_url(self) -> str:
+        raise NotImplementedError("Race results are scraped for a job URL (see apply_job)")
+
+    def build_record(self, data: Dict[str, Any], source_url: str) -> Formula1RaceResult:
+        """Create and validate a race result using the Pydantic model."""
+        return Formula1RaceResult(
+            source_url=source_url,
+            season=self.season,
+            race=self.job_params["race"],
+            position=data["position"],
+            name=data["driver_name"],
+            car_number=data["car_number"],
+            team=data["team"],
+            laps=data["laps"],
+            time_or_status=data["time_or_status"],
+            points=data["points"]
+        )
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+from src.app.models.config import HTTPCacheConfig
+
+class CacheEntry:
+    """A cached page: body, validators and the rows last extracted from it."""
+
+    def __init__(self, url: str, body: str, etag: Optional[str] = None,
+                 last_modified: Optional[str] = None, stored_at: Optional[float] = None,
+                 rows: Optional[List[Dict[str, Any]]] = None, fingerprint: Optional[str] = None,
+                 namespace: str = ""):
+        self.url = url
+        self.namespace = namespace
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at if stored_at is not None else time.time()
+        self.rows = rows
+        self.fingerprint = fingerprint
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Whether the entry may be served without contacting the origin"""
+        return time.time() - self.stored_at < ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that let the origin answer 304 Not Modified"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+class HTTPCache:
+    """Persistent page cache keyed by URL with size-based LRU eviction.
+
+    Entries are namespaced (normally by scraper) because the cached rows and
+    fingerprint depend on the schema used to extract them.
+
+    Each entry is stored as ``<key>.json`` (validators, timestamps and extracted
+    rows) next to ``<key>.html`` (the body). The JSON file's mtime records the
+    last access and drives eviction order.
+    """
+
+    def __init__(self, config: Optional[HTTPCacheConfig] = None):
+        self.config = config or HTTPCacheConfig()
+        self.directory = self.config.directory
+        self.logger = logging.getLogger(__name__)
+        # key -> (size in bytes, last access time); loaded lazily from disk
+        self._index: Optional[Dict[str, Tuple[int, float]]] = None
+
+    @property
+    def default_ttl(self) -> int:
+        return self.config.default_ttl
+
+    @staticmethod
+    def _key(url: str, namespace: str = "") -> str:
+        return hashlib.sha256(f"{namespace}\n{url}".encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.directory, key)
+        return f"{base}.json", f"{base}.html"
+
+    def _load_index(self) -> Dict[str, Tuple[int, float]]:
+        if self._index is None:
+            self._index = {}
+            if os.path.isdir(self.directory):
+                for name in os.listdir(self.directory):
+                    if not name.endswith(".json"):
+                        continue
+                    key = name[:-5]
+                    meta_path, body_path = self._paths(key)
+                    try:
+                        size = os.path.getsize(meta_path) + os.path.getsize(body_path)
+                        self._index[key] = (size, os.path.getmtime(meta_path))
+                    except OSError:
+                        continue
+        return self._index
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of all cached entries"""
+        return sum(size for size, _ in self._load_index().values())
+
+    def get(self, url: str, namespace: str = "") -> Optional[CacheEntry]:
+        """Load the entry for ``url`` and mark it as recently used"""
+        key = self._key(url, namespace)
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, encoding="utf-8") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+
+        now = time.time()
+        index = self._load_index()
+        if key in index:
+            index[key] = (index[key][0], now)
+        try:
+            os.utime(meta_path, (now, now))
+        except OSError:
+            pass
+
+        return CacheEntry(
+            url=url,
+            body=body,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            stored_at=meta.get("stored_at"),
+            rows=meta.get("rows"),
+            fingerprint=meta.get("fingerprint"),
+            namespace=namespace,
+        )
+
+    def put(self, entry: CacheEntry) -> None:
+        """Store or replace the entry for ``entry.url`` and evict if over budget"""
+        key = self._key(entry.url, entry.namespace)
+        meta_path, body_path = self._paths(key)
+        meta = {
+            "url": entry.url,
+            "namespace": entry.namespace,
+            "fingerprint": entry.fingerprint,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "stored_at": entry.stored_at,
+            "rows": entry.rows,
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(body_path, "w", encoding="utf-8") as f:
+                f.write(entry.body)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            size = os.path.getsize(meta_path) + os.path.getsize(body_path)
+        except OSError as e:
+            self.logger.error(f"Failed to cache {entry.url}: {str(e)}")
+            return
+        self._load_index()[key] = (size, time.time())
+        self._evict()
+
+    def _evict(self) -> None:
+        index = self._load_index()
+        total = sum(size for size, _ in index.values())
+        if total <= self.config.max_bytes:
+            return
+        for key, (size, _) in sorted(index.items(), key=lambda item: item[1][1]):
+            if total <= self.config.max_bytes:
+                break
+            for path in self._paths(key):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            del index[key]
+            total -= size
+
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        for key in list(self._load_index()):
+            for path in self._paths(key):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        self._index = {}
+
+_shared_cache: Optional[HTTPCache] = None
+
+def get_http_cache() -> HTTPCache:
+    """Get the process-wide page cache, creating it with defaults if needed"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = HTTPCache()
+    return _shared_cache
+
+def configure_http_cache(config: HTTPCacheConfig) -> HTTPCache:
+    """Replace the process-wide page cache with one built from ``config``"""
+    global _shared_cache
+    _shared_cache = HTTPCache(config)
+    return _shared_cache
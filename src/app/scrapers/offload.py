@@ -0,0 +1,79 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Type
+import logging
+from src.app.models.config import ProcessPoolConfig
+
+OFFLOAD_THREAD = "thread"
+OFFLOAD_PROCESS = "process"
+
+logger = logging.getLogger(__name__)
+
+_shared_executor: Optional[ProcessPoolExecutor] = None
+_shared_config: Optional[ProcessPoolConfig] = None
+
+def get_process_pool_config() -> ProcessPoolConfig:
+    """Get the configuration of the process-wide offload pool"""
+    global _shared_config
+    if _shared_config is None:
+        _shared_config = ProcessPoolConfig()
+    return _shared_config
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get the process-wide pool for CPU-bound parsing and validation, starting it if needed"""
+    global _shared_executor
+    if _shared_executor is None:
+        config = get_process_pool_config()
+        _shared_executor = ProcessPoolExecutor(max_workers=config.max_workers)
+        logger.info(f"Started offload pool with {worker_count()} workers")
+    return _shared_executor
+
+def configure_process_pool(config: ProcessPoolConfig) -> None:
+    """Configure the offload pool; takes effect the next time the pool starts"""
+    global _shared_config
+    _shared_config = config
+    shutdown_process_pool()
+
+def shutdown_process_pool() -> None:
+    """Stop the offload pool's worker processes"""
+    global _shared_executor
+    if _shared_executor is not None:
+        _shared_executor.shutdown(wait=True, cancel_futures=True)
+        _shared_executor = None
+
+def worker_count() -> int:
+    """Number of workers the offload pool runs"""
+    return get_process_pool_config().max_workers or os.cpu_count() or 1
+
+# Scraper instances created inside a worker process, reused across tasks
+_worker_scrapers: Dict[type, Any] = {}
+
+def validate_rows(scraper_cls: Type, rows: List[Dict[str, Optional[str]]], source_url: str,
+                  job_params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Convert, validate and build records for a chunk of raw rows (runs in a worker process)
+
+    Args:
+        scraper_cls: Scraper class whose ``process_row`` is applied; it must be
+            constructible without arguments
+        rows: Raw rows extracted by the scraper's schema
+        source_url: URL the rows were scraped from
+        job_params: Parameters of the job being run, if any (see ``BaseScraper.apply_job``)
+
+    Returns:
+        List[Dict[str, Any]]: Records for the rows that passed validation, in order
+    """
+    scraper = _worker_scrapers.get(scraper_cls)
+    if scraper is None:
+        scraper = scraper_cls()
+        _worker_scrapers[scraper_cls] = scraper
+    scraper.apply_job(source_url, job_params)
+    records = []
+    for row in rows:
+        try:
+            record = scraper.process_row(row, source_url)
+        except Exception as e:
+            scraper.logger.error(f"Error processing row data: {str(e)}")
+            continue
+        if record is not None:
+            records.append(record)
+    return records
@@ -0,0 +1,125 @@
+import asyncio
+import csv
+import os
+from typing import Any, AsyncIterable, AsyncIterator, Dict, IO, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+_END = object()
+
+async def buffered(source: AsyncIterable[T], maxsize: int) -> AsyncIterator[T]:
+    """Run ``source`` in its own task, at most ``maxsize`` items ahead of the consumer
+
+    The bounded queue between the two applies backpressure: a fast producer
+    waits for the consumer instead of buffering without limit. Errors raised
+    by ``source`` are re-raised to the consumer, and closing the consumer
+    early cancels the producer.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+    async def produce() -> None:
+        try:
+            async for item in source:
+                await queue.put((item, None))
+        except Exception as e:
+            await queue.put((_END, e))
+            return
+        await queue.put((_END, None))
+
+    # The task inherits the current context, including the current deadline
+    task = asyncio.create_task(produce())
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is _END:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+async def batched(source: AsyncIterable[T], size: int) -> AsyncIterator[List[T]]:
+    """Group items from ``source`` into lists of up to ``size`` items"""
+    batch: List[T] = []
+    async for item in source:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+class CSVSink:
+    """Writes records to a CSV file batch by batch.
+
+    Rows go to ``<filename>.tmp`` (in a worker thread) and the file is moved
+    into place on commit, so readers never see a half-written file. Nothing
+    is created when no records arrive. Use as an async context manager to
+    commit on success and discard the temporary file on error.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.tmp_filename = f"{filename}.tmp"
+        self.count = 0
+        self._file: Optional[IO[str]] = None
+        self._writer: Optional[csv.DictWriter] = None
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        if self._writer is None:
+            directory = os.path.dirname(self.filename)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.tmp_filename, 'w', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(self._file, fieldnames=batch[0].keys())
+            self._writer.writeheader()
+        self._writer.writerows(batch)
+
+    async def write(self, batch: List[Dict[str, Any]]) -> None:
+        """Append a batch of records"""
+        if not batch:
+            return
+        await asyncio.to_thread(self._write, batch)
+        self.count += len(batch)
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    async def commit(self) -> bool:
+        """Move the written file into place; returns False if nothing was written"""
+        self._close()
+        if self._writer is None:
+            return False
+        await asyncio.to_thread(os.replace, self.tmp_filename, self.filename)
+        self._writer = None
+        return True
+
+    def abort(self) -> None:
+        """Discard everything written so far"""
+        self._close()
+        if self._writer is not None:
+            self._writer = None
+            try:
+                os.remove(self.tmp_filename)
+            except OSError:
+                pass
+
+    async def __aenter__(self) -> "CSVSink":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            try:
+                await self.commit()
+            except BaseException:
+                self.abort()
+                raise
+        else:
+            self.abort()
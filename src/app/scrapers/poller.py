@@ -0,0 +1,139 @@
+import asyncio
+import random
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+import logging
+from .base_scraper import BaseScraper, STATUS_CHANGED, STATUS_PARTIAL, STATUS_TIMED_OUT, STATUS_UNCHANGED
+from .cycle import DEFAULT_GRACE, SourceResult, scrape_source
+from src.app.services.deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+class SourceStats:
+    """Running counters for one polled source."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.polls = 0
+        self.changed = 0
+        self.failures = 0
+        self.missed_deadlines = 0
+        self.missed_polls = 0
+        self.last_status: Optional[str] = None
+        self.last_polled_at: Optional[float] = None
+        self.last_elapsed: Optional[float] = None
+
+    def record(self, result: SourceResult) -> None:
+        self.polls += 1
+        self.last_status = result.status
+        self.last_polled_at = time.time()
+        self.last_elapsed = result.elapsed
+        if result.status in (STATUS_CHANGED, STATUS_PARTIAL):
+            self.changed += 1
+        if result.status in (STATUS_TIMED_OUT, STATUS_PARTIAL):
+            self.missed_deadlines += 1
+        elif result.status not in (STATUS_CHANGED, STATUS_UNCHANGED):
+            self.failures += 1
+
+class PollingDaemon:
+    """Keeps scrapers initialised and polls each on its own interval.
+
+    Each source runs in its own task: it is scraped under a deadline of
+    ``poll_timeout`` (or ``poll_interval``), its records are streamed to
+    ``data/<output_prefix>_<timestamp>.csv``, and the next poll is scheduled
+    one interval (see ``base_interval``) +/- ``poll_jitter`` after the
+    previous one was due. Polls that overrun are reported as missed deadlines, and polls skipped
+    because a previous one ran past its slot are counted as missed polls.
+    """
+
+    def __init__(self, scrapers: Sequence[BaseScraper], output_dir: str = "data",
+                 grace: float = DEFAULT_GRACE):
+        self.scrapers = list(scrapers)
+        self.output_dir = output_dir
+        self.grace = grace
+        self.stats: Dict[str, SourceStats] = {
+            scraper.source_name: SourceStats(scraper.source_name) for scraper in self.scrapers
+        }
+        self._stop = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    @staticmethod
+    def base_interval(scraper: BaseScraper) -> float:
+        """Un-jittered delay before the next poll of ``scraper``
+        
+        Scrapers with a ``polling_policy`` are paced by the state of the events
+        returned by ``get_events()``; others (and those with no known events)
+        use their fixed ``poll_interval``.
+        """
+        return scraper.current_poll_interval()
+
+    @classmethod
+    def next_interval(cls, scraper: BaseScraper) -> float:
+        """Jittered delay before the next poll of ``scraper``"""
+        interval = cls.base_interval(scraper)
+        jitter = interval * scraper.poll_jitter
+        return max(0.0, interval + random.uniform(-jitter, jitter))
+
+    def stop(self) -> None:
+        """Ask every source loop to finish after its current poll"""
+        self._stop.set()
+
+    async def poll_once(self, scraper: BaseScraper) -> SourceResult:
+        """Scrape one source under its poll deadline, streaming any new records to a file"""
+        timeout = scraper.poll_timeout if scraper.poll_timeout is not None else scraper.poll_interval
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"{self.output_dir}/{scraper.output_prefix}_{timestamp}.csv"
+        result = await scrape_source(scraper, Deadline.after(timeout), self.grace, filename)
+        stats = self.stats[scraper.source_name]
+        stats.record(result)
+        if result.status in (STATUS_TIMED_OUT, STATUS_PARTIAL):
+            logger.warning(
+                f"{result.name} missed its {timeout:.0f}s deadline ({result.status}, "
+                f"{stats.missed_deadlines} of {stats.polls} polls)"
+            )
+        return result
+
+    async def _wait(self, seconds: float) -> bool:
+        """Sleep for ``seconds`` unless stopped first; returns False when stopped"""
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=seconds)
+            return False
+        except asyncio.TimeoutError:
+            return True
+
+    async def _run_source(self, scraper: BaseScraper) -> None:
+        stats = self.stats[scraper.source_name]
+        # Spread the first polls over one jitter window so sources start staggered
+        due = time.monotonic() + random.uniform(0, scraper.poll_interval * scraper.poll_jitter)
+        while not self._stop.is_set():
+            if not await self._wait(due - time.monotonic()):
+                break
+            try:
+                await self.poll_once(scraper)
+            except Exception as e:
+                logger.error(f"Polling {scraper.source_name} failed: {str(e)}")
+            interval = self.next_interval(scraper)
+            due += interval
+            now = time.monotonic()
+            if due < now:
+                # The poll overran its slot: skip ahead rather than firing a burst of catch-up polls
+                skipped = int((now - due) // max(interval, 1e-3)) + 1
+                stats.missed_polls += skipped
+                logger.warning(f"{scraper.source_name} fell behind schedule, skipped {skipped} poll(s)")
+                due = now + self.next_interval(scraper)
+
+    async def run(self) -> None:
+        """Initialise the scrapers once and poll them until ``stop()`` is called"""
+        await asyncio.gather(*(scraper.initialize() for scraper in self.scrapers))
+        try:
+            self._tasks = [
+                asyncio.create_task(self._run_source(scraper), name=f"poll-{scraper.source_name}")
+                for scraper in self.scrapers
+            ]
+            await asyncio.gather(*self._tasks)
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            for scraper in self.scrapers:
+                await scraper.cleanup()
@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+from src.app.models.base import Event
+
+LIVE_STATUSES = {"live", "in_progress", "in progress", "halftime"}
+FINISHED_STATUSES = {"completed", "finished", "final", "cancelled", "postponed"}
+
+class AdaptivePollingPolicy:
+    """Chooses a poll interval from the state of a source's events.
+
+    Sources are polled every ``live_interval`` seconds while any event is live,
+    every ``active_interval`` seconds in the ``lead_time`` before an event starts
+    and the ``cooldown`` after one ends (when results and tables are settling),
+    and every ``idle_interval`` seconds otherwise. Idle polling is shortened so
+    the source is always polled again when the next event's lead time begins.
+    """
+
+    def __init__(self, live_interval: float = 60.0, active_interval: float = 300.0,
+                 idle_interval: float = 6 * 3600.0, lead_time: timedelta = timedelta(hours=1),
+                 cooldown: timedelta = timedelta(hours=3)):
+        self.live_interval = live_interval
+        self.active_interval = active_interval
+        self.idle_interval = idle_interval
+        self.lead_time = lead_time
+        self.cooldown = cooldown
+
+    def interval(self, events: Iterable[Event], now: Optional[datetime] = None) -> Optional[float]:
+        """Seconds until the next poll, or None when there are no events to go by
+        
+        Args:
+            events: Known events for the source, in any order
+            now: Current time in the timezone of the events' ``event_date`` (UTC by default)
+        """
+        now = now or datetime.utcnow()
+        interval = None
+        for event in events:
+            status = (event.status or "").strip().lower()
+            if status in LIVE_STATUSES:
+                return self.live_interval
+            if status in FINISHED_STATUSES:
+                # event_date is the start; allow for the event's own length in the cooldown
+                active = now - event.event_date <= self.cooldown
+                until_active = None
+            else:
+                active = event.event_date - self.lead_time <= now <= event.event_date + self.cooldown
+                until_active = (event.event_date - self.lead_time - now).total_seconds()
+            if active:
+                candidate = self.active_interval
+            elif until_active is not None and until_active > 0:
+                candidate = max(self.active_interval, min(self.idle_interval, until_active))
+            else:
+                candidate = self.idle_interval
+            interval = candidate if interval is None else min(interval, candidate)
+        return interval
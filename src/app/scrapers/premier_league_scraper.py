@@ -1,9 +1,37 @@
-from .base_scraper import BaseScraper
-from typing import Dict, List, Any, Optional
+from .base_scraper import BaseScraper, FETCH_HTTP_FIRST
+from .polling_policy import AdaptivePollingPolicy
+from .extraction import ExtractionSchema, FieldSpec, safe_int
+from .fixtures import get_fixtures_cache
+from .fixtures_scraper import PremierLeagueFixturesScraper
+from typing import AsyncIterator, Dict, List, Any
 import logging
 from src.app.models.premier_league import PremierLeagueTeam
 
 class PremierLeagueScraper(BaseScraper):
+    schema = ExtractionSchema(
+        row_selector=".table-row",
+        fields={
+            "team_name": FieldSpec(".team-name"),
+            "position": FieldSpec(".position", safe_int),
+            "played": FieldSpec(".played", safe_int),
+            "won": FieldSpec(".won", safe_int),
+            "drawn": FieldSpec(".drawn", safe_int),
+            "lost": FieldSpec(".lost", safe_int),
+            "goals_for": FieldSpec(".for", safe_int),
+            "goals_against": FieldSpec(".against", safe_int),
+            "goal_difference": FieldSpec(".goal-difference", safe_int),
+            "points": FieldSpec(".points", safe_int),
+            "form": FieldSpec(".form"),
+        }
+    )
+    fetch_strategy = FETCH_HTTP_FIRST
+    persistent_profile = True
+    poll_interval = 600
+    polling_policy = AdaptivePollingPolicy(live_interval=120)
+    output_prefix = "premier_league_standings"
+    # Fill next_match from the fixtures list, loaded at most once a day
+    fill_fixtures: bool = True
+    
     def __init__(self):
         super().__init__("https://www.premierleague.com")
         self.logger = logging.getLogger(__name__)
@@ -14,91 +42,35 @@ class PremierLeagueScraper(BaseScraper):
             "goals_for", "goals_against", "goal_difference", "points", "form"
         ]
         
-    async def scrape(self) -> List[Dict[str, Any]]:
-        """Scrape Premier League team data from the official website."""
-        teams = []
-        source_url = "https://www.premierleague.com/tables"
+    def get_source_url(self) -> str:
+        return "https://www.premierleague.com/tables"
         
-        try:
-            # Navigate to the Premier League table page
-            result = await self.crawler.arun(source_url)
-            if not result.success:
-                self.logger.error("Failed to load Premier League table page")
-                return teams
-
-            page = result.page
-            
-            # Get all team rows
-            team_rows = await page.query_selector_all(".table-row")
-            for row in team_rows:
-                try:
-                    team_data = await self._extract_team_data(row)
-                    if not self.validate_data(team_data):
-                        self.logger.warning(f"Skipping team due to missing required fields: {team_data}")
-                        continue
-                        
-                    # Create and validate team using Pydantic model
-                    team = PremierLeagueTeam(
-                        source_url=source_url,
-                        name=team_data["team_name"],
-                        position=team_data["position"],
-                        played=team_data["played"],
-                        won=team_data["won"],
-                        drawn=team_data["drawn"],
-                        lost=team_data["lost"],
-                        goals_for=team_data["goals_for"],
-                        goals_against=team_data["goals_against"],
-                        goal_difference=team_data["goal_difference"],
-                        points=team_data["points"],
-                        form=team_data["form"]
-                    )
-                    teams.append(team.dict())
-                except Exception as e:
-                    self.logger.error(f"Error processing team data: {str(e)}")
-                    continue
-        except Exception as e:
-            self.logger.error(f"Error during scraping: {str(e)}")
-        
-        return teams
-            
-    async def _extract_team_data(self, row) -> Dict[str, Any]:
-        """Extract data for a single team from their row element."""
-        try:
-            position_elem = await row.query_selector(".position")
-            name_elem = await row.query_selector(".team-name")
-            played_elem = await row.query_selector(".played")
-            won_elem = await row.query_selector(".won")
-            drawn_elem = await row.query_selector(".drawn")
-            lost_elem = await row.query_selector(".lost")
-            goals_for_elem = await row.query_selector(".for")
-            goals_against_elem = await row.query_selector(".against")
-            goal_difference_elem = await row.query_selector(".goal-difference")
-            points_elem = await row.query_selector(".points")
-            form_elem = await row.query_selector(".form")
+    async def iter_records(self) -> AsyncIterator[Dict[str, Any]]:
+        """Stream teams with their next match from the day's fixtures"""
+        if not self.fill_fixtures:
+            async for team in super().iter_records():
+                yield team
+            return
             
-            # Extract and convert data with error handling
-            def safe_int(text: Optional[str]) -> int:
-                try:
-                    return int(text) if text else 0
-                except ValueError:
-                    return 0
-                    
-            def safe_str(text: Optional[str]) -> str:
-                return text.strip() if text else ""
+        fixtures = await get_fixtures_cache().get_index(PremierLeagueFixturesScraper)
+        self.events = fixtures.events()
+        async for team in super().iter_records():
+            team["next_match"] = fixtures.next_for(team["name"])
+            yield team
             
-            return {
-                "team_name": safe_str(await name_elem.text_content() if name_elem else ""),
-                "position": safe_int(await position_elem.text_content() if position_elem else ""),
-                "played": safe_int(await played_elem.text_content() if played_elem else ""),
-                "won": safe_int(await won_elem.text_content() if won_elem else ""),
-                "drawn": safe_int(await drawn_elem.text_content() if drawn_elem else ""),
-                "lost": safe_int(await lost_elem.text_content() if lost_elem else ""),
-                "goals_for": safe_int(await goals_for_elem.text_content() if goals_for_elem else ""),
-                "goals_against": safe_int(await goals_against_elem.text_content() if goals_against_elem else ""),
-                "goal_difference": safe_int(await goal_difference_elem.text_content() if goal_difference_elem else ""),
-                "points": safe_int(await points_elem.text_content() if points_elem else ""),
-                "form": safe_str(await form_elem.text_content() if form_elem else "")
-            }
-        except Exception as e:
-            self.logger.error(f"Error extracting team data: {str(e)}")
-            return {} 
\ No newline at end of file
+    def build_record(self, data: Dict[str, Any], source_url: str) -> PremierLeagueTeam:
+        """Create and validate a team using the Pydantic model."""
+        return PremierLeagueTeam(
+            source_url=source_url,
+            name=data["team_name"],
+            position=data["position"],
+            played=data["played"],
+            won=data["won"],
+            drawn=data["drawn"],
+            lost=data["lost"],
+            goals_for=data["goals_for"],
+            goals_against=data["goals_against"],
+            goal_difference=data["goal_difference"],
+            points=data["points"],
+            form=data["form"]
+        )
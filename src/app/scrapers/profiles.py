@@ -0,0 +1,77 @@
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+import logging
+
+class ProfileCache:
+    """Persistent cache of scraped athlete profile pages.
+
+    Entries are keyed by profile URL and remember the fight record the
+    athlete had when the profile was fetched. A profile is reused until that
+    record changes (i.e. after the athlete's next bout) or, if ``max_age`` is
+    set, until it is older than ``max_age`` seconds.
+
+    Updates are kept in memory until ``flush()`` so a cycle that refreshes
+    many profiles writes the file once. With ``path`` None the cache lives in
+    memory only.
+    """
+
+    def __init__(self, path: Optional[str] = "data/state/ufc_profiles.json", max_age: Optional[float] = None):
+        self.path = path
+        self.max_age = max_age
+        self.logger = logging.getLogger(__name__)
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            if self.path is None:
+                self._entries = {}
+                return self._entries
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, url: str, record: str) -> Optional[Dict[str, Any]]:
+        """Get the cached profile for ``url`` if it is still current for ``record``"""
+        entry = self._load().get(url)
+        if entry is None or entry.get("record") != record:
+            return None
+        if self.max_age is not None and time.time() - entry.get("fetched_at", 0) > self.max_age:
+            return None
+        return entry.get("profile")
+
+    def set(self, url: str, record: str, profile: Dict[str, Any]) -> None:
+        """Store the profile fetched for ``url`` while the athlete's record was ``record``"""
+        self._load()[url] = {"record": record, "profile": profile, "fetched_at": time.time()}
+        self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def flush(self) -> None:
+        """Persist pending updates"""
+        if not self._dirty or self.path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._load(), f, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            self.logger.error(f"Failed to persist profiles to {self.path}: {str(e)}")
+
+_shared_cache: Optional[ProfileCache] = None
+
+def get_profile_cache() -> ProfileCache:
+    """Get the process-wide profile cache"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = ProfileCache()
+    return _shared_cache
@@ -0,0 +1,167 @@
+import os
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+import logging
+
+# Innermost frames of worker threads waiting for work; such samples are dropped
+IDLE_FRAMES = {
+    ("thread.py", "_worker"),
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+}
+
+logger = logging.getLogger(__name__)
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    path = code.co_filename
+    if path.startswith(os.getcwd() + os.sep):
+        path = os.path.relpath(path)
+    else:
+        # site-packages and stdlib paths: keep the package and module
+        path = os.sep.join(path.split(os.sep)[-2:])
+    return f"{code.co_name} ({path}:{code.co_firstlineno})".replace(";", ":")
+
+def _is_idle(frame) -> bool:
+    return (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name) in IDLE_FRAMES
+
+class StackSampler:
+    """Wall-clock sampling profiler for every thread of this process.
+
+    A daemon thread snapshots the stack of each thread every ``interval``
+    seconds and counts identical stacks, rooted at the thread's name. Worker
+    threads idling for work are skipped; the event loop waiting in ``select``
+    is kept, as that is time spent waiting on the network. Coroutines that
+    are suspended are not on any stack, so a sample shows the code that was
+    running, not everything in flight. Work sent to the process pool is not
+    sampled.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        """Record the current stack of every other thread"""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        own = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == own or _is_idle(frame):
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.append(names.get(ident, f"thread-{ident}"))
+            self.stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def top_functions(self, n: int = 10) -> List[Tuple[str, int]]:
+        """Functions most often running at the top of a stack (self time)"""
+        leaves: Counter = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return leaves.most_common(n)
+
+    def write_folded(self, path: str) -> None:
+        """Write the samples as folded stacks (``frame;frame;frame count``), the
+        input format of flamegraph.pl, speedscope and inferno"""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+def write_allocations(path: str, before: tracemalloc.Snapshot, after: tracemalloc.Snapshot,
+                      peak: int, limit: int = 25) -> None:
+    """Write the ``limit`` source lines whose live allocations grew the most between two snapshots"""
+    ignored = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    )
+    diff = after.filter_traces(ignored).compare_to(before.filter_traces(ignored), "lineno")
+    diff.sort(key=lambda stat: stat.size_diff, reverse=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"Peak traced memory: {peak / (1024 * 1024):.1f} MB\n")
+        f.write(f"Top {limit} allocation sites by growth in live memory:\n")
+        for stat in diff[:limit]:
+            frame = stat.traceback[0]
+            f.write(
+                f"{stat.size_diff / 1024:+10.1f} KiB {stat.count_diff:+8d} blocks  "
+                f"{frame.filename}:{frame.lineno}\n"
+            )
+
+class ScrapeProfiler:
+    """Profiles scrape runs one at a time, writing one set of files per run.
+
+    For each ``profile(name)`` block it writes ``<name>.folded`` (sampled
+    stacks for a flame graph) and ``<name>.allocations.txt`` (peak traced
+    memory and the top allocation sites) to ``directory``. tracemalloc slows
+    allocation-heavy code, so profiled timings are only comparable with each
+    other.
+
+    Args:
+        directory: Where the profiles are written
+        interval: Seconds between stack samples
+        top_allocations: Allocation sites listed per run
+        frames: Frames kept per allocation traceback
+    """
+
+    def __init__(self, directory: str, interval: float = 0.005, top_allocations: int = 25, frames: int = 1):
+        self.directory = directory
+        self.interval = interval
+        self.top_allocations = top_allocations
+        self.frames = frames
+
+    @contextmanager
+    def profile(self, name: str) -> Iterator[StackSampler]:
+        """Sample stacks and trace allocations while the enclosed code runs as ``name``"""
+        os.makedirs(self.directory, exist_ok=True)
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(self.frames)
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        sampler = StackSampler(self.interval)
+        sampler.start()
+        try:
+            yield sampler
+        finally:
+            sampler.stop()
+            after = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+            folded = os.path.join(self.directory, f"{name}.folded")
+            allocations = os.path.join(self.directory, f"{name}.allocations.txt")
+            sampler.write_folded(folded)
+            write_allocations(allocations, before, after, peak, self.top_allocations)
+            logger.info(
+                f"Profiled {name}: {sampler.samples} samples to {folded}, "
+                f"peak {peak / (1024 * 1024):.1f} MB, allocations in {allocations}"
+            )
+            for label, count in sampler.top_functions(5):
+                logger.info(f"  {count / max(sampler.samples, 1):6.1%}  {label}")
@@ -0,0 +1,27 @@
+from typing import Dict, Type
+from .base_scraper import BaseScraper
+from .ufc_scraper import UFCScraper
+from .premier_league_scraper import PremierLeagueScraper
+from .formula1_scraper import Formula1Scraper
+
+# Scrapers addressable by name in queued jobs
+SCRAPERS: Dict[str, Type[BaseScraper]] = {
+    "ufc": UFCScraper,
+    "premier_league": PremierLeagueScraper,
+    "formula1": Formula1Scraper,
+}
+
+def register_scraper(name: str, scraper_cls: Type[BaseScraper]) -> None:
+    """Make ``scraper_cls`` available to queued jobs as ``name``"""
+    SCRAPERS[name] = scraper_cls
+
+def get_scraper_class(name: str) -> Type[BaseScraper]:
+    """Look up a registered scraper class
+    
+    Raises:
+        KeyError: If no scraper is registered under ``name``
+    """
+    try:
+        return SCRAPERS[name]
+    except KeyError:
+        raise KeyError(f"Unknown scraper: {name}") from None
@@ -0,0 +1,94 @@
+from crawl4ai import CrawlerRunConfig
+from typing import Any, FrozenSet, Iterable, Optional
+from urllib.parse import urlsplit
+
+# Playwright resource types that table pages never need: the rows are in the
+# document and the scripts/XHR that render it
+DEFAULT_BLOCKED_TYPES = frozenset({"image", "media", "font", "texttrack"})
+
+# Ad, analytics, tag-manager and video-player hosts (subdomains included)
+DEFAULT_BLOCKED_DOMAINS = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "amazon-adsystem.com",
+    "adnxs.com",
+    "criteo.com",
+    "taboola.com",
+    "outbrain.com",
+    "facebook.net",
+    "hotjar.com",
+    "scorecardresearch.com",
+    "chartbeat.com",
+    "optimizely.com",
+    "nr-data.net",
+    "brightcove.net",
+    "jwpcdn.com",
+)
+
+# Key of the rules in CrawlerRunConfig.shared_data, read by block_resources()
+RULES_KEY = "resource_block_rules"
+
+def _normalize_domain(domain: str) -> str:
+    return domain.strip().lower().lstrip(".")
+
+class ResourceBlockRules:
+    """Requests a browser page aborts instead of loading.
+
+    A request is blocked when its Playwright resource type is in
+    ``resource_types`` or its host is (a subdomain of) one of ``domains``,
+    unless the host is in ``allow_domains``. Documents are never blocked.
+
+    Args:
+        resource_types: Resource types to block (e.g. "image", "font", "stylesheet")
+        domains: Hosts whose requests are blocked, including their subdomains
+        allow_domains: Hosts that are always loaded, overriding ``domains``
+    """
+
+    def __init__(self, resource_types: Iterable[str] = DEFAULT_BLOCKED_TYPES,
+                 domains: Iterable[str] = DEFAULT_BLOCKED_DOMAINS,
+                 allow_domains: Iterable[str] = ()):
+        self.resource_types: FrozenSet[str] = frozenset(resource_types)
+        self.domains: FrozenSet[str] = frozenset(_normalize_domain(d) for d in domains)
+        self.allow_domains: FrozenSet[str] = frozenset(_normalize_domain(d) for d in allow_domains)
+
+    @staticmethod
+    def _matches(host: str, domains: FrozenSet[str]) -> bool:
+        # Check the host and each parent domain: a.b.example.com, b.example.com, ...
+        parts = host.split(".")
+        return any(".".join(parts[i:]) in domains for i in range(len(parts) - 1))
+
+    def blocks(self, resource_type: str, url: str) -> bool:
+        """Whether a request of ``resource_type`` for ``url`` should be aborted"""
+        if resource_type == "document":
+            return False
+        host = (urlsplit(url).hostname or "").lower()
+        if self.allow_domains and self._matches(host, self.allow_domains):
+            return False
+        return resource_type in self.resource_types or self._matches(host, self.domains)
+
+def run_config(rules: Optional[ResourceBlockRules]) -> Optional[CrawlerRunConfig]:
+    """Crawler run config carrying ``rules`` to the page hook (None without rules)"""
+    if rules is None:
+        return None
+    return CrawlerRunConfig(shared_data={RULES_KEY: rules})
+
+async def block_resources(page: Any, context: Any = None, config: Optional[CrawlerRunConfig] = None,
+                          **kwargs: Any) -> Any:
+    """``on_page_context_created`` hook routing the page's requests through its run's rules"""
+    shared = getattr(config, "shared_data", None) or {}
+    rules: Optional[ResourceBlockRules] = shared.get(RULES_KEY)
+    if rules is None:
+        return page
+
+    async def route_request(route):
+        request = route.request
+        if rules.blocks(request.resource_type, request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await page.route("**/*", route_request)
+    return page
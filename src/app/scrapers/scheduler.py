@@ -0,0 +1,159 @@
+import asyncio
+import bisect
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
+from urllib.parse import urlsplit
+import logging
+from src.app.models.config import SchedulerConfig
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 10
+PRIORITY_LOW = 20
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate`` tokens per second."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def try_take(self, now: Optional[float] = None) -> float:
+        """Take a token if one is available
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until one is available
+        """
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+class _Waiter:
+    def __init__(self, priority: int, sequence: int, host: str, future: asyncio.Future):
+        self.priority = priority
+        self.sequence = sequence
+        self.host = host
+        self.future = future
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.sequence) < (other.priority, other.sequence)
+
+class RequestScheduler:
+    """Admits scraper requests under per-host rate limits and a global cap.
+
+    Waiting requests are granted in priority order (lower value first, FIFO
+    within a priority). A request whose host is out of tokens or at its
+    concurrency limit does not block requests to other hosts behind it.
+    """
+
+    def __init__(self, config: Optional[SchedulerConfig] = None):
+        self.config = config or SchedulerConfig()
+        self.logger = logging.getLogger(__name__)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._host_active: Dict[str, int] = {}
+        self._active = 0
+        self._waiters: List[_Waiter] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def active(self) -> int:
+        """Number of requests currently holding a slot"""
+        return self._active
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlsplit(url).hostname or url
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate = self.config.host_rates.get(host, self.config.default_rate)
+            bucket = TokenBucket(rate, self.config.default_burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    def _dispatch(self) -> None:
+        self._timer = None
+        retry_in: Optional[float] = None
+        now = time.monotonic()
+        for waiter in list(self._waiters):
+            if self._active >= self.config.max_concurrency:
+                break
+            if waiter.future.done():
+                self._waiters.remove(waiter)
+                continue
+            if self._host_active.get(waiter.host, 0) >= self.config.max_per_host:
+                continue
+            wait = self._bucket(waiter.host).try_take(now)
+            if wait > 0:
+                retry_in = wait if retry_in is None else min(retry_in, wait)
+                continue
+            self._waiters.remove(waiter)
+            self._active += 1
+            self._host_active[waiter.host] = self._host_active.get(waiter.host, 0) + 1
+            waiter.future.set_result(None)
+
+        if retry_in is not None and self._waiters:
+            self._timer = asyncio.get_running_loop().call_later(retry_in, self._dispatch)
+
+    def _release(self, host: str) -> None:
+        self._active -= 1
+        self._host_active[host] -= 1
+        if self._timer is not None:
+            self._timer.cancel()
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, url: str, priority: int = PRIORITY_NORMAL) -> AsyncIterator[None]:
+        """Wait for permission to send a request to ``url``
+
+        Args:
+            url: Request URL; its host selects the rate limit
+            priority: Lower values are admitted first
+        """
+        host = self.host_of(url)
+        waiter = _Waiter(priority, next(self._sequence), host, asyncio.get_running_loop().create_future())
+        bisect.insort(self._waiters, waiter)
+        if self._timer is not None:
+            self._timer.cancel()
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif waiter.future.done() and not waiter.future.cancelled():
+                # Granted just before cancellation: hand the slot back
+                self._release(host)
+            raise
+
+        try:
+            yield
+        finally:
+            self._release(host)
+
+_shared_scheduler: Optional[RequestScheduler] = None
+
+def get_scheduler() -> RequestScheduler:
+    """Get the process-wide request scheduler"""
+    global _shared_scheduler
+    if _shared_scheduler is None:
+        _shared_scheduler = RequestScheduler()
+    return _shared_scheduler
+
+def configure_scheduler(config: SchedulerConfig) -> RequestScheduler:
+    """Replace the process-wide request scheduler with one built from ``config``"""
+    global _shared_scheduler
+    _shared_scheduler = RequestScheduler(config)
+    return _shared_scheduler
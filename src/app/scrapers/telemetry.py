@@ -0,0 +1,388 @@
+import asyncio
+import json
+import math
+import os
+import random
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from itertools import count
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+import logging
+from src.app.models.analytics import PerformanceMetrics
+from src.app.models.config import TelemetryConfig
+
+SERVICE_NAME = "crawl4sports"
+
+# OTLP span kind and status codes
+SPAN_KIND_INTERNAL = 1
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+logger = logging.getLogger(__name__)
+
+class LatencyHistogram:
+    """Log-linear histogram of latencies in microseconds, in the style of HdrHistogram.
+
+    Values below ``2 ** precision_bits`` are counted exactly; above that each
+    power of two is split into ``2 ** (precision_bits - 1)`` equal buckets, so
+    every value is recorded with a relative error of at most
+    ``2 ** -(precision_bits - 1)`` (1.6% with the default 7 bits). Recording is
+    a few integer operations and one dict update, and memory grows with the
+    number of distinct buckets hit rather than with the number of samples.
+    """
+
+    def __init__(self, precision_bits: int = 7):
+        self.precision_bits = precision_bits
+        self._sub_buckets = 1 << precision_bits
+        self._half = self._sub_buckets >> 1
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_buckets:
+            return value
+        shift = value.bit_length() - self.precision_bits
+        return self._sub_buckets + (shift - 1) * self._half + (value >> shift) - self._half
+
+    def bounds(self, index: int) -> Tuple[int, int]:
+        """Lowest and highest value counted in bucket ``index``"""
+        if index < self._sub_buckets:
+            return index, index
+        offset = index - self._sub_buckets
+        shift = offset // self._half + 1
+        low = (offset % self._half + self._half) << shift
+        return low, low + (1 << shift) - 1
+
+    def record(self, micros: int) -> None:
+        """Count one latency of ``micros`` microseconds"""
+        micros = max(0, micros)
+        index = self._index(micros)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += micros
+        if self.min is None or micros < self.min:
+            self.min = micros
+        if micros > self.max:
+            self.max = micros
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the samples of ``other`` (recorded with the same precision)"""
+        if other.precision_bits != self.precision_bits:
+            raise ValueError("Cannot merge histograms of different precision")
+        for index, n in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + n
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q: float) -> int:
+        """Nearest-rank percentile ``q`` (0-100) in microseconds, 0 when empty
+
+        Returns the highest value of the bucket holding the rank, capped by
+        the largest value recorded.
+        """
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self.bounds(index)[1], self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+class Span:
+    """One timed stage of a scrape, nested under the span that was current when it started."""
+
+    def __init__(self, name: str, trace_id: int, parent_id: Optional[int], source: Optional[str],
+                 attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = random.getrandbits(64)
+        self.parent_id = parent_id
+        self.source = source
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self._started = time.perf_counter_ns()
+        self.duration_ns: Optional[int] = None
+        # Time actually spent in the stage when it is interleaved with others
+        self.busy_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def add_busy(self, nanoseconds: int) -> None:
+        """Count ``nanoseconds`` of work towards this stage's busy time"""
+        self.busy_ns = (self.busy_ns or 0) + nanoseconds
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        if self.duration_ns is not None:
+            return
+        self.duration_ns = time.perf_counter_ns() - self._started
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}" if str(error) else type(error).__name__
+
+    @property
+    def latency_ns(self) -> int:
+        """Latency recorded in the stage histogram: busy time if tracked, else duration"""
+        return self.busy_ns if self.busy_ns is not None else (self.duration_ns or 0)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """This span in the OTLP/JSON trace format"""
+        attributes = dict(self.attributes)
+        if self.source is not None:
+            attributes["source"] = self.source
+        if self.busy_ns is not None:
+            attributes["busy_ms"] = round(self.busy_ns / 1e6, 3)
+        return {
+            "traceId": f"{self.trace_id:032x}",
+            "spanId": f"{self.span_id:016x}",
+            "parentSpanId": f"{self.parent_id:016x}" if self.parent_id is not None else "",
+            "name": self.name,
+            "kind": SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.start_ns + (self.duration_ns or 0)),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()],
+            "status": {"code": STATUS_ERROR, "message": self.error} if self.error else {"code": STATUS_OK},
+        }
+
+class _NoopSpan:
+    """Stands in for a span while telemetry is disabled."""
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def add_busy(self, nanoseconds: int) -> None:
+        pass
+
+_NOOP_SPAN = _NoopSpan()
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # OTLP/JSON encodes 64-bit integers as strings
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+def current_span() -> Optional[Span]:
+    """Span of the enclosing stage, inherited by tasks spawned from it"""
+    return _current_span.get()
+
+class Telemetry:
+    """Stage latency histograms and trace spans for scrape runs.
+
+    Every stage (fetch, render, extract, validate, write, ...) is timed as a
+    span nested under the span that was current when it started, so one
+    source's cycle forms a trace. Finished spans feed a latency histogram per
+    (stage, source) and are kept, up to ``max_spans``, for export.
+
+    ``export()`` appends the pending spans to ``traces.jsonl`` as one OTLP/JSON
+    ``ExportTraceServiceRequest`` per line (the OpenTelemetry file exporter
+    format) and the histogram summaries to ``metrics.jsonl`` as
+    ``PerformanceMetrics`` records. Histograms accumulate for the life of the
+    process, so every export writes a cumulative snapshot.
+    """
+
+    def __init__(self, config: Optional[TelemetryConfig] = None):
+        self.config = config or TelemetryConfig()
+        self.histograms: Dict[Tuple[str, Optional[str]], LatencyHistogram] = {}
+        self._spans: Deque[Span] = deque(maxlen=self.config.max_spans)
+        self._metric_ids = count(1)
+        self.dropped_spans = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    def start_span(self, name: str, source: Optional[str] = None, **attributes: Any) -> Any:
+        """Start a span under the current one without making it current; end it with ``finish()``"""
+        if not self.config.enabled:
+            return _NOOP_SPAN
+        parent = _current_span.get()
+        if parent is None:
+            return Span(name, random.getrandbits(128), None, source, attributes)
+        return Span(name, parent.trace_id, parent.span_id, source or parent.source, attributes)
+
+    def finish(self, span: Any, error: Optional[BaseException] = None) -> None:
+        """End ``span``, count it in its stage histogram and queue it for export"""
+        if not isinstance(span, Span):
+            return
+        span.end(error)
+        key = (span.name, span.source)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = LatencyHistogram(self.config.precision_bits)
+        histogram.record(span.latency_ns // 1000)
+        if len(self._spans) == self._spans.maxlen:
+            self.dropped_spans += 1
+        self._spans.append(span)
+
+    @contextmanager
+    def span(self, name: str, source: Optional[str] = None, activate: bool = True,
+             **attributes: Any) -> Iterator[Any]:
+        """Time the enclosed code as stage ``name``
+
+        Args:
+            name: Stage name, e.g. "fetch" or "extract"
+            source: Source the stage belongs to (the parent span's when None)
+            activate: Make the span current so stages started inside nest under
+                it; pass False where the block yields to unrelated work, e.g.
+                in an async generator
+            attributes: Extra span attributes
+
+        Yields:
+            The span, for setting attributes and busy time
+        """
+        span = self.start_span(name, source, **attributes)
+        if not isinstance(span, Span):
+            yield span
+            return
+        token = _current_span.set(span) if activate else None
+        error = None
+        try:
+            yield span
+        except GeneratorExit:
+            raise
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if token is not None:
+                _current_span.reset(token)
+            self.finish(span, error)
+
+    def histogram(self, stage: str, source: Optional[str] = None) -> Optional[LatencyHistogram]:
+        """Latency histogram of ``stage`` for ``source``, or None if it never ran"""
+        return self.histograms.get((stage, source))
+
+    def summary(self) -> List[str]:
+        """One line per stage and source with its count and p50/p99/max latency"""
+        lines = []
+        for (stage, source), h in sorted(self.histograms.items(), key=lambda item: (str(item[0][1]), item[0][0])):
+            lines.append(
+                f"{source or '-'} {stage}: {h.count} runs, p50 {h.percentile(50) / 1000:.1f} ms, "
+                f"p99 {h.percentile(99) / 1000:.1f} ms, max {h.max / 1000:.1f} ms"
+            )
+        return lines
+
+    def to_metrics(self, timestamp: Optional[datetime] = None) -> List[PerformanceMetrics]:
+        """Summarise every stage histogram as ``PerformanceMetrics`` records
+
+        Each (stage, source) yields its count and its mean, p50, p90, p99 and
+        max latency in milliseconds. The count record carries the histogram's
+        buckets in its metadata so summaries can be merged later.
+        """
+        timestamp = timestamp or datetime.utcnow()
+        metrics = []
+        for (stage, source), h in self.histograms.items():
+            tags = [f"stage:{stage}"] + ([f"source:{source}"] if source else [])
+            values = [
+                ("count", float(h.count), "count"),
+                ("mean", h.mean / 1000, "ms"),
+                ("p50", h.percentile(50) / 1000, "ms"),
+                ("p90", h.percentile(90) / 1000, "ms"),
+                ("p99", h.percentile(99) / 1000, "ms"),
+                ("max", h.max / 1000, "ms"),
+            ]
+            for stat, value, unit in values:
+                metadata = {"stage": stage, "source": source, "stat": stat}
+                if stat == "count":
+                    metadata["histogram"] = {
+                        "precision_bits": h.precision_bits,
+                        "counts": {str(index): n for index, n in sorted(h.counts.items())},
+                    }
+                metrics.append(PerformanceMetrics(
+                    metric_id=next(self._metric_ids),
+                    timestamp=timestamp,
+                    metric_type=f"scrape.{stage}.latency.{stat}" if unit == "ms" else f"scrape.{stage}.count",
+                    value=value,
+                    unit=unit,
+                    tags=tags,
+                    metadata=metadata,
+                ))
+        return metrics
+
+    def drain_spans(self) -> List[Span]:
+        """Remove and return the finished spans not exported yet"""
+        spans = list(self._spans)
+        self._spans.clear()
+        return spans
+
+    def _collect(self) -> Tuple[List[Dict[str, Any]], List[str]]:
+        # Taken on the event loop, where spans finish, so nothing changes mid-export
+        spans = [span.to_otlp() for span in self.drain_spans()]
+        metrics = [metric.json() for metric in self.to_metrics()]
+        if self.dropped_spans:
+            logger.warning(f"Dropped {self.dropped_spans} spans beyond max_spans={self.config.max_spans}")
+            self.dropped_spans = 0
+        return spans, metrics
+
+    @staticmethod
+    def _write(directory: str, spans: List[Dict[str, Any]], metrics: List[str]) -> None:
+        os.makedirs(directory, exist_ok=True)
+        if spans:
+            request = {"resourceSpans": [{
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+                "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+            }]}
+            with open(os.path.join(directory, "traces.jsonl"), "a", encoding="utf-8") as f:
+                f.write(json.dumps(request) + "\n")
+        if metrics:
+            with open(os.path.join(directory, "metrics.jsonl"), "a", encoding="utf-8") as f:
+                f.writelines(metric + "\n" for metric in metrics)
+
+    def export(self, directory: Optional[str] = None) -> int:
+        """Append pending spans to ``traces.jsonl`` and stage metrics to ``metrics.jsonl``
+
+        Returns:
+            int: Number of spans written
+        """
+        if not self.config.enabled:
+            return 0
+        spans, metrics = self._collect()
+        self._write(directory or self.config.directory, spans, metrics)
+        return len(spans)
+
+    async def export_periodically(self, interval: Optional[float] = None) -> None:
+        """Export every ``interval`` seconds (``export_interval`` by default) until cancelled"""
+        interval = interval or self.config.export_interval
+        while self.config.enabled:
+            await asyncio.sleep(interval)
+            spans, metrics = self._collect()
+            try:
+                await asyncio.to_thread(self._write, self.config.directory, spans, metrics)
+            except OSError as e:
+                logger.error(f"Failed to export telemetry: {str(e)}")
+
+_shared_telemetry: Optional[Telemetry] = None
+
+def get_telemetry() -> Telemetry:
+    """Get the process-wide telemetry recorder, creating it with defaults if needed"""
+    global _shared_telemetry
+    if _shared_telemetry is None:
+        _shared_telemetry = Telemetry()
+    return _shared_telemetry
+
+def configure_telemetry(config: TelemetryConfig) -> Telemetry:
+    """Replace the process-wide telemetry recorder with one built from ``config``"""
+    global _shared_telemetry
+    _shared_telemetry = Telemetry(config)
+    return _shared_telemetry
@@ -1,96 +1,167 @@
-from .base_scraper import BaseScraper
-from typing import Dict, List, Any, Optional
+import asyncio
+from collections import deque
+from .base_scraper import BaseScraper, FETCH_HTTP_FIRST
+from .polling_policy import AdaptivePollingPolicy
+from .extraction import ExtractionSchema, FieldSpec, extract_from_html, optional_int
+from .fetch_archive import archiving
+from .fetcher import fetch_http
+from .profiles import ProfileCache, get_profile_cache
+from .scheduler import PRIORITY_LOW
+from typing import AsyncIterator, Dict, List, Any, Optional
+from urllib.parse import urljoin
 import logging
 from src.app.models.ufc import UFCFighter
+from src.app.services.deadline import DeadlineExceeded, child_deadline, within_deadline
+
+def safe_rank(text: Optional[str]) -> str:
+    """Keep only the digits of a rank, falling back to "0" when there are none"""
+    try:
+        # Remove any non-numeric characters and convert to int
+        rank = ''.join(filter(str.isdigit, text)) if text else "0"
+        return str(int(rank))
+    except ValueError:
+        return "0"
+
+# Biography fields on a fighter's profile page
+PROFILE_SCHEMA = ExtractionSchema(
+    row_selector="body",
+    fields={
+        "country": FieldSpec(".c-bio__field--country .c-bio__text"),
+        "age": FieldSpec(".c-bio__field--age .c-bio__text", optional_int),
+        "height": FieldSpec(".c-bio__field--height .c-bio__text"),
+        "reach": FieldSpec(".c-bio__field--reach .c-bio__text"),
+        "last_fight": FieldSpec(".c-card-event--athlete-results__date"),
+    }
+)
 
 class UFCScraper(BaseScraper):
+    # Fighter rows are listed under their weight-class header; both are read in
+    # a single document-order pass
+    schema = ExtractionSchema(
+        row_selector=".view-grouping-content .views-row",
+        group_selector=".view-grouping-header",
+        group_field="weight_class",
+        fields={
+            "name": FieldSpec(".views-field-title"),
+            "rank": FieldSpec(".views-field-weight-class-rank", safe_rank),
+            "record": FieldSpec(".views-field-record"),
+            "profile_url": FieldSpec(".views-field-title a", attribute="href"),
+        }
+    )
+    fetch_strategy = FETCH_HTTP_FIRST
+    persistent_profile = True
+    # Rankings are updated weekly
+    poll_interval = 3600
+    polling_policy = AdaptivePollingPolicy(live_interval=300)
+    output_prefix = "ufc_standings"
+    # Fill country, age, height, reach and last_fight from each fighter's
+    # profile page, fetching at most profile_concurrency pages at once;
+    # profiles are cached until the fighter's record changes
+    enrich_profiles: bool = True
+    profile_concurrency: int = 8
+    
     def __init__(self):
         super().__init__("https://www.ufc.com")
+        self._run_profiles: Optional[ProfileCache] = None
         self.logger = logging.getLogger(__name__)
         
     def get_required_fields(self) -> List[str]:
         return ["name", "record", "weight_class", "rank"]
         
-    async def scrape(self) -> List[Dict[str, Any]]:
-        """Scrape UFC fighter data from the official UFC rankings page."""
-        fighters = []
-        source_url = "https://www.ufc.com/rankings"
+    def get_source_url(self) -> str:
+        return "https://www.ufc.com/rankings"
         
-        try:
-            # Navigate to the UFC rankings page
-            result = await self.crawler.arun(source_url)
-            if not result.success:
-                self.logger.error("Failed to load UFC rankings page")
-                return fighters
-
-            page = result.page
-            
-            # Get all weight classes
-            weight_class_elements = await page.query_selector_all(".view-grouping-header")
-            for weight_class_elem in weight_class_elements:
-                try:
-                    weight_class = await weight_class_elem.text_content()
-                    if not weight_class:
-                        continue
-                        
-                    # Get all fighters in this weight class
-                    fighter_rows = await page.query_selector_all(f".view-grouping-content:has(+ .view-grouping-header:contains('{weight_class}')) .views-row")
-                    for row in fighter_rows:
-                        try:
-                            fighter_data = await self._extract_fighter_data(row, weight_class)
-                            if not self.validate_data(fighter_data):
-                                self.logger.warning(f"Skipping fighter due to missing required fields: {fighter_data}")
-                                continue
-                                
-                            # Create and validate fighter using Pydantic model
-                            fighter = UFCFighter(
-                                source_url=source_url,
-                                name=fighter_data["name"],
-                                rank=fighter_data["rank"],
-                                record=fighter_data["record"],
-                                weight_class=fighter_data["weight_class"]
-                            )
-                            fighters.append(fighter.dict())
-                        except Exception as e:
-                            self.logger.error(f"Error processing fighter data: {str(e)}")
-                            continue
-                except Exception as e:
-                    self.logger.error(f"Error processing weight class {weight_class}: {str(e)}")
-                    continue
-        except Exception as e:
-            self.logger.error(f"Error during scraping: {str(e)}")
+    @property
+    def profiles(self) -> ProfileCache:
+        """Cache of fighter profiles from previous runs
         
-        return fighters
-            
-    async def _extract_fighter_data(self, row, weight_class: str) -> Dict[str, Any]:
-        """Extract data for a single fighter from their row element."""
+        While fetches are archived the profiles are kept for this scraper's
+        runs only, so every profile page is recorded or replayed.
+        """
+        if archiving():
+            if self._run_profiles is None:
+                self._run_profiles = ProfileCache(path=None)
+            return self._run_profiles
+        return get_profile_cache()
+        
+    async def fetch_profile(self, url: str) -> Optional[Dict[str, Any]]:
+        """Fetch and parse one fighter's profile page
+        
+        Returns:
+            Optional[Dict[str, Any]]: Converted biography fields, or None if the page failed to load
+        """
+        async with self.scheduler.slot(url, PRIORITY_LOW):
+            snapshot = await fetch_http(url)
+        if snapshot is None:
+            snapshot = await self.fetch(url)
+        if snapshot is None:
+            return None
+        rows = await asyncio.to_thread(extract_from_html, snapshot.html, PROFILE_SCHEMA)
+        if not rows:
+            return None
+        return PROFILE_SCHEMA.convert(rows[0])
+        
+    async def enrich(self, fighter: Dict[str, Any], semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """Add profile fields to a validated fighter record
+        
+        The record is returned unchanged if the profile cannot be loaded in
+        time or its fields do not validate.
+        """
+        url = fighter.get("profile_url")
+        if not url:
+            return fighter
+        profile = self.profiles.get(url, fighter["record"])
+        if profile is None:
+            try:
+                async with semaphore:
+                    profile = await within_deadline(self.fetch_profile(url), child_deadline(self.request_timeout))
+            except DeadlineExceeded:
+                self.logger.warning(f"Profile {url} missed its deadline")
+                return fighter
+            except Exception as e:
+                self.logger.error(f"Failed to fetch profile {url}: {str(e)}")
+                return fighter
+            if profile is None:
+                return fighter
+            self.profiles.set(url, fighter["record"], profile)
+        updates = {name: value for name, value in profile.items() if value not in (None, "")}
         try:
-            name_elem = await row.query_selector(".views-field-title")
-            rank_elem = await row.query_selector(".views-field-weight-class-rank")
-            record_elem = await row.query_selector(".views-field-record")
-            
-            # Extract and convert data with error handling
-            def safe_str(text: Optional[str]) -> str:
-                return text.strip() if text else ""
+            return UFCFighter(**{**fighter, **updates}).dict()
+        except Exception as e:
+            self.logger.warning(f"Ignoring invalid profile {url}: {str(e)}")
+            return fighter
             
-            def safe_rank(text: Optional[str]) -> str:
-                try:
-                    # Remove any non-numeric characters and convert to int
-                    rank = ''.join(filter(str.isdigit, text)) if text else "0"
-                    return str(int(rank))
-                except ValueError:
-                    return "0"
+    async def iter_records(self) -> AsyncIterator[Dict[str, Any]]:
+        """Stream ranked fighters, enriched with their profiles, in ranking order"""
+        if not self.enrich_profiles:
+            async for fighter in super().iter_records():
+                yield fighter
+            return
             
-            name = safe_str(await name_elem.text_content() if name_elem else "")
-            rank = safe_rank(await rank_elem.text_content() if rank_elem else "")
-            record = safe_str(await record_elem.text_content() if record_elem else "")
+        semaphore = asyncio.Semaphore(self.profile_concurrency)
+        pending = deque()
+        try:
+            async for fighter in super().iter_records():
+                pending.append(asyncio.create_task(self.enrich(fighter, semaphore)))
+                while pending and pending[0].done():
+                    yield pending.popleft().result()
+                # Bound the fighters held while waiting on slow profiles
+                if len(pending) >= 2 * self.profile_concurrency:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+            self.profiles.flush()
             
-            return {
-                "name": name,
-                "rank": rank,
-                "record": record,
-                "weight_class": safe_str(weight_class)
-            }
-        except Exception as e:
-            self.logger.error(f"Error extracting fighter data: {str(e)}")
-            return {} 
\ No newline at end of file
+    def build_record(self, data: Dict[str, Any], source_url: str) -> UFCFighter:
+        """Create and validate a fighter using the Pydantic model."""
+        return UFCFighter(
+            source_url=source_url,
+            name=data["name"],
+            rank=data["rank"],
+            record=data["record"],
+            weight_class=data["weight_class"],
+            profile_url=urljoin(source_url, data["profile_url"]) if data["profile_url"] else None
+        )
@@ -0,0 +1,398 @@
+import asyncio
+import json
+import os
+import sqlite3
+import time
+import uuid
+from typing import Any, Dict, Optional
+import logging
+from src.app.models.config import WorkQueueConfig
+
+STATE_QUEUED = "queued"
+STATE_LEASED = "leased"
+STATE_DONE = "done"
+STATE_DEAD = "dead"
+
+logger = logging.getLogger(__name__)
+
+class Job:
+    """A unit of scrape work: which scraper to run against which URL."""
+
+    def __init__(self, scraper: str, url: str, params: Optional[Dict[str, Any]] = None,
+                 dedupe_key: Optional[str] = None, job_id: Optional[str] = None, attempts: int = 0,
+                 lease_token: Optional[str] = None):
+        self.scraper = scraper
+        self.url = url
+        self.params = params or {}
+        # Only one job per key can be queued or leased at a time
+        self.dedupe_key = dedupe_key or f"{scraper}:{url}"
+        self.job_id = job_id
+        self.attempts = attempts
+        self.lease_token = lease_token
+
+    def __repr__(self) -> str:
+        return f"Job({self.job_id}, {self.scraper}, {self.url})"
+
+class WorkQueue:
+    """Job queue with leases, visibility timeouts and acknowledgements.
+
+    A leased job is hidden from other workers for ``visibility_timeout``
+    seconds. The worker must ``ack`` it (or ``extend`` the lease) before then;
+    otherwise the job becomes visible again and is re-leased, until it has been
+    leased ``max_attempts`` times and is marked dead. Acks and extensions only
+    succeed for the current lease, so a worker whose lease expired cannot
+    complete a job another worker has taken over.
+    """
+
+    def __init__(self, config: WorkQueueConfig):
+        self.config = config
+
+    async def enqueue(self, job: Job) -> Optional[str]:
+        """Add ``job``; returns its id, or None if a job with the same dedupe key is pending"""
+        raise NotImplementedError
+
+    async def lease(self, worker_id: str) -> Optional[Job]:
+        """Lease the oldest visible job, or return None if there is none"""
+        raise NotImplementedError
+
+    async def extend(self, job: Job) -> bool:
+        """Push back the visibility timeout of a job still being worked on"""
+        raise NotImplementedError
+
+    async def ack(self, job: Job) -> bool:
+        """Mark a leased job done; returns False if the lease was lost"""
+        raise NotImplementedError
+
+    async def nack(self, job: Job, error: str = "", delay: Optional[float] = None) -> None:
+        """Give a leased job back for a later retry (or mark it dead when out of attempts)"""
+        raise NotImplementedError
+
+    async def counts(self) -> Dict[str, int]:
+        """Number of jobs in each state"""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+class SQLiteWorkQueue(WorkQueue):
+    """Work queue stored in a SQLite database.
+
+    For workers on a single host only: SQLite's file locks are unreliable on
+    network filesystems, so hosts sharing the database could lease the same
+    job. Use ``RedisWorkQueue`` across hosts. Every lease runs in an immediate
+    (write-locked) transaction so a job is never handed to two local workers
+    at once.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            scraper TEXT NOT NULL,
+            url TEXT NOT NULL,
+            params TEXT NOT NULL,
+            dedupe_key TEXT NOT NULL,
+            state TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            visible_at REAL NOT NULL,
+            lease_token TEXT,
+            leased_by TEXT,
+            last_error TEXT,
+            created_at REAL NOT NULL,
+            finished_at REAL
+        );
+        CREATE UNIQUE INDEX IF NOT EXISTS jobs_pending_key
+            ON jobs (dedupe_key) WHERE state IN ('queued', 'leased');
+        CREATE INDEX IF NOT EXISTS jobs_visible ON jobs (state, visible_at);
+    """
+
+    def __init__(self, config: WorkQueueConfig):
+        super().__init__(config)
+        self.path = config.sqlite_path
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn.executescript(self.SCHEMA)
+            self._initialized = True
+        return conn
+
+    def _run(self, operation, *args):
+        # One short-lived connection per operation, run in a worker thread
+        conn = self._connect()
+        try:
+            return operation(conn, *args)
+        finally:
+            conn.close()
+
+    def _enqueue(self, conn: sqlite3.Connection, job: Job) -> Optional[str]:
+        now = time.time()
+        try:
+            cursor = conn.execute(
+                "INSERT INTO jobs (scraper, url, params, dedupe_key, state, visible_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job.scraper, job.url, json.dumps(job.params), job.dedupe_key, STATE_QUEUED, now, now)
+            )
+        except sqlite3.IntegrityError:
+            return None
+        job.job_id = str(cursor.lastrowid)
+        return job.job_id
+
+    def _lease(self, conn: sqlite3.Connection, worker_id: str) -> Optional[Job]:
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Expired leases that have used up their attempts will not be retried
+            conn.execute(
+                "UPDATE jobs SET state = ?, finished_at = ?, last_error = 'lease expired' "
+                "WHERE state = ? AND visible_at <= ? AND attempts >= ?",
+                (STATE_DEAD, now, STATE_LEASED, now, self.config.max_attempts)
+            )
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE state IN (?, ?) AND visible_at <= ? ORDER BY visible_at, id LIMIT 1",
+                (STATE_QUEUED, STATE_LEASED, now)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            token = uuid.uuid4().hex
+            conn.execute(
+                "UPDATE jobs SET state = ?, attempts = attempts + 1, visible_at = ?, lease_token = ?, leased_by = ? "
+                "WHERE id = ?",
+                (STATE_LEASED, now + self.config.visibility_timeout, token, worker_id, row["id"])
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return Job(
+            scraper=row["scraper"],
+            url=row["url"],
+            params=json.loads(row["params"]),
+            dedupe_key=row["dedupe_key"],
+            job_id=str(row["id"]),
+            attempts=row["attempts"] + 1,
+            lease_token=token,
+        )
+
+    def _extend(self, conn: sqlite3.Connection, job: Job) -> bool:
+        cursor = conn.execute(
+            "UPDATE jobs SET visible_at = ? WHERE id = ? AND state = ? AND lease_token = ?",
+            (time.time() + self.config.visibility_timeout, job.job_id, STATE_LEASED, job.lease_token)
+        )
+        return cursor.rowcount == 1
+
+    def _ack(self, conn: sqlite3.Connection, job: Job) -> bool:
+        cursor = conn.execute(
+            "UPDATE jobs SET state = ?, finished_at = ?, lease_token = NULL WHERE id = ? AND state = ? AND lease_token = ?",
+            (STATE_DONE, time.time(), job.job_id, STATE_LEASED, job.lease_token)
+        )
+        return cursor.rowcount == 1
+
+    def _nack(self, conn: sqlite3.Connection, job: Job, error: str, delay: float) -> None:
+        now = time.time()
+        if job.attempts >= self.config.max_attempts:
+            conn.execute(
+                "UPDATE jobs SET state = ?, finished_at = ?, last_error = ?, lease_token = NULL "
+                "WHERE id = ? AND lease_token = ?",
+                (STATE_DEAD, now, error, job.job_id, job.lease_token)
+            )
+        else:
+            conn.execute(
+                "UPDATE jobs SET state = ?, visible_at = ?, last_error = ?, lease_token = NULL "
+                "WHERE id = ? AND lease_token = ?",
+                (STATE_QUEUED, now + delay, error, job.job_id, job.lease_token)
+            )
+
+    def _counts(self, conn: sqlite3.Connection) -> Dict[str, int]:
+        rows = conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        return {state: count for state, count in rows}
+
+    async def enqueue(self, job: Job) -> Optional[str]:
+        return await asyncio.to_thread(self._run, self._enqueue, job)
+
+    async def lease(self, worker_id: str) -> Optional[Job]:
+        return await asyncio.to_thread(self._run, self._lease, worker_id)
+
+    async def extend(self, job: Job) -> bool:
+        return await asyncio.to_thread(self._run, self._extend, job)
+
+    async def ack(self, job: Job) -> bool:
+        return await asyncio.to_thread(self._run, self._ack, job)
+
+    async def nack(self, job: Job, error: str = "", delay: Optional[float] = None) -> None:
+        delay = self.config.retry_delay if delay is None else delay
+        await asyncio.to_thread(self._run, self._nack, job, error, delay)
+
+    async def counts(self) -> Dict[str, int]:
+        return await asyncio.to_thread(self._run, self._counts)
+
+class RedisWorkQueue(WorkQueue):
+    """Work queue stored in Redis (requires the ``redis`` package).
+
+    Visible jobs live in a sorted set scored by visibility time and leased
+    jobs in a second one scored by lease expiry; each state change runs as a
+    Lua script so it is atomic across workers.
+    """
+
+    LEASE_SCRIPT = """
+        local queued, leased, active = KEYS[1], KEYS[2], KEYS[3]
+        local now, timeout, max_attempts, prefix, token, worker =
+            tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3]), ARGV[4], ARGV[5], ARGV[6]
+        for _, id in ipairs(redis.call('ZRANGEBYSCORE', leased, '-inf', now)) do
+            redis.call('ZREM', leased, id)
+            local key = prefix .. ':job:' .. id
+            if tonumber(redis.call('HGET', key, 'attempts')) >= max_attempts then
+                redis.call('HSET', key, 'state', 'dead', 'last_error', 'lease expired')
+                redis.call('HDEL', active, redis.call('HGET', key, 'dedupe_key'))
+            else
+                redis.call('HSET', key, 'state', 'queued')
+                redis.call('ZADD', queued, now, id)
+            end
+        end
+        local ids = redis.call('ZRANGEBYSCORE', queued, '-inf', now, 'LIMIT', 0, 1)
+        if #ids == 0 then return nil end
+        local id = ids[1]
+        local key = prefix .. ':job:' .. id
+        redis.call('ZREM', queued, id)
+        redis.call('ZADD', leased, now + timeout, id)
+        redis.call('HINCRBY', key, 'attempts', 1)
+        redis.call('HSET', key, 'state', 'leased', 'lease_token', token, 'leased_by', worker)
+        return id
+    """
+
+    # KEYS: leased, active, job key; ARGV: id, token, new state, error
+    FINISH_SCRIPT = """
+        local leased, active, key = KEYS[1], KEYS[2], KEYS[3]
+        if redis.call('HGET', key, 'lease_token') ~= ARGV[2] or redis.call('ZREM', leased, ARGV[1]) == 0 then
+            return 0
+        end
+        redis.call('HSET', key, 'state', ARGV[3], 'last_error', ARGV[4])
+        redis.call('HDEL', key, 'lease_token')
+        redis.call('HDEL', active, redis.call('HGET', key, 'dedupe_key'))
+        return 1
+    """
+
+    # KEYS: queued, leased, job key; ARGV: id, token, visible at, error
+    RETRY_SCRIPT = """
+        local queued, leased, key = KEYS[1], KEYS[2], KEYS[3]
+        if redis.call('HGET', key, 'lease_token') ~= ARGV[2] or redis.call('ZREM', leased, ARGV[1]) == 0 then
+            return 0
+        end
+        redis.call('HSET', key, 'state', 'queued', 'last_error', ARGV[4])
+        redis.call('HDEL', key, 'lease_token')
+        redis.call('ZADD', queued, tonumber(ARGV[3]), ARGV[1])
+        return 1
+    """
+
+    # KEYS: leased, job key; ARGV: id, token, expiry
+    EXTEND_SCRIPT = """
+        if redis.call('HGET', KEYS[2], 'lease_token') ~= ARGV[2] then return 0 end
+        return redis.call('ZADD', KEYS[1], 'XX', 'CH', tonumber(ARGV[3]), ARGV[1])
+    """
+
+    def __init__(self, config: WorkQueueConfig):
+        super().__init__(config)
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            raise ImportError("The Redis work queue requires the 'redis' package (pip install redis)")
+        if config.redis_url is None:
+            raise ValueError("WorkQueueConfig.redis_url is required for the Redis backend")
+        self.client = redis.from_url(config.redis_url.get_secret_value(), decode_responses=True)
+        self.prefix = config.queue_name
+        self.queued_key = f"{self.prefix}:queued"
+        self.leased_key = f"{self.prefix}:leased"
+        self.active_key = f"{self.prefix}:active"
+        self._lease = self.client.register_script(self.LEASE_SCRIPT)
+        self._finish = self.client.register_script(self.FINISH_SCRIPT)
+        self._retry = self.client.register_script(self.RETRY_SCRIPT)
+        self._extend = self.client.register_script(self.EXTEND_SCRIPT)
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.prefix}:job:{job_id}"
+
+    async def enqueue(self, job: Job) -> Optional[str]:
+        job_id = str(await self.client.incr(f"{self.prefix}:sequence"))
+        if not await self.client.hsetnx(self.active_key, job.dedupe_key, job_id):
+            return None
+        now = time.time()
+        await self.client.hset(self._job_key(job_id), mapping={
+            "scraper": job.scraper,
+            "url": job.url,
+            "params": json.dumps(job.params),
+            "dedupe_key": job.dedupe_key,
+            "state": STATE_QUEUED,
+            "attempts": 0,
+            "created_at": now,
+        })
+        await self.client.zadd(self.queued_key, {job_id: now})
+        job.job_id = job_id
+        return job_id
+
+    async def lease(self, worker_id: str) -> Optional[Job]:
+        token = uuid.uuid4().hex
+        job_id = await self._lease(
+            keys=[self.queued_key, self.leased_key, self.active_key],
+            args=[time.time(), self.config.visibility_timeout, self.config.max_attempts,
+                  self.prefix, token, worker_id],
+        )
+        if job_id is None:
+            return None
+        data = await self.client.hgetall(self._job_key(job_id))
+        return Job(
+            scraper=data["scraper"],
+            url=data["url"],
+            params=json.loads(data["params"]),
+            dedupe_key=data["dedupe_key"],
+            job_id=job_id,
+            attempts=int(data["attempts"]),
+            lease_token=token,
+        )
+
+    async def extend(self, job: Job) -> bool:
+        return bool(await self._extend(
+            keys=[self.leased_key, self._job_key(job.job_id)],
+            args=[job.job_id, job.lease_token, time.time() + self.config.visibility_timeout],
+        ))
+
+    async def ack(self, job: Job) -> bool:
+        return bool(await self._finish(
+            keys=[self.leased_key, self.active_key, self._job_key(job.job_id)],
+            args=[job.job_id, job.lease_token, STATE_DONE, ""],
+        ))
+
+    async def nack(self, job: Job, error: str = "", delay: Optional[float] = None) -> None:
+        delay = self.config.retry_delay if delay is None else delay
+        if job.attempts >= self.config.max_attempts:
+            await self._finish(
+                keys=[self.leased_key, self.active_key, self._job_key(job.job_id)],
+                args=[job.job_id, job.lease_token, STATE_DEAD, error],
+            )
+        else:
+            await self._retry(
+                keys=[self.queued_key, self.leased_key, self._job_key(job.job_id)],
+                args=[job.job_id, job.lease_token, time.time() + delay, error],
+            )
+
+    async def counts(self) -> Dict[str, int]:
+        return {
+            STATE_QUEUED: await self.client.zcard(self.queued_key),
+            STATE_LEASED: await self.client.zcard(self.leased_key),
+        }
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+def create_work_queue(config: Optional[WorkQueueConfig] = None) -> WorkQueue:
+    """Create the work queue backend selected by ``config.backend``"""
+    config = config or WorkQueueConfig()
+    if config.backend == "sqlite":
+        return SQLiteWorkQueue(config)
+    if config.backend == "redis":
+        return RedisWorkQueue(config)
+    raise ValueError(f"Unknown work queue backend: {config.backend}")
@@ -0,0 +1,85 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+class DeadlineExceeded(Exception):
+    """Raised when work does not finish before its deadline."""
+
+class Deadline:
+    """A point in (monotonic) time by which work must finish."""
+
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """Deadline ``seconds`` from now"""
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        """Seconds left, never negative"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def child(self, seconds: Optional[float]) -> "Deadline":
+        """Deadline ``seconds`` from now, capped by this deadline"""
+        if seconds is None:
+            return self
+        return Deadline(min(self.expires_at, time.monotonic() + seconds))
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("current_deadline", default=None)
+
+def current_deadline() -> Optional[Deadline]:
+    """Deadline of the enclosing scope, inherited by tasks spawned from it"""
+    return _current_deadline.get()
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Make ``deadline`` the current deadline for the enclosed code
+
+    A scope can only tighten the deadline it inherits, never extend it.
+    """
+    parent = _current_deadline.get()
+    if deadline is not None and parent is not None and parent.expires_at < deadline.expires_at:
+        deadline = parent
+    token = _current_deadline.set(deadline if deadline is not None else parent)
+    try:
+        yield _current_deadline.get()
+    finally:
+        _current_deadline.reset(token)
+
+def child_deadline(seconds: Optional[float]) -> Optional[Deadline]:
+    """Deadline ``seconds`` from now capped by the current one (None if neither is set)"""
+    parent = current_deadline()
+    if parent is None:
+        return Deadline.after(seconds) if seconds is not None else None
+    return parent.child(seconds)
+
+async def within_deadline(awaitable: Awaitable[T], deadline: Optional[Deadline] = None) -> T:
+    """Await ``awaitable``, cancelling it when the deadline passes
+
+    Args:
+        awaitable: Work to run
+        deadline: Deadline to enforce; defaults to the current deadline
+
+    Raises:
+        DeadlineExceeded: If the deadline passes first
+    """
+    deadline = deadline or current_deadline()
+    if deadline is None:
+        return await awaitable
+    if deadline.expired:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded("Deadline already passed")
+    try:
+        return await asyncio.wait_for(awaitable, deadline.remaining())
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded("Deadline passed before completion") from None
@@ -3,6 +3,9 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 from ..models.config import GroqConfig
 from ..models.integrations import GroqMessage, GroqRequest, GroqResponse, GroqError
+from .resilience import RetryPolicy, call_with_retry, get_circuit_breaker
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 
 class GroqService:
     """Service for interacting with the Groq API."""
@@ -18,6 +21,8 @@ class GroqService:
             },
             timeout=config.timeout
         )
+        self.retry_policy = RetryPolicy.from_api_config(config)
+        self.circuit_breaker = get_circuit_breaker("groq")
 
     async def chat_completion(
         self,
@@ -44,9 +49,16 @@ class GroqService:
         )
 
         try:
-            response = await self.client.post(
-                "/openai/v1/chat/completions",
-                json=request.dict(exclude_none=True)
+            response = await call_with_retry(
+                lambda: self.client.post(
+                    "/openai/v1/chat/completions",
+                    json=request.dict(exclude_none=True)
+                ),
+                self.retry_policy,
+                breaker=self.circuit_breaker,
+                is_failure=lambda r: r.status_code in RETRYABLE_STATUS_CODES,
+                retry_on=(httpx.TransportError,),
+                description="Groq chat completion",
             )
             response.raise_for_status()
             return GroqResponse(**response.json())
@@ -0,0 +1,197 @@
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+import logging
+from ..models.config import APIConfig
+from .deadline import current_deadline
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because its circuit breaker is open."""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"Circuit '{name}' is open; retry in {retry_after:.0f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+class RetryPolicy:
+    """Exponential backoff with full jitter.
+
+    Attempt ``n`` (0-based) sleeps a random time in
+    ``[0, min(max_delay, base_delay * 2 ** n)]`` before retrying.
+    """
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 30.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @classmethod
+    def from_api_config(cls, config: APIConfig) -> "RetryPolicy":
+        """Build a policy from an API configuration's retry settings"""
+        return cls(max_retries=config.max_retries, base_delay=float(config.retry_delay))
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to sleep before retry number ``attempt`` (0-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+class RetryBudget:
+    """Caps retries to a fraction of recent traffic.
+
+    Every first attempt deposits ``ratio`` tokens and every retry spends one,
+    so during a widespread outage retries stop instead of multiplying load.
+    ``min_tokens`` keeps a small allowance for low-traffic periods.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_tokens: float = 3.0, max_tokens: float = 50.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.min_tokens = min_tokens
+        self.tokens = min_tokens
+
+    def record_request(self) -> None:
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Spend a token for a retry if the budget allows it"""
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+class CircuitBreaker:
+    """Per-source circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are refused for ``reset_timeout`` seconds. It then lets a single
+    trial call through (half-open); success closes it, failure re-opens it.
+    A trial that never reports back (its task was cancelled, say) does not
+    hold the circuit half-open: another trial is admitted ``reset_timeout``
+    seconds after it started.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 300.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def allow(self) -> bool:
+        """Whether a call may proceed now"""
+        if self.state == self.CLOSED:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at >= self.reset_timeout:
+            # opened_at marks the start of the trial while half-open
+            self.state = self.HALF_OPEN
+            self.opened_at = now
+            return True
+        return False
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit admits a trial call"""
+        if self.state == self.CLOSED:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"Circuit '{self.name}' opened after {self.failures} consecutive failures")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_shared_budget: Optional[RetryBudget] = None
+
+def get_circuit_breaker(name: str, failure_threshold: int = 5, reset_timeout: float = 300.0) -> CircuitBreaker:
+    """Get the process-wide circuit breaker for ``name``, creating it if needed"""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = CircuitBreaker(name, failure_threshold, reset_timeout)
+        _breakers[name] = breaker
+    return breaker
+
+def get_retry_budget() -> RetryBudget:
+    """Get the process-wide retry budget"""
+    global _shared_budget
+    if _shared_budget is None:
+        _shared_budget = RetryBudget()
+    return _shared_budget
+
+async def call_with_retry(
+    operation: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    budget: Optional[RetryBudget] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    is_failure: Callable[[Any], bool] = lambda result: result is None,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    description: str = "operation",
+) -> T:
+    """Run ``operation`` with backoff retries, a retry budget and a circuit breaker
+
+    A call fails when it raises one of ``retry_on`` or returns a result for
+    which ``is_failure`` is true. After the last attempt the final exception is
+    re-raised, or the final failing result is returned. Retries also stop when
+    the current deadline would pass during the backoff sleep. Any other
+    exception counts as a failure for ``breaker`` and propagates immediately.
+    Cancellation propagates without touching ``breaker``; a half-open trial it
+    interrupts is replaced once ``reset_timeout`` has passed.
+
+    Raises:
+        CircuitOpenError: If ``breaker`` refuses the call
+    """
+    if breaker is not None and not breaker.allow():
+        raise CircuitOpenError(breaker.name, breaker.retry_after())
+    if budget is not None:
+        budget.record_request()
+
+    attempt = 0
+    while True:
+        error: Optional[BaseException] = None
+        result = None
+        try:
+            result = await operation()
+        except asyncio.CancelledError:
+            raise
+        except retry_on as e:
+            error = e
+        except BaseException:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        if error is None and not is_failure(result):
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+        reason = str(error) if error is not None else "unsuccessful result"
+        delay = policy.delay(attempt)
+        deadline = current_deadline()
+        out_of_time = deadline is not None and (deadline.expired or deadline.remaining() < delay)
+        if attempt >= policy.max_retries or out_of_time or (budget is not None and not budget.try_spend()):
+            if breaker is not None:
+                breaker.record_failure()
+            logger.error(f"{description} failed after {attempt + 1} attempt(s): {reason}")
+            if error is not None:
+                raise error
+            return result
+
+        logger.warning(f"{description} failed ({reason}); retrying in {delay:.2f}s")
+        await asyncio.sleep(delay)
+        attempt += 1
@@ -0,0 +1,52 @@
+import argparse
+import asyncio
+import logging
+import signal
+from models.config import WorkQueueConfig
+from scrapers.distributed import QueueWorker
+from scrapers.fetcher import close_http_client
+from scrapers.offload import shutdown_process_pool
+from scrapers.telemetry import get_telemetry
+from scrapers.work_queue import create_work_queue
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+async def main(args):
+    queue = create_work_queue(WorkQueueConfig(
+        backend=args.backend,
+        sqlite_path=args.sqlite_path,
+        redis_url=args.redis_url
+    ))
+    worker = QueueWorker(queue, concurrency=args.concurrency)
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    telemetry = get_telemetry()
+    exporter = asyncio.create_task(telemetry.export_periodically())
+    try:
+        logger.info(f"Worker {worker.worker_id} started")
+        await worker.run()
+    except Exception as e:
+        logger.error(f"Error in worker: {str(e)}")
+    finally:
+        exporter.cancel()
+        await queue.close()
+        await close_http_client()
+        shutdown_process_pool()
+        logger.info(f"Worker {worker.worker_id} stopped: {worker.processed}")
+        telemetry.export()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run scrape jobs from the work queue")
+    parser.add_argument("--backend", default="sqlite", choices=["sqlite", "redis"])
+    parser.add_argument("--sqlite-path", default=WorkQueueConfig().sqlite_path)
+    parser.add_argument("--redis-url", default=None)
+    parser.add_argument("--concurrency", type=int, default=2)
+    asyncio.run(main(parser.parse_args()))
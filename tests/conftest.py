@@ -1,9 +1,23 @@
 import pytest
 import asyncio
+import os
+import httpx
 from src.app.scrapers.base_scraper import BaseScraper
 from src.app.scrapers.ufc_scraper import UFCScraper
 from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
 from src.app.scrapers.formula1_scraper import Formula1Scraper
+from src.app.scrapers.http_cache import HTTPCache
+from src.app.scrapers.fingerprints import FingerprintStore
+from src.app.scrapers.profiles import ProfileCache
+from src.app.scrapers.fixtures import FixturesCache
+from src.app.scrapers.browser_profiles import BrowserProfiles
+from src.app.scrapers.fetch_archive import ARCHIVE_REPLAY, FetchArchive
+from src.app.scrapers.scheduler import RequestScheduler
+from src.app.scrapers.telemetry import Telemetry
+from src.app.services.resilience import RetryBudget, RetryPolicy
+from src.app.models.config import BrowserProfileConfig, HTTPCacheConfig, SchedulerConfig, TelemetryConfig
+from unittest.mock import AsyncMock, patch
+from crawl4ai import AsyncWebCrawler
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -17,6 +31,153 @@ async def setup_test():
     """Setup any state specific to the execution of the given test case."""
     yield  # this is where the testing happens
 
+@pytest.fixture(autouse=True)
+def isolated_http_cache(tmp_path):
+    """Keep each test's page cache in its own temporary directory."""
+    cache = HTTPCache(HTTPCacheConfig(directory=str(tmp_path / "http_cache")))
+    with patch('src.app.scrapers.http_cache._shared_cache', cache):
+        yield cache
+
+@pytest.fixture(autouse=True)
+def isolated_fingerprints(tmp_path):
+    """Keep each test's change-detection state in its own temporary directory."""
+    store = FingerprintStore(str(tmp_path / "state" / "fingerprints.json"))
+    with patch('src.app.scrapers.fingerprints._shared_store', store):
+        yield store
+
+@pytest.fixture(autouse=True)
+def isolated_profiles(tmp_path):
+    """Keep each test's fighter profiles in its own temporary directory."""
+    cache = ProfileCache(str(tmp_path / "state" / "ufc_profiles.json"))
+    with patch('src.app.scrapers.profiles._shared_cache', cache):
+        yield cache
+
+@pytest.fixture(autouse=True)
+def isolated_fixtures(tmp_path):
+    """Keep each test's fixture calendars in its own temporary directory.
+
+    Table scrapers only load fixtures in tests that turn ``fill_fixtures`` back on,
+    so mocked transports see just the table request.
+    """
+    cache = FixturesCache(str(tmp_path / "state" / "fixtures"))
+    with patch('src.app.scrapers.fixtures._shared_cache', cache), \
+            patch.object(PremierLeagueScraper, 'fill_fixtures', False), \
+            patch.object(Formula1Scraper, 'fill_fixtures', False):
+        yield cache
+
+@pytest.fixture(autouse=True)
+def isolated_browser_profiles(tmp_path):
+    """Keep each test's browser profiles in its own temporary directory."""
+    profiles = BrowserProfiles(BrowserProfileConfig(directory=str(tmp_path / "browser_profiles")))
+    with patch('src.app.scrapers.browser_profiles._shared_profiles', profiles):
+        yield profiles
+
+@pytest.fixture(autouse=True)
+def fetch_archive():
+    """Serve fetches from the archive named by CRAWL4SPORTS_REPLAY, if set.
+
+    Record an archive with ``python main.py --record <archive>`` to run the
+    scraper fixtures (and the integration tests) offline, without a browser.
+    """
+    path = os.environ.get("CRAWL4SPORTS_REPLAY")
+    archive = FetchArchive(path, ARCHIVE_REPLAY) if path else None
+    with patch('src.app.scrapers.fetch_archive._shared_archive', archive):
+        yield archive
+
+@pytest.fixture
+def replay_archive(tmp_path):
+    """An empty archive that the test fills with ``record()`` and then replays."""
+    archive = FetchArchive(str(tmp_path / "fetches.jsonl.gz"), ARCHIVE_REPLAY)
+    with patch('src.app.scrapers.fetch_archive._shared_archive', archive):
+        yield archive
+
+@pytest.fixture(autouse=True)
+def isolated_scheduler():
+    """Give each test a scheduler whose rate limits never delay mocked requests."""
+    scheduler = RequestScheduler(SchedulerConfig(default_rate=1000, default_burst=1000))
+    with patch('src.app.scrapers.scheduler._shared_scheduler', scheduler):
+        yield scheduler
+
+@pytest.fixture(autouse=True)
+def isolated_telemetry(tmp_path):
+    """Record each test's stage timings and spans separately, exporting to a temporary directory."""
+    telemetry = Telemetry(TelemetryConfig(directory=str(tmp_path / "telemetry")))
+    with patch('src.app.scrapers.telemetry._shared_telemetry', telemetry):
+        yield telemetry
+
+@pytest.fixture(autouse=True)
+def isolated_resilience():
+    """Retry without sleeping and start every test with closed circuits."""
+    with patch('src.app.scrapers.base_scraper.BaseScraper.retry_policy', RetryPolicy(max_retries=2, base_delay=0)), \
+            patch('src.app.services.resilience._breakers', {}), \
+            patch('src.app.services.resilience._shared_budget', RetryBudget()):
+        yield
+
+@pytest.fixture
+def mock_crawler():
+    """Launch pooled browsers as one mock crawler, starting from a fresh shared pool.
+
+    Tests set ``mock_crawler.arun.return_value`` to the result browser
+    navigations should get.
+    """
+    mock = AsyncMock(spec=AsyncWebCrawler)
+    mock.__aenter__.return_value = mock
+    mock.__aexit__.return_value = None
+    with patch('src.app.scrapers.browser_pool.AsyncWebCrawler', return_value=mock), \
+            patch('src.app.scrapers.browser_pool._shared_pool', None):
+        yield mock
+
+@pytest.fixture
+def crawler_factory():
+    """Launch every pooled browser as a new mock crawler; yields the patched constructor."""
+    def make_crawler(*args, **kwargs):
+        mock = AsyncMock(spec=AsyncWebCrawler)
+        mock.__aenter__.return_value = mock
+        mock.__aexit__.return_value = None
+        return mock
+    with patch('src.app.scrapers.browser_pool.AsyncWebCrawler', side_effect=make_crawler) as factory:
+        yield factory
+
+@pytest.fixture
+def http_unavailable():
+    """Fail every plain HTTP fetch so scrapers render their pages in the browser."""
+    with patch('src.app.scrapers.base_scraper.fetch_http', AsyncMock(return_value=None)):
+        yield
+
+@pytest.fixture
+def serve():
+    """Answer plain HTTP fetches with a handler.
+
+    ``with serve(handler):`` patches the pooled HTTP client so each request
+    gets ``handler(request)``, an ``httpx.Response``.
+    """
+    def serve_with(handler):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return patch('src.app.scrapers.fetcher._shared_client', client)
+    return serve_with
+
+STANDINGS_ROW_HTML = """
+<tr class="table-row"><td class="position">{pos}</td><td class="team-name">Team {pos}</td>
+<td class="played">1</td><td class="won">1</td><td class="drawn">0</td><td class="lost">0</td>
+<td class="for">1</td><td class="against">0</td><td class="goal-difference">1</td>
+<td class="points">3</td><td class="form">WWWWW</td></tr>
+"""
+
+def standings_table(teams: int) -> str:
+    """Premier League table HTML with teams named ``Team 1`` to ``Team <teams>``."""
+    return "<table>" + "".join(STANDINGS_ROW_HTML.format(pos=i) for i in range(1, teams + 1)) + "</table>"
+
+@pytest.fixture
+def standings_teams():
+    """Rows in the table served by ``static_site``; override in a module to change it."""
+    return 20
+
+@pytest.fixture
+def static_site(serve, standings_teams):
+    """Answer every HTTP fetch with a table of ``standings_teams`` rows."""
+    with serve(lambda request: httpx.Response(200, text=standings_table(standings_teams))):
+        yield
+
 @pytest.fixture
 async def ufc_scraper():
     scraper = UFCScraper()
@@ -81,4 +242,4 @@ def sample_formula1_data():
         "fastest_laps": "2",
         "nationality": "GBR",
         "car_number": "44"
-    } 
\ No newline at end of file
+    } 
@@ -0,0 +1,138 @@
+import csv
+import httpx
+import pytest
+from unittest.mock import patch
+from src.app.scrapers.backfill import BackfillCheckpoint, Formula1Backfill
+from src.app.scrapers.pipeline import CSVSink
+
+RESULTS = "https://www.formula1.com/en/results.html"
+
+def standings_page(season):
+    return f"""<table class="resultsarchive-table"><tbody>
+    <tr><td class="position">1</td><td class="driver-name">Champion {season}</td>
+    <td class="nationality">ITA</td><td class="team-name">Alfa Romeo</td><td class="points">30.14</td></tr>
+    <tr><td class="position">2</td><td class="driver-name">Runner Up {season}</td>
+    <td class="nationality">ARG</td><td class="team-name">Alfa Romeo</td><td class="points">27</td></tr>
+    </tbody></table>"""
+
+def races_page(season):
+    return f"""<table class="resultsarchive-table"><tbody>
+    <tr><td><a href="/en/results.html/{season}/races/1/britain/race-result.html"><span class="race-name">British Grand Prix</span></a></td></tr>
+    <tr><td><a href="/en/results.html/{season}/races/2/monaco/race-result.html"><span class="race-name">Monaco Grand Prix</span></a></td></tr>
+    </tbody></table>"""
+
+RACE_PAGE = """<table class="resultsarchive-table"><tbody>
+<tr><td class="position">1</td><td class="car-number">2</td><td class="driver-name">Winner</td>
+<td class="team-name">Alfa Romeo</td><td class="laps">70</td><td class="time-retired">2:13:23.6</td><td class="points">9</td></tr>
+<tr><td class="position"></td><td class="car-number">10</td><td class="driver-name">Retired</td>
+<td class="team-name">Maserati</td><td class="laps">2</td><td class="time-retired">DNF</td><td class="points"></td></tr>
+</tbody></table>"""
+
+class Site:
+    """Serves a two-season archive and records requested URLs."""
+    
+    def __init__(self, failing=()):
+        self.requests = []
+        self.failing = set(failing)
+        
+    def __call__(self, request):
+        url = str(request.url)
+        self.requests.append(url)
+        if url in self.failing:
+            return httpx.Response(500)
+        if url.endswith("/drivers.html"):
+            return httpx.Response(200, text=standings_page(url.split("/")[-2]))
+        if url.endswith("/races.html"):
+            return httpx.Response(200, text=races_page(url.split("/")[-2]))
+        return httpx.Response(200, text=RACE_PAGE)
+
+@pytest.fixture
+def failing_browser(mock_crawler):
+    mock_crawler.arun.return_value.success = False
+    return mock_crawler
+
+def make_backfill(tmp_path):
+    return Formula1Backfill(
+        start_season=1950, end_season=1951, concurrency=3,
+        output_dir=str(tmp_path / "history"), checkpoint_path=str(tmp_path / "checkpoint.jsonl")
+    )
+
+def test_checkpoint_survives_torn_lines(tmp_path):
+    """Test that a partially written last line is ignored on resume"""
+    path = tmp_path / "checkpoint.jsonl"
+    checkpoint = BackfillCheckpoint(str(path))
+    checkpoint.mark_done("a", {"records": 1})
+    with open(path, "a") as f:
+        f.write('{"key": "b", "da')
+    resumed = BackfillCheckpoint(str(path))
+    assert "a" in resumed and "b" not in resumed
+    assert resumed.get("a") == {"records": 1}
+
+@pytest.mark.asyncio
+async def test_backfill_loads_standings_and_races(tmp_path, failing_browser, serve):
+    """Test that every season's standings and race results are written"""
+    with serve(Site()):
+        assert await make_backfill(tmp_path).run()
+    
+    history = tmp_path / "history"
+    with open(history / "1950" / "drivers.csv") as f:
+        standings = list(csv.DictReader(f))
+    assert [row["name"] for row in standings] == ["Champion 1950", "Runner Up 1950"]
+    assert standings[0]["points"] == "30.14"
+    
+    with open(history / "1951" / "02_monaco_grand_prix.csv") as f:
+        results = list(csv.DictReader(f))
+    assert results[0]["race"] == "Monaco Grand Prix"
+    assert results[1]["position"] == "" and results[1]["time_or_status"] == "DNF"
+    assert len(list(history.glob("*/*.csv"))) == 6
+
+@pytest.mark.asyncio
+async def test_backfill_resumes_without_refetching(tmp_path, failing_browser, serve):
+    """Test that a rerun only fetches the pages that failed before"""
+    monaco = f"{RESULTS}/1950/races/2/monaco/race-result.html"
+    with serve(Site(failing=[monaco])):
+        assert not await make_backfill(tmp_path).run()
+    
+    site = Site()
+    with serve(site):
+        backfill = make_backfill(tmp_path)
+        assert await backfill.run()
+    
+    assert site.requests == [monaco]
+    assert backfill.fetched == 1
+    assert (tmp_path / "history" / "1950" / "02_monaco_grand_prix.csv").exists()
+
+@pytest.mark.asyncio
+async def test_failed_write_is_not_checkpointed(tmp_path, failing_browser, serve):
+    """Test that pages whose output could not be written are fetched again"""
+    with serve(Site()), patch.object(CSVSink, "commit", side_effect=OSError("disk full")):
+        backfill = make_backfill(tmp_path)
+        assert not await backfill.run()
+    failed = backfill.failed
+    assert len(failed) == 6
+    
+    site = Site()
+    with serve(site):
+        backfill = make_backfill(tmp_path)
+        assert await backfill.run()
+    
+    assert sorted(site.requests) == sorted(failed)
+    assert backfill.fetched == 6
+
+@pytest.mark.asyncio
+async def test_current_season_is_refetched(tmp_path, failing_browser, serve):
+    """Test that pages of the season in progress are never checkpointed"""
+    with serve(Site()):
+        backfill = make_backfill(tmp_path)
+        backfill.current_season = 1951
+        assert await backfill.run()
+    
+    site = Site()
+    with serve(site):
+        backfill = make_backfill(tmp_path)
+        backfill.current_season = 1951
+        assert await backfill.run()
+    
+    assert len(site.requests) == 4
+    assert all("/1951/" in url for url in site.requests)
+    assert backfill.skipped == 4
@@ -0,0 +1,33 @@
+import pytest
+from benchmarks.run import bench_scraper, make_scraper, percentile
+from benchmarks.synthetic import GENERATORS
+from src.app.scrapers.extraction import extract_snapshot
+
+@pytest.mark.parametrize("name", sorted(GENERATORS))
+def test_synthetic_rows_are_valid(name):
+    """Test that every synthetic row extracts and validates into a record"""
+    scraper = make_scraper(name)
+    url = scraper.job_url or scraper.get_source_url()
+    page = extract_snapshot(GENERATORS[name](50), scraper.schema, scraper.region_selector)
+    records = [scraper.process_row(row, url) for row in page.rows]
+    assert len(records) == 50
+    assert all(record is not None for record in records)
+
+def test_synthetic_pages_are_deterministic():
+    """Test that a seed always generates the same page"""
+    assert GENERATORS["ufc"](30, seed=1) == GENERATORS["ufc"](30, seed=1)
+    assert GENERATORS["ufc"](30, seed=1) != GENERATORS["ufc"](30, seed=2)
+
+def test_percentile_nearest_rank():
+    """Test that percentiles pick the nearest-rank sample"""
+    samples = [float(n) for n in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([3.0], 99) == 3.0
+
+@pytest.mark.asyncio
+async def test_bench_scraper_reports_every_stage(tmp_path):
+    """Test that a benchmark run reports each stage with its throughput"""
+    results = await bench_scraper("premier_league", 20, 2, str(tmp_path))
+    assert [r["stage"] for r in results] == ["extract", "validate", "export", "end_to_end"]
+    assert all(r["runs"] == 2 and r["rows_per_sec"] > 0 for r in results)
@@ -0,0 +1,112 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+from src.app.scrapers.browser_pool import BrowserPool
+from src.app.models.config import BrowserPoolConfig
+
+@pytest.mark.asyncio
+async def test_acquire_release_shares_one_browser(crawler_factory):
+    """Test that several scrapers share a single launched browser"""
+    pool = BrowserPool(BrowserPoolConfig(max_browsers=1, max_contexts=2))
+    await pool.acquire()
+    await pool.acquire()
+    assert crawler_factory.call_count == 1
+    assert pool.size == 1
+
+    await pool.release()
+    assert pool.size == 1
+    await pool.release()
+    assert pool.size == 0
+
+@pytest.mark.asyncio
+async def test_lease_launches_up_to_max_browsers(crawler_factory):
+    """Test that busy browsers cause new launches up to the configured limit"""
+    pool = BrowserPool(BrowserPoolConfig(max_browsers=2, max_contexts=1))
+    async with pool.lease() as first:
+        async with pool.lease() as second:
+            assert first is not second
+    assert crawler_factory.call_count == 2
+    await pool.shutdown()
+
+@pytest.mark.asyncio
+async def test_lease_waits_when_pool_is_full(crawler_factory):
+    """Test that leases block until a context slot is released"""
+    pool = BrowserPool(BrowserPoolConfig(max_browsers=1, max_contexts=1))
+    order = []
+
+    async def worker(name):
+        async with pool.lease():
+            order.append(f"{name}-start")
+            await asyncio.sleep(0.01)
+            order.append(f"{name}-end")
+
+    await asyncio.gather(worker("a"), worker("b"))
+    assert order == ["a-start", "a-end", "b-start", "b-end"]
+    assert crawler_factory.call_count == 1
+    await pool.shutdown()
+
+@pytest.mark.asyncio
+async def test_browser_recycled_after_max_navigations(crawler_factory):
+    """Test that a browser is replaced once it has served max_navigations leases"""
+    pool = BrowserPool(BrowserPoolConfig(max_browsers=1, max_navigations=3, max_rss_mb=None))
+    crawlers = []
+    for _ in range(3):
+        async with pool.lease() as crawler:
+            crawlers.append(crawler)
+    await asyncio.gather(*pool._replacements)
+    async with pool.lease() as crawler:
+        crawlers.append(crawler)
+
+    assert crawlers[0] is crawlers[2]
+    assert crawlers[3] is not crawlers[0]
+    assert pool.recycled == 1 and pool.size == 1
+    crawlers[0].__aexit__.assert_awaited_once()
+    await pool.shutdown()
+
+@pytest.mark.asyncio
+async def test_replacement_is_warm_before_old_browser_retires(crawler_factory):
+    """Test that leases keep using the old browser until its replacement is up"""
+    launched = asyncio.Event()
+    real_side_effect = crawler_factory.side_effect
+
+    def slow_crawler(*args, **kwargs):
+        mock = real_side_effect(*args, **kwargs)
+        if crawler_factory.call_count > 1:
+            async def enter():
+                await launched.wait()
+                return mock
+            mock.__aenter__.side_effect = enter
+        return mock
+    crawler_factory.side_effect = slow_crawler
+
+    pool = BrowserPool(BrowserPoolConfig(max_browsers=1, max_contexts=2, max_navigations=1, max_rss_mb=None))
+    async with pool.lease() as first:
+        pass
+    # The replacement is still launching, so the old browser keeps serving
+    async with pool.lease() as during:
+        assert during is first
+        launched.set()
+        await asyncio.gather(*pool._replacements)
+        # Retired but still leased: closed only when this lease ends
+        first.__aexit__.assert_not_awaited()
+    first.__aexit__.assert_awaited_once()
+    async with pool.lease() as after:
+        assert after is not first
+    await pool.shutdown()
+
+@pytest.mark.asyncio
+async def test_memory_limit_recycles_most_used_browser(crawler_factory):
+    """Test that exceeding max_rss_mb replaces the browser with the most navigations"""
+    pool = BrowserPool(BrowserPoolConfig(max_browsers=1, max_navigations=None, max_rss_mb=100,
+                                         rss_check_interval=0))
+    with patch('src.app.scrapers.browser_pool.browser_rss_bytes', return_value=50 * 1024 * 1024):
+        async with pool.lease() as first:
+            pass
+    assert not pool._replacements
+    with patch('src.app.scrapers.browser_pool.browser_rss_bytes', return_value=200 * 1024 * 1024):
+        async with pool.lease():
+            pass
+        await asyncio.gather(*pool._replacements)
+    assert pool.recycled == 1
+    first.__aexit__.assert_awaited_once()
+    await pool.shutdown()
@@ -0,0 +1,101 @@
+import os
+import time
+import pytest
+from unittest.mock import patch
+from src.app.scrapers.browser_pool import BrowserPool
+from src.app.scrapers.browser_profiles import BrowserProfiles, LAST_USED_MARKER
+from src.app.scrapers.ufc_scraper import UFCScraper
+from src.app.models.config import BrowserPoolConfig, BrowserProfileConfig
+
+def write(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+
+def test_oversized_profile_keeps_cookies(tmp_path):
+    """Test that an oversized profile has its caches cleared but keeps cookies"""
+    profiles = BrowserProfiles(BrowserProfileConfig(directory=str(tmp_path), max_profile_bytes=1000))
+    root = profiles.path("UFCScraper")
+    write(os.path.join(root, "Default", "Cache", "Cache_Data", "data_1"), 5000)
+    write(os.path.join(root, "Default", "Cookies"), 100)
+
+    assert profiles.prepare("UFCScraper") == root
+    assert not os.path.exists(os.path.join(root, "Default", "Cache"))
+    assert os.path.exists(os.path.join(root, "Default", "Cookies"))
+    assert profiles.size_bytes("UFCScraper") == 100
+
+def test_prune_deletes_idle_profiles(tmp_path):
+    """Test that profiles unused for max_idle_days are deleted"""
+    profiles = BrowserProfiles(BrowserProfileConfig(directory=str(tmp_path), max_idle_days=7))
+    profiles.prepare("UFCScraper")
+    profiles.prepare("Formula1Scraper")
+    old = time.time() - 8 * 86400
+    os.utime(os.path.join(profiles.path("Formula1Scraper"), LAST_USED_MARKER), (old, old))
+
+    assert profiles.prune() == ["Formula1Scraper"]
+    assert os.path.isdir(profiles.path("UFCScraper"))
+
+@pytest.mark.asyncio
+async def test_scraper_browser_runs_on_its_profile(crawler_factory, isolated_browser_profiles):
+    """Test that a profiled scraper's browser is launched on its persistent user-data directory"""
+    with patch('src.app.scrapers.browser_pool._shared_pool', BrowserPool(BrowserPoolConfig())):
+        scraper = UFCScraper()
+        await scraper.initialize()
+        await scraper.cleanup()
+    config = crawler_factory.call_args.kwargs["config"]
+    assert config.use_persistent_context
+    assert config.user_data_dir == isolated_browser_profiles.path("UFCScraper")
+    assert any(arg.startswith("--disk-cache-size=") for arg in config.extra_args)
+
+@pytest.mark.asyncio
+async def test_profiles_get_separate_browsers(crawler_factory):
+    """Test that leases on different profiles never share a browser"""
+    pool = BrowserPool(BrowserPoolConfig(max_browsers=2, max_contexts=4))
+    async with pool.lease("a") as a1:
+        async with pool.lease("a") as a2:
+            async with pool.lease("b") as b:
+                assert a1 is a2
+                assert b is not a1
+    assert pool.size == 2
+    await pool.shutdown()
+
+@pytest.mark.asyncio
+async def test_default_pool_keeps_profiled_browsers(crawler_factory):
+    """Test that alternating leases of the profiled scrapers on the default pool never relaunch"""
+    pool = BrowserPool(BrowserPoolConfig())
+    profiles = ["PremierLeagueScraper", "Formula1Scraper", "UFCScraper"]
+    for _ in range(3):
+        for profile in profiles:
+            async with pool.lease(profile):
+                pass
+        async with pool.lease():
+            pass
+    assert crawler_factory.call_count == len(profiles) + 1
+    assert pool.size == len(profiles) + 1
+    await pool.shutdown()
+
+@pytest.mark.asyncio
+async def test_full_pool_closes_idle_browser_of_another_profile(crawler_factory):
+    """Test that a full pool makes room by closing an unused browser"""
+    pool = BrowserPool(BrowserPoolConfig(max_browsers=1))
+    async with pool.lease("a") as a:
+        pass
+    async with pool.lease("b") as b:
+        assert b is not a
+    a.__aexit__.assert_awaited_once()
+    assert pool.size == 1
+    await pool.shutdown()
+
+@pytest.mark.asyncio
+async def test_profile_browser_recycled_after_it_closes(crawler_factory):
+    """Test that a profile's browser closes before its replacement opens the profile"""
+    pool = BrowserPool(BrowserPoolConfig(max_navigations=1, max_rss_mb=None))
+    async with pool.lease("a") as first:
+        pass
+    first.__aexit__.assert_awaited_once()
+    async with pool.lease("a") as second:
+        assert second is not first
+    # Every lease reaches max_navigations, so the second browser is recycled too
+    assert pool.recycled == 2
+    second.__aexit__.assert_awaited_once()
+    await pool.shutdown()
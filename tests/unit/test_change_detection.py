@@ -0,0 +1,53 @@
+import httpx
+import pytest
+from src.app.scrapers.base_scraper import STATUS_CHANGED, STATUS_UNCHANGED
+from src.app.scrapers.extraction import extract_snapshot
+from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
+
+def standings(won: str, points: str, tracking_id: str = "a1") -> str:
+    return f"""
+    <table><tr class="table-row" data-track="{tracking_id}">
+      <td class="position">1</td><td class="team-name">Arsenal</td><td class="played">20</td>
+      <td class="won">{won}</td><td class="drawn">3</td><td class="lost">2</td><td class="for">45</td>
+      <td class="against">15</td><td class="goal-difference">30</td><td class="points">{points}</td>
+      <td class="form">WWWDL</td><script>var now = "{tracking_id}";</script>
+    </tr></table>
+    """
+
+def test_fingerprint_ignores_attributes_scripts_and_whitespace():
+    """Test that only visible text in the region affects the fingerprint"""
+    schema = PremierLeagueScraper.schema
+    first = extract_snapshot(standings("15", "48", "a1"), schema)
+    second = extract_snapshot(standings("15", "48", "b2").replace("<td", "\n  <td"), schema)
+    changed = extract_snapshot(standings("16", "51"), schema)
+    assert first.fingerprint == second.fingerprint
+    assert first.fingerprint != changed.fingerprint
+
+def test_matching_fingerprint_skips_extraction():
+    """Test that rows are not extracted when the fingerprint is unchanged"""
+    schema = PremierLeagueScraper.schema
+    first = extract_snapshot(standings("15", "48"), schema)
+    again = extract_snapshot(standings("15", "48"), schema, previous_fingerprint=first.fingerprint)
+    assert len(first.rows) == 1
+    assert again.unchanged
+
+@pytest.mark.asyncio
+async def test_second_identical_run_reports_unchanged(serve):
+    """Test that an identical page is reported unchanged and yields no records"""
+    pages = [standings("15", "48"), standings("15", "48"), standings("16", "51")]
+    scraper = PremierLeagueScraper()
+    scraper.cache_ttl = 0
+    
+    with serve(lambda request: httpx.Response(200, text=pages.pop(0))):
+        first = await scraper.scrape()
+        assert scraper.last_status == STATUS_CHANGED
+        # The records are kept in memory, so confirm them as stored
+        scraper.commit_fingerprint()
+        second = await scraper.scrape()
+        assert scraper.last_status == STATUS_UNCHANGED
+        third = await scraper.scrape()
+        assert scraper.last_status == STATUS_CHANGED
+    
+    assert len(first) == 1
+    assert second == []
+    assert third[0]["points"] == 51
@@ -0,0 +1,74 @@
+import asyncio
+import time
+import httpx
+import pytest
+from src.app.services.deadline import (
+    Deadline, DeadlineExceeded, current_deadline, deadline_scope, within_deadline
+)
+from src.app.scrapers.base_scraper import STATUS_CHANGED, STATUS_PARTIAL, STATUS_TIMED_OUT
+from src.app.scrapers.cycle import run_cycle
+from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
+
+ROW_HTML = """
+<tr class="table-row"><td class="position">{pos}</td><td class="team-name">Team {pos}</td>
+<td class="played">1</td><td class="won">1</td><td class="drawn">0</td><td class="lost">0</td>
+<td class="for">1</td><td class="against">0</td><td class="goal-difference">1</td>
+<td class="points">3</td><td class="form">WWWWW</td></tr>
+"""
+TABLE_HTML = "<table>" + "".join(ROW_HTML.format(pos=i) for i in range(1, 11)) + "</table>"
+
+def test_scope_only_tightens():
+    """Test that nested scopes cannot extend an outer deadline"""
+    outer = Deadline.after(1)
+    with deadline_scope(outer):
+        with deadline_scope(Deadline.after(60)):
+            assert current_deadline() is outer
+        with deadline_scope(Deadline.after(0.5)) as inner:
+            assert inner.expires_at < outer.expires_at
+    assert current_deadline() is None
+
+@pytest.mark.asyncio
+async def test_within_deadline_cancels_slow_work():
+    """Test that slow work is abandoned when the deadline passes"""
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        await within_deadline(asyncio.sleep(5), Deadline.after(0.05))
+    assert time.monotonic() - start < 1
+
+@pytest.mark.asyncio
+async def test_cycle_is_bounded_by_deadline(serve):
+    """Test that a hung source is reported timed out without stalling the cycle"""
+    async def hang(request):
+        await asyncio.sleep(5)
+    
+    with serve(hang):
+        start = time.monotonic()
+        [result] = await run_cycle([PremierLeagueScraper()], timeout=0.1, grace=0.2)
+    
+    assert time.monotonic() - start < 1
+    assert result.status == STATUS_TIMED_OUT
+    assert result.records == []
+
+@pytest.mark.asyncio
+async def test_partial_results_are_kept(serve):
+    """Test that rows validated before the deadline are returned"""
+    scraper = PremierLeagueScraper()
+    build_record = scraper.build_record
+    def slow_build_record(data, source_url):
+        time.sleep(0.03)
+        return build_record(data, source_url)
+    scraper.build_record = slow_build_record
+    
+    with serve(lambda request: httpx.Response(200, text=TABLE_HTML)):
+        [result] = await run_cycle([scraper], timeout=0.12)
+    
+    assert result.status == STATUS_PARTIAL
+    assert 0 < len(result.records) < 10
+
+@pytest.mark.asyncio
+async def test_cycle_reports_completed_sources(serve):
+    """Test that a fast source completes normally within the cycle"""
+    with serve(lambda request: httpx.Response(200, text=TABLE_HTML)):
+        [result] = await run_cycle([PremierLeagueScraper()], timeout=5)
+    assert result.status == STATUS_CHANGED
+    assert len(result.records) == 10
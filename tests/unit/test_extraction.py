@@ -0,0 +1,93 @@
+import pytest
+from unittest.mock import MagicMock
+from src.app.scrapers.extraction import (
+    ExtractionSchema, FieldSpec, extract_from_html, safe_int, safe_float, safe_str
+)
+from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
+
+STANDINGS_HTML = """
+<html><body><table>
+  <tr class="table-row">
+    <td class="position">1</td><td class="team-name"><a href="/clubs/1"> Arsenal </a></td>
+    <td class="played">20</td><td class="won">15</td><td class="drawn">3</td><td class="lost">2</td>
+    <td class="for">45</td><td class="against">15</td><td class="goal-difference">30</td>
+    <td class="points">48</td><td class="form">WWWDL</td>
+  </tr>
+  <tr class="table-row">
+    <td class="position">2</td><td class="team-name"><a href="/clubs/2">Liverpool</a></td>
+  </tr>
+</table></body></html>
+"""
+
+def test_safe_converters():
+    """Test that converters tolerate missing and malformed text"""
+    assert safe_int(" 7 ") == 7
+    assert safe_int("n/a") == 0
+    assert safe_int(None) == 0
+    assert safe_float("12.5") == 12.5
+    assert safe_float("") == 0.0
+    assert safe_str("  x ") == "x"
+    assert safe_str(None) == ""
+
+def test_extract_from_html_reads_text_and_attributes():
+    """Test that the HTML engine reads cells, attributes and missing cells"""
+    schema = ExtractionSchema(
+        row_selector=".table-row",
+        fields={
+            "team_name": FieldSpec(".team-name"),
+            "link": FieldSpec(".team-name a", attribute="href"),
+            "points": FieldSpec(".points", safe_int),
+        }
+    )
+    rows = extract_from_html(STANDINGS_HTML, schema)
+    assert len(rows) == 2
+    assert rows[0]["team_name"].strip() == "Arsenal"
+    assert rows[0]["link"] == "/clubs/1"
+    assert rows[1]["points"] is None
+    assert schema.convert(rows[0])["points"] == 48
+
+def test_extract_from_html_groups_rows_under_headers():
+    """Test that rows take the closest preceding header in document order"""
+    html = """
+    <h2 class="group">A</h2>
+    <ul><li class="item">a1</li><li class="item">a2</li></ul>
+    <h2 class="group">B</h2>
+    <ul><li class="item">b1</li></ul>
+    <h2 class="group">Empty</h2>
+    <h2 class="group">C</h2>
+    <ul><li class="item">c1</li></ul>
+    """
+    schema = ExtractionSchema(
+        row_selector="li.item",
+        group_selector="h2.group",
+        group_field="section",
+        fields={"name": FieldSpec("")}
+    )
+    rows = [schema.convert(row) for row in extract_from_html(html, schema)]
+    assert rows == [
+        {"name": "a1", "section": "A"},
+        {"name": "a2", "section": "A"},
+        {"name": "b1", "section": "B"},
+        {"name": "c1", "section": "C"},
+    ]
+
+def test_extract_from_html_empty_snapshot():
+    """Test that an empty snapshot yields no rows"""
+    schema = ExtractionSchema(row_selector=".table-row", fields={})
+    assert extract_from_html("", schema) == []
+
+@pytest.mark.asyncio
+async def test_scraper_parses_html_snapshot(mock_crawler, http_unavailable):
+    """Test that html mode parses result.html without touching the page"""
+    mock_result = MagicMock()
+    mock_result.success = True
+    mock_result.html = STANDINGS_HTML
+    mock_crawler.arun.return_value = mock_result
+    
+    scraper = PremierLeagueScraper()
+    await scraper.initialize()
+    teams = await scraper.scrape()
+    await scraper.cleanup()
+    
+    mock_result.page.evaluate.assert_not_called()
+    assert [team["name"] for team in teams] == ["Arsenal"]
@@ -0,0 +1,120 @@
+import gzip
+import httpx
+import pytest
+from unittest.mock import MagicMock, patch
+from src.app.scrapers.fetch_archive import ARCHIVE_RECORD, ARCHIVE_REPLAY, FetchArchive
+from src.app.scrapers.fetcher import fetch_http
+from src.app.scrapers.http_cache import CacheEntry
+from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
+
+TABLE_HTML = """
+<table><tr class="table-row">
+  <td class="position">1</td><td class="team-name">Arsenal</td><td class="played">20</td>
+  <td class="won">15</td><td class="drawn">3</td><td class="lost">2</td><td class="for">45</td>
+  <td class="against">15</td><td class="goal-difference">30</td><td class="points">48</td>
+  <td class="form">WWWDL</td>
+</tr></table>
+"""
+
+URL = "https://www.premierleague.com/tables"
+
+def offline(request):
+    raise AssertionError(f"Unexpected request to {request.url}")
+
+@pytest.mark.asyncio
+async def test_recorded_run_replays_offline(mock_crawler, serve, tmp_path, isolated_fingerprints):
+    """Test that a recorded scrape replays to the same records without network or browser"""
+    path = str(tmp_path / "fetches.jsonl.gz")
+    with serve(lambda request: httpx.Response(200, text=TABLE_HTML, headers={"etag": '"v1"'})):
+        # An earlier live run leaves a fresh cache entry and a fingerprint behind
+        scraper = PremierLeagueScraper()
+        scraper.cache_ttl = 60
+        assert len(await scraper.scrape()) == 1
+        scraper.commit_fingerprint()
+        with patch('src.app.scrapers.fetch_archive._shared_archive', FetchArchive(path, ARCHIVE_RECORD)):
+            recorded = await scraper.scrape()
+
+    archive = FetchArchive(path, ARCHIVE_REPLAY)
+    with patch('src.app.scrapers.fetch_archive._shared_archive', archive), serve(offline):
+        scraper = PremierLeagueScraper()
+        await scraper.initialize()
+        replayed = await scraper.scrape()
+        await scraper.cleanup()
+
+    assert [t["name"] for t in replayed] == [t["name"] for t in recorded] == ["Arsenal"]
+    assert len(archive) == 1
+    assert isolated_fingerprints.get(f"PremierLeagueScraper:{URL}") is not None
+    mock_crawler.__aenter__.assert_not_awaited()
+    mock_crawler.arun.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_not_modified_response_is_recorded_with_cached_body(serve, tmp_path):
+    """Test that a 304 is archived with the cached page so it replays in full"""
+    path = str(tmp_path / "fetches.jsonl.gz")
+    cached = CacheEntry(url=URL, body=TABLE_HTML, etag='"v1"')
+    with patch('src.app.scrapers.fetch_archive._shared_archive', FetchArchive(path, ARCHIVE_RECORD)), \
+            serve(lambda request: httpx.Response(304)):
+        assert (await fetch_http(URL, cached)).not_modified
+
+    entry = FetchArchive(path, ARCHIVE_REPLAY).replay(URL, "http")
+    assert (entry["status_code"], entry["html"]) == (304, TABLE_HTML)
+
+@pytest.mark.asyncio
+async def test_browser_fetches_are_recorded(mock_crawler, tmp_path):
+    """Test that browser responses, including failures, are recorded with their status"""
+    path = str(tmp_path / "fetches.jsonl.gz")
+    mock_crawler.arun.side_effect = [
+        MagicMock(success=True, html=TABLE_HTML, status_code=200, response_headers={"server": "test"}),
+        MagicMock(success=False, html="", status_code=503),
+    ]
+    scraper = PremierLeagueScraper()
+    with patch('src.app.scrapers.fetch_archive._shared_archive', FetchArchive(path, ARCHIVE_RECORD)):
+        assert (await scraper.fetch(URL)).html == TABLE_HTML
+        assert await scraper.fetch(URL) is None
+
+    archive = FetchArchive(path, ARCHIVE_REPLAY)
+    first = archive.replay(URL, "browser")
+    assert (first["status_code"], first["headers"]) == (200, {"server": "test"})
+    assert archive.replay(URL, "browser")["html"] is None
+
+@pytest.mark.asyncio
+async def test_page_mode_run_replays_offline(mock_crawler, serve, tmp_path):
+    """Test that a scrape extracting from the live page is recorded and replays offline"""
+    path = str(tmp_path / "fetches.jsonl.gz")
+    mock_crawler.arun.return_value = MagicMock(success=True, html=TABLE_HTML, status_code=200)
+    with patch('src.app.scrapers.fetch_archive._shared_archive', FetchArchive(path, ARCHIVE_RECORD)), \
+            serve(lambda request: httpx.Response(503)):
+        scraper = PremierLeagueScraper()
+        scraper.extraction_mode = "page"
+        recorded = await scraper.scrape()
+    
+    mock_crawler.arun.reset_mock()
+    with patch('src.app.scrapers.fetch_archive._shared_archive', FetchArchive(path, ARCHIVE_REPLAY)), \
+            serve(offline):
+        scraper = PremierLeagueScraper()
+        scraper.extraction_mode = "page"
+        replayed = await scraper.scrape()
+    
+    assert [t["name"] for t in replayed] == [t["name"] for t in recorded] == ["Arsenal"]
+    mock_crawler.arun.assert_not_called()
+
+def test_replay_order_and_fallback(replay_archive):
+    """Test that repeated fetches replay in order and other fetch paths are used as a fallback"""
+    replay_archive.record(URL, "http", "<p>first</p>", 200)
+    replay_archive.record(URL, "http", "<p>second</p>", 200)
+    assert [replay_archive.replay(URL, "http")["html"] for _ in range(3)] == [
+        "<p>first</p>", "<p>second</p>", "<p>second</p>"
+    ]
+    assert replay_archive.replay(URL, "browser")["source"] == "http"
+    assert replay_archive.replay("https://example.com/missing", "http") is None
+
+def test_interrupted_recording_stays_readable(tmp_path):
+    """Test that a torn final entry does not lose the entries before it"""
+    path = str(tmp_path / "fetches.jsonl.gz")
+    FetchArchive(path, ARCHIVE_RECORD).record(URL, "http", TABLE_HTML, 200)
+    torn = gzip.compress(b'{"url": "https://example.com", "source": "http"}\n')[:-12]
+    with open(path, "ab") as f:
+        f.write(torn)
+    archive = FetchArchive(path, ARCHIVE_REPLAY)
+    assert len(archive) == 1
+    assert archive.replay(URL, "http")["html"] == TABLE_HTML
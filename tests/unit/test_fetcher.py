@@ -0,0 +1,75 @@
+import httpx
+import pytest
+from unittest.mock import MagicMock
+from src.app.scrapers.fetcher import fetch_http
+from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
+
+STATIC_HTML = """
+<table><tr class="table-row">
+  <td class="position">1</td><td class="team-name">Arsenal</td><td class="played">20</td>
+  <td class="won">15</td><td class="drawn">3</td><td class="lost">2</td><td class="for">45</td>
+  <td class="against">15</td><td class="goal-difference">30</td><td class="points">48</td>
+  <td class="form">WWWDL</td>
+</tr></table>
+"""
+
+SHELL_HTML = "<html><body><div id='app'></div></body></html>"
+
+SKELETON_HTML = """
+<table><tr class="table-row">
+  <td class="position"></td><td class="team-name">Arsenal</td><td class="played"></td>
+  <td class="won"></td><td class="drawn"></td><td class="lost"></td><td class="for"></td>
+  <td class="against"></td><td class="goal-difference"></td><td class="points"></td>
+  <td class="form"></td>
+</tr></table>
+"""
+
+def respond(body: str, status_code: int = 200):
+    return lambda request: httpx.Response(status_code, text=body)
+
+@pytest.fixture
+def mock_crawler(mock_crawler):
+    mock_result = MagicMock()
+    mock_result.success = True
+    mock_result.html = STATIC_HTML
+    mock_crawler.arun.return_value = mock_result
+    return mock_crawler
+
+@pytest.mark.asyncio
+async def test_fetch_http_returns_snapshot(serve):
+    """Test that a successful GET produces an http snapshot"""
+    with serve(respond(STATIC_HTML)):
+        snapshot = await fetch_http("https://example.com/table")
+    assert snapshot.source == "http"
+    assert snapshot.status_code == 200
+    assert "Arsenal" in snapshot.html
+
+@pytest.mark.asyncio
+async def test_fetch_http_rejects_error_status(serve):
+    """Test that non-200 responses are treated as failed fetches"""
+    with serve(respond("", status_code=503)):
+        assert await fetch_http("https://example.com/table") is None
+
+@pytest.mark.asyncio
+async def test_static_page_skips_browser(mock_crawler, serve):
+    """Test that server-rendered tables never touch the browser"""
+    with serve(respond(STATIC_HTML)):
+        teams = await PremierLeagueScraper().scrape()
+    assert [team["name"] for team in teams] == ["Arsenal"]
+    mock_crawler.arun.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_missing_rows_fall_back_to_browser(mock_crawler, serve):
+    """Test that a client-rendered shell falls back to the browser"""
+    with serve(respond(SHELL_HTML)):
+        teams = await PremierLeagueScraper().scrape()
+    assert [team["name"] for team in teams] == ["Arsenal"]
+    mock_crawler.arun.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_empty_required_cells_fall_back_to_browser(mock_crawler, serve):
+    """Test that a table skeleton with empty required cells falls back to the browser"""
+    with serve(respond(SKELETON_HTML)):
+        teams = await PremierLeagueScraper().scrape()
+    assert [team["points"] for team in teams] == [48]
+    mock_crawler.arun.assert_awaited_once()
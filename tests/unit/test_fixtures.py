@@ -0,0 +1,129 @@
+import httpx
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from src.app.scrapers.fixtures import FixturesCache, FixturesIndex
+from src.app.scrapers.fixtures_scraper import Formula1CalendarScraper, PremierLeagueFixturesScraper
+from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
+
+TABLE_HTML = """
+<table>
+<tr class="table-row">
+  <td class="position">1</td><td class="team-name">Arsenal</td><td class="played">20</td>
+  <td class="won">15</td><td class="drawn">3</td><td class="lost">2</td><td class="for">45</td>
+  <td class="against">15</td><td class="goal-difference">30</td><td class="points">48</td>
+  <td class="form">WWWDL</td>
+</tr>
+<tr class="table-row">
+  <td class="position">2</td><td class="team-name">Liverpool</td><td class="played">20</td>
+  <td class="won">14</td><td class="drawn">4</td><td class="lost">2</td><td class="for">44</td>
+  <td class="against">18</td><td class="goal-difference">26</td><td class="points">46</td>
+  <td class="form">WDWWW</td>
+</tr>
+</table>
+"""
+
+def fixture(home, away, kickoff, status="Scheduled"):
+    return (
+        f'<div class="fixture"><span class="team home"><span class="team-name">{home}</span></span>'
+        f'<time datetime="{kickoff}"></time>'
+        f'<span class="team away"><span class="team-name">{away}</span></span>'
+        f'<span class="venue">Stadium</span><span class="status">{status}</span></div>'
+    )
+
+FIXTURES_HTML = "".join([
+    fixture("Arsenal", "Chelsea", "2099-03-01T15:00:00Z"),
+    fixture("Everton", "Arsenal", "2099-03-08T17:30:00+01:00"),
+    fixture("Liverpool", "Everton", "2000-01-01T15:00:00Z", status="Finished"),
+])
+
+class Site:
+    """Mock premierleague.com counting requests per path"""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request.url.path)
+        if request.url.path == "/fixtures":
+            return httpx.Response(200, text=FIXTURES_HTML)
+        return httpx.Response(200, text=TABLE_HTML)
+
+@pytest.mark.asyncio
+async def test_next_match_filled_from_fixtures(mock_crawler, serve):
+    """Test that each team gets its next unstarted fixture and the scraper its events"""
+    site = Site()
+    scraper = PremierLeagueScraper()
+    scraper.fill_fixtures = True
+    with serve(site):
+        teams = await scraper.scrape()
+    assert [(t["name"], t["next_match"]) for t in teams] == [
+        ("Arsenal", "Arsenal vs Chelsea, 2099-03-01 15:00"),
+        ("Liverpool", None),
+    ]
+    assert [event.status for event in scraper.get_events()] == ["Finished", "Scheduled", "Scheduled"]
+    mock_crawler.arun.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_fixtures_loaded_once_per_day(mock_crawler, serve, isolated_fixtures, isolated_http_cache):
+    """Test that later scrapes on the same day reuse the stored fixtures"""
+    site = Site()
+    with serve(site):
+        for _ in range(3):
+            scraper = PremierLeagueScraper()
+            scraper.fill_fixtures = True
+            scraper.detect_changes = False
+            await scraper.scrape()
+        isolated_http_cache.clear()
+        # A fresh cache (e.g. after a restart) reads today's file instead of scraping
+        with patch('src.app.scrapers.fixtures._shared_cache', FixturesCache(isolated_fixtures.directory)):
+            scraper = PremierLeagueScraper()
+            scraper.fill_fixtures = True
+            teams = await scraper.scrape()
+    assert site.requests.count("/fixtures") == 1
+    assert teams[0]["next_match"].startswith("Arsenal vs Chelsea")
+
+@pytest.mark.asyncio
+async def test_stale_fixtures_used_when_refresh_fails(mock_crawler, isolated_fixtures):
+    """Test that yesterday's calendar is used when today's scrape fails"""
+    isolated_fixtures._write(PremierLeagueFixturesScraper.output_prefix, "2000-01-01", [{
+        "keys": ["Arsenal"], "label": "Arsenal vs Chelsea", "start": "2099-03-01T15:00:00",
+        "status": "Scheduled", "location": "",
+    }])
+    with patch.object(FixturesCache, '_scrape', AsyncMock(return_value=None)):
+        index = await isolated_fixtures.get_index(PremierLeagueFixturesScraper)
+    assert index.next_for("arsenal ") == "Arsenal vs Chelsea"
+
+@pytest.mark.asyncio
+async def test_fixtures_refreshed_while_in_progress(mock_crawler, serve, isolated_fixtures):
+    """Test that a started fixture's calendar is scraped again so it turns live"""
+    kickoff = (datetime.utcnow() - timedelta(minutes=30)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    statuses = iter(["Scheduled", "Live"])
+
+    def site(request):
+        if request.url.path == "/fixtures":
+            return httpx.Response(200, text=fixture("Arsenal", "Chelsea", kickoff, status=next(statuses)))
+        return httpx.Response(200, text=TABLE_HTML)
+
+    isolated_fixtures.live_refresh = 0
+    scraper = PremierLeagueScraper()
+    scraper.fill_fixtures = True
+    scraper.detect_changes = False
+    with serve(site):
+        await scraper.scrape()
+        assert scraper.get_events()[0].status == "Scheduled"
+        await scraper.scrape()
+    assert scraper.get_events()[0].status == "Live"
+    assert scraper.current_poll_interval() == scraper.polling_policy.live_interval
+
+def test_calendar_applies_to_every_driver():
+    """Test that calendar races are the next race of any driver and skip started ones"""
+    scraper = Formula1CalendarScraper()
+    races = [
+        {"race": "Bahrain Grand Prix", "circuit": "Sakhir", "race_date": datetime(2099, 3, 2, 15), "status": ""},
+        {"race": "Saudi Arabian Grand Prix", "circuit": "Jeddah", "race_date": datetime(2099, 3, 9, 17), "status": ""},
+    ]
+    index = FixturesIndex([scraper.fixture_entry(race) for race in races], scraper.sport_id)
+    assert index.next_for("Max Verstappen", now=datetime(2099, 3, 1)) == "Bahrain Grand Prix, 2099-03-02"
+    assert index.next_for("Lewis Hamilton", now=datetime(2099, 3, 3)) == "Saudi Arabian Grand Prix, 2099-03-09"
+    assert index.next_for("Lewis Hamilton", now=datetime(2099, 3, 10)) is None
@@ -1,20 +1,14 @@
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from src.app.scrapers.formula1_scraper import Formula1Scraper
-from crawl4ai import AsyncWebCrawler
+
+# Pages render in the mock browser (the conftest mock_crawler)
+pytestmark = pytest.mark.usefixtures("http_unavailable")
 
 @pytest.fixture
 def formula1_scraper():
     return Formula1Scraper()
 
-@pytest.fixture
-def mock_crawler():
-    mock = AsyncMock(spec=AsyncWebCrawler)
-    mock.__aenter__.return_value = mock
-    mock.__aexit__.return_value = None
-    with patch('src.app.scrapers.base_scraper.AsyncWebCrawler', return_value=mock):
-        yield mock
-
 @pytest.mark.asyncio
 async def test_initialization(formula1_scraper, mock_crawler):
     """Test that the scraper initializes correctly"""
@@ -24,6 +18,7 @@ async def test_initialization(formula1_scraper, mock_crawler):
 @pytest.mark.asyncio
 async def test_cleanup(formula1_scraper, mock_crawler):
     """Test that the scraper cleans up resources correctly"""
+    await formula1_scraper.initialize()
     await formula1_scraper.cleanup()
     mock_crawler.__aexit__.assert_awaited_once_with(None, None, None)
 
@@ -109,4 +104,27 @@ async def test_validate_data(formula1_scraper):
         "nationality": "Test Country",
         "car_number": "44"
     }
-    assert formula1_scraper.validate_data(invalid_data) is False 
\ No newline at end of file
+    assert formula1_scraper.validate_data(invalid_data) is False
+
+@pytest.mark.asyncio
+async def test_scrape_extracts_table_in_single_evaluation(formula1_scraper, mock_crawler):
+    """Test that all rows are read with one in-page evaluation"""
+    mock_page = AsyncMock()
+    mock_page.evaluate.return_value = [{
+        "driver_name": "Max Verstappen", "team": "Red Bull Racing", "position": "1",
+        "points": "575", "wins": "19", "podiums": "21", "fastest_laps": "9",
+        "nationality": "NED", "car_number": "1"
+    }]
+    mock_result = MagicMock()
+    mock_result.success = True
+    mock_result.page = mock_page
+    mock_crawler.arun.return_value = mock_result
+    
+    formula1_scraper.extraction_mode = "page"
+    await formula1_scraper.initialize()
+    drivers = await formula1_scraper.scrape()
+    
+    mock_page.evaluate.assert_awaited_once()
+    assert len(drivers) == 1
+    assert drivers[0]["name"] == "Max Verstappen"
+    assert drivers[0]["points"] == 575.0
@@ -0,0 +1,125 @@
+import time
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+from src.app.scrapers.http_cache import CacheEntry, HTTPCache
+from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
+from src.app.models.config import EnvironmentConfig, HTTPCacheConfig
+
+ROW = {
+    "team_name": "Arsenal", "position": "1", "played": "20", "won": "15", "drawn": "3",
+    "lost": "2", "goals_for": "45", "goals_against": "15", "goal_difference": "30",
+    "points": "48", "form": "WWWDL"
+}
+
+TABLE_HTML = """
+<table><tr class="table-row">
+  <td class="position">1</td><td class="team-name">{name}</td><td class="played">20</td>
+  <td class="won">15</td><td class="drawn">3</td><td class="lost">2</td><td class="for">45</td>
+  <td class="against">15</td><td class="goal-difference">30</td><td class="points">48</td>
+  <td class="form">WWWDL</td>
+</tr></table>
+"""
+
+@pytest.fixture
+def cache(tmp_path):
+    return HTTPCache(HTTPCacheConfig(directory=str(tmp_path), max_bytes=10_000, default_ttl=60))
+
+def test_put_and_get_roundtrip(cache):
+    """Test that bodies, validators and rows survive a roundtrip"""
+    cache.put(CacheEntry(url="https://a.test/", body="<html/>", etag='"v1"', rows=[ROW]))
+    entry = cache.get("https://a.test/")
+    assert entry.body == "<html/>"
+    assert entry.conditional_headers() == {"If-None-Match": '"v1"'}
+    assert entry.rows == [ROW]
+    assert entry.is_fresh(60)
+    assert not entry.is_fresh(0)
+    assert cache.get("https://missing.test/") is None
+
+def test_evicts_least_recently_used(tmp_path):
+    """Test that the oldest accessed entry goes first when over budget"""
+    cache = HTTPCache(HTTPCacheConfig(directory=str(tmp_path), max_bytes=3000))
+    cache.put(CacheEntry(url="https://a.test/", body="a" * 1000))
+    cache.put(CacheEntry(url="https://b.test/", body="b" * 1000))
+    time.sleep(0.01)
+    cache.get("https://a.test/")
+    cache.put(CacheEntry(url="https://c.test/", body="c" * 1000))
+    assert cache.size_bytes <= 3000
+    assert cache.get("https://b.test/") is None
+    assert cache.get("https://a.test/") is not None
+    assert cache.get("https://c.test/") is not None
+
+def test_index_is_rebuilt_from_disk(cache):
+    """Test that a new cache instance sees entries written by an earlier one"""
+    cache.put(CacheEntry(url="https://a.test/", body="<html/>"))
+    reopened = HTTPCache(cache.config)
+    assert reopened.size_bytes == cache.size_bytes
+    assert reopened.get("https://a.test/").body == "<html/>"
+
+@pytest.mark.asyncio
+async def test_not_modified_skips_parsing(isolated_http_cache, serve):
+    """Test that a 304 reuses cached rows without parsing the page"""
+    scraper = PremierLeagueScraper()
+    scraper.cache_ttl = 0
+    url = scraper.get_source_url()
+    isolated_http_cache.put(CacheEntry(
+        url=url, body="<html/>", etag='"v1"', rows=[ROW], fingerprint="f1",
+        namespace=scraper.source_name
+    ))
+    
+    seen_headers = {}
+    def handler(request):
+        seen_headers.update(request.headers)
+        return httpx.Response(304)
+    
+    with serve(handler), \
+            patch.object(scraper, 'parse_snapshot', AsyncMock()) as parse_snapshot:
+        teams = await scraper.scrape()
+    
+    assert seen_headers["if-none-match"] == '"v1"'
+    parse_snapshot.assert_not_called()
+    assert [team["name"] for team in teams] == ["Arsenal"]
+
+@pytest.mark.asyncio
+async def test_fresh_entry_skips_request(isolated_http_cache):
+    """Test that entries within the TTL are served without any request"""
+    scraper = PremierLeagueScraper()
+    scraper.cache_ttl = 60
+    isolated_http_cache.put(CacheEntry(
+        url=scraper.get_source_url(), body="<html/>", rows=[ROW], fingerprint="f1",
+        namespace=scraper.source_name
+    ))
+    
+    with patch('src.app.scrapers.base_scraper.fetch_http', AsyncMock()) as fetch_http:
+        teams = await scraper.scrape()
+    
+    fetch_http.assert_not_called()
+    assert len(teams) == 1
+
+@pytest.mark.asyncio
+async def test_every_scrape_revalidates_by_default(serve):
+    """Test that consecutive scrapes request the page again and see its new content"""
+    pages = [TABLE_HTML.format(name="Arsenal"), TABLE_HTML.format(name="Liverpool")]
+    requests = []
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, text=pages[len(requests) - 1])
+    
+    with serve(handler):
+        first = await PremierLeagueScraper().scrape()
+        second = await PremierLeagueScraper().scrape()
+    
+    assert len(requests) == 2
+    assert [team["name"] for team in first + second] == ["Arsenal", "Liverpool"]
+
+def test_ttl_is_capped_by_poll_interval():
+    """Test that a long TTL never outlives half the current poll interval"""
+    scraper = PremierLeagueScraper()
+    scraper.cache_ttl = 3600
+    assert scraper.cache_freshness() == scraper.poll_interval / 2
+
+def test_ttl_from_environment(tmp_path):
+    """Test that the environment's cache_ttl configures the page cache"""
+    environment = EnvironmentConfig(environment="test", database_url="sqlite://")
+    config = HTTPCacheConfig.from_environment(environment, directory=str(tmp_path))
+    assert HTTPCache(config).default_ttl == environment.cache_ttl
@@ -0,0 +1,39 @@
+import pytest
+from src.app.models.config import ProcessPoolConfig
+from src.app.scrapers.offload import OFFLOAD_PROCESS, configure_process_pool, shutdown_process_pool, validate_rows
+from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
+
+class OffloadedScraper(PremierLeagueScraper):
+    offload = OFFLOAD_PROCESS
+    use_http_cache = False
+    detect_changes = False
+
+@pytest.fixture
+def process_pool():
+    configure_process_pool(ProcessPoolConfig(max_workers=2, chunk_size=3))
+    yield
+    shutdown_process_pool()
+    configure_process_pool(ProcessPoolConfig())
+
+def test_validate_rows_skips_invalid_rows():
+    """Test chunk validation as run inside a worker"""
+    valid = {
+        "team_name": "Test FC", "position": "1", "played": "1", "won": "1", "drawn": "0",
+        "lost": "0", "goals_for": "1", "goals_against": "0", "goal_difference": "1",
+        "points": "3", "form": "WWWWW"
+    }
+    records = validate_rows(PremierLeagueScraper, [valid, {"team_name": "Broken"}], "https://example.com")
+    assert len(records) == 1
+    assert records[0]["position"] == 1
+
+@pytest.mark.asyncio
+async def test_offloaded_scrape_matches_inline(process_pool, static_site):
+    """Test that parsing and validation in worker processes give the same records in order"""
+    inline = PremierLeagueScraper()
+    inline.use_http_cache = False
+    inline.detect_changes = False
+    expected = await inline.scrape()
+    records = await OffloadedScraper().scrape()
+    
+    assert len(records) == 20
+    assert [r["position"] for r in records] == [r["position"] for r in expected] == list(range(1, 21))
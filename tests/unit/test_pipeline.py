@@ -0,0 +1,112 @@
+import asyncio
+import csv
+import pytest
+from unittest.mock import patch
+from src.app.scrapers.pipeline import CSVSink, batched, buffered
+from src.app.scrapers.base_scraper import STATUS_CHANGED, STATUS_FAILED, STATUS_UNCHANGED
+from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
+
+async def numbers(n, produced=None):
+    for i in range(n):
+        if produced is not None:
+            produced.append(i)
+        yield i
+
+@pytest.mark.asyncio
+async def test_buffered_applies_backpressure():
+    """Test that the producer runs at most maxsize items ahead of the consumer"""
+    produced = []
+    stream = buffered(numbers(100, produced), maxsize=5)
+    assert await stream.__anext__() == 0
+    await asyncio.sleep(0.01)
+    assert len(produced) <= 7
+    await stream.aclose()
+
+@pytest.mark.asyncio
+async def test_buffered_propagates_errors():
+    """Test that producer errors reach the consumer"""
+    async def failing():
+        yield 1
+        raise ValueError("boom")
+    
+    items = []
+    with pytest.raises(ValueError):
+        async for item in buffered(failing(), maxsize=2):
+            items.append(item)
+    assert items == [1]
+
+@pytest.mark.asyncio
+async def test_batched():
+    """Test grouping items into batches"""
+    assert [batch async for batch in batched(numbers(5), 2)] == [[0, 1], [2, 3], [4]]
+
+@pytest.mark.asyncio
+async def test_csv_sink_commits_atomically(tmp_path):
+    """Test that the sink only exposes the file once committed"""
+    filename = tmp_path / "out" / "records.csv"
+    async with CSVSink(str(filename)) as sink:
+        await sink.write([{"a": 1, "b": 2}])
+        await sink.write([{"a": 3, "b": 4}])
+        assert not filename.exists()
+    with open(filename) as f:
+        assert list(csv.DictReader(f)) == [{"a": "1", "b": "2"}, {"a": "3", "b": "4"}]
+
+@pytest.mark.asyncio
+async def test_csv_sink_discards_on_error(tmp_path):
+    """Test that a failed stream leaves no file behind"""
+    filename = tmp_path / "records.csv"
+    with pytest.raises(RuntimeError):
+        async with CSVSink(str(filename)) as sink:
+            await sink.write([{"a": 1}])
+            raise RuntimeError("failed")
+    assert list(tmp_path.iterdir()) == []
+
+@pytest.mark.asyncio
+async def test_failed_write_is_reported_and_cleaned_up(static_site, tmp_path):
+    """Test that a failed commit fails the scrape and removes the temporary file"""
+    out = tmp_path / "out"
+    # A directory in the way makes moving the file into place fail
+    (out / "standings.csv").mkdir(parents=True)
+    scraper = PremierLeagueScraper()
+    assert await scraper.stream_to_csv(str(out / "standings.csv")) == 0
+    assert scraper.last_status == STATUS_FAILED
+    assert [path.name for path in out.iterdir()] == ["standings.csv"]
+
+@pytest.mark.asyncio
+async def test_iter_records_streams_validated_records(static_site):
+    """Test that records are yielded one by one"""
+    scraper = PremierLeagueScraper()
+    records = [record async for record in scraper.iter_records()]
+    assert [record["position"] for record in records] == list(range(1, 21))
+    assert scraper.last_status == STATUS_CHANGED
+
+@pytest.mark.asyncio
+async def test_stream_to_csv(static_site, tmp_path):
+    """Test that a scrape is streamed into a CSV file in batches"""
+    scraper = PremierLeagueScraper()
+    scraper.sink_batch_size = 3
+    filename = tmp_path / "standings.csv"
+    
+    assert await scraper.stream_to_csv(str(filename)) == 20
+    with open(filename) as f:
+        assert len(list(csv.DictReader(f))) == 20
+    
+    # Unchanged content writes nothing
+    filename.unlink()
+    assert await scraper.stream_to_csv(str(filename)) == 0
+    assert scraper.last_status == STATUS_UNCHANGED
+    assert not filename.exists()
+
+@pytest.mark.asyncio
+async def test_failed_commit_keeps_page_changed(static_site, tmp_path, isolated_fingerprints):
+    """Test that a page whose CSV was never committed is written again on the next run"""
+    scraper = PremierLeagueScraper()
+    filename = tmp_path / "standings.csv"
+    
+    with patch.object(CSVSink, 'commit', side_effect=OSError("disk full")):
+        assert await scraper.stream_to_csv(str(filename)) == 0
+    assert isolated_fingerprints.get(f"{scraper.source_name}:{scraper.get_source_url()}") is None
+    
+    assert await scraper.stream_to_csv(str(filename)) == 20
+    assert scraper.last_status == STATUS_CHANGED
+    assert isolated_fingerprints.get(f"{scraper.source_name}:{scraper.get_source_url()}") is not None
@@ -0,0 +1,69 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+from src.app.scrapers.base_scraper import STATUS_CHANGED, STATUS_TIMED_OUT, STATUS_UNCHANGED
+from src.app.scrapers.poller import PollingDaemon
+from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
+
+class FastScraper(PremierLeagueScraper):
+    poll_interval = 0.05
+    poll_jitter = 0.2
+    poll_timeout = 1.0
+    use_http_cache = False
+
+@pytest.fixture
+def standings_teams():
+    return 3
+
+def test_next_interval_is_jittered():
+    """Test that poll intervals stay within the jitter window"""
+    scraper = FastScraper()
+    intervals = {PollingDaemon.next_interval(scraper) for _ in range(20)}
+    assert len(intervals) > 1
+    assert all(0.04 <= interval <= 0.06 for interval in intervals)
+
+@pytest.mark.asyncio
+async def test_poll_once_writes_changed_records(static_site, tmp_path):
+    """Test that a poll writes new records and skips unchanged content"""
+    scraper = FastScraper()
+    daemon = PollingDaemon([scraper], output_dir=str(tmp_path))
+    
+    first = await daemon.poll_once(scraper)
+    second = await daemon.poll_once(scraper)
+    
+    assert first.status == STATUS_CHANGED
+    assert second.status == STATUS_UNCHANGED
+    assert len(list(tmp_path.glob("premier_league_standings_*.csv"))) == 1
+    stats = daemon.stats[scraper.source_name]
+    assert stats.polls == 2 and stats.changed == 1
+
+@pytest.mark.asyncio
+async def test_daemon_polls_until_stopped(static_site, tmp_path):
+    """Test that the daemon keeps scrapers initialised and polls repeatedly"""
+    scraper = FastScraper()
+    daemon = PollingDaemon([scraper], output_dir=str(tmp_path))
+    
+    with patch.object(scraper, 'initialize') as initialize, patch.object(scraper, 'cleanup') as cleanup:
+        task = asyncio.create_task(daemon.run())
+        await asyncio.sleep(0.3)
+        daemon.stop()
+        await asyncio.wait_for(task, 1)
+    
+    initialize.assert_called_once()
+    cleanup.assert_called_once()
+    assert daemon.stats[scraper.source_name].polls >= 3
+
+@pytest.mark.asyncio
+async def test_missed_deadline_is_reported(tmp_path, serve):
+    """Test that a hung poll is counted as a missed deadline"""
+    async def hang(request):
+        await asyncio.sleep(5)
+    scraper = FastScraper()
+    scraper.poll_timeout = 0.05
+    daemon = PollingDaemon([scraper], output_dir=str(tmp_path), grace=0.05)
+    
+    with serve(hang):
+        result = await daemon.poll_once(scraper)
+    
+    assert result.status == STATUS_TIMED_OUT
+    assert daemon.stats[scraper.source_name].missed_deadlines == 1
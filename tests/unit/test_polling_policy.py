@@ -0,0 +1,57 @@
+import pytest
+from datetime import datetime, timedelta
+from src.app.models.base import Event
+from src.app.scrapers.polling_policy import AdaptivePollingPolicy
+from src.app.scrapers.poller import PollingDaemon
+from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
+
+NOW = datetime(2024, 3, 16, 15, 0)
+
+def make_event(status, starts_in):
+    return Event(
+        event_id=1,
+        sport_id=1,
+        event_date=NOW + starts_in,
+        location="Test Stadium",
+        status=status
+    )
+
+@pytest.fixture
+def policy():
+    return AdaptivePollingPolicy(
+        live_interval=60, active_interval=300, idle_interval=6 * 3600,
+        lead_time=timedelta(hours=1), cooldown=timedelta(hours=3)
+    )
+
+def test_no_events_defers_to_fixed_interval(policy):
+    """Test that the policy has no opinion without events"""
+    assert policy.interval([], NOW) is None
+
+def test_live_event_polls_fastest(policy):
+    """Test that any live event selects the live interval"""
+    events = [make_event("scheduled", timedelta(days=3)), make_event("Live", -timedelta(minutes=30))]
+    assert policy.interval(events, NOW) == 60
+
+def test_event_about_to_start_polls_actively(policy):
+    """Test that events inside their lead time select the active interval"""
+    assert policy.interval([make_event("scheduled", timedelta(minutes=20))], NOW) == 300
+
+def test_recently_completed_event_polls_actively(policy):
+    """Test that tables are polled actively while results settle"""
+    assert policy.interval([make_event("completed", -timedelta(hours=2))], NOW) == 300
+    assert policy.interval([make_event("completed", -timedelta(hours=5))], NOW) == 6 * 3600
+
+def test_idle_polling_wakes_before_next_event(policy):
+    """Test that idle polling is shortened to reach the next event's lead time"""
+    interval = policy.interval([make_event("scheduled", timedelta(hours=3))], NOW)
+    assert interval == timedelta(hours=2).total_seconds()
+    assert policy.interval([make_event("scheduled", timedelta(days=2))], NOW) == 6 * 3600
+
+def test_daemon_uses_policy_when_events_are_known():
+    """Test that the daemon paces a scraper by its events"""
+    scraper = PremierLeagueScraper()
+    scraper.polling_policy = AdaptivePollingPolicy(live_interval=42)
+    assert PollingDaemon.base_interval(scraper) == scraper.poll_interval
+    
+    scraper.events = [make_event("live", timedelta(0))]
+    assert PollingDaemon.base_interval(scraper) == 42
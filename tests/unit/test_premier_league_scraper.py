@@ -1,20 +1,14 @@
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
-from crawl4ai import AsyncWebCrawler
+
+# Pages render in the mock browser (the conftest mock_crawler)
+pytestmark = pytest.mark.usefixtures("http_unavailable")
 
 @pytest.fixture
 def premier_league_scraper():
     return PremierLeagueScraper()
 
-@pytest.fixture
-def mock_crawler():
-    mock = AsyncMock(spec=AsyncWebCrawler)
-    mock.__aenter__.return_value = mock
-    mock.__aexit__.return_value = None
-    with patch('src.app.scrapers.base_scraper.AsyncWebCrawler', return_value=mock):
-        yield mock
-
 @pytest.mark.asyncio
 async def test_initialization(premier_league_scraper, mock_crawler):
     """Test that the scraper initializes correctly"""
@@ -24,6 +18,7 @@ async def test_initialization(premier_league_scraper, mock_crawler):
 @pytest.mark.asyncio
 async def test_cleanup(premier_league_scraper, mock_crawler):
     """Test that the scraper cleans up resources correctly"""
+    await premier_league_scraper.initialize()
     await premier_league_scraper.cleanup()
     mock_crawler.__aexit__.assert_awaited_once_with(None, None, None)
 
@@ -111,4 +106,28 @@ async def test_validate_data(premier_league_scraper):
         # Missing points
         "form": "WWWDL"
     }
-    assert premier_league_scraper.validate_data(invalid_data) is False 
\ No newline at end of file
+    assert premier_league_scraper.validate_data(invalid_data) is False
+
+@pytest.mark.asyncio
+async def test_scrape_extracts_table_in_single_evaluation(premier_league_scraper, mock_crawler):
+    """Test that all rows are read with one in-page evaluation"""
+    mock_page = AsyncMock()
+    mock_page.evaluate.return_value = [{
+        "team_name": " Arsenal ", "position": "1", "played": "20", "won": "15",
+        "drawn": "3", "lost": "2", "goals_for": "45", "goals_against": "15",
+        "goal_difference": "30", "points": "48", "form": "WWWDL"
+    }]
+    mock_result = MagicMock()
+    mock_result.success = True
+    mock_result.page = mock_page
+    mock_crawler.arun.return_value = mock_result
+    
+    premier_league_scraper.extraction_mode = "page"
+    await premier_league_scraper.initialize()
+    teams = await premier_league_scraper.scrape()
+    
+    mock_page.evaluate.assert_awaited_once()
+    mock_page.query_selector_all.assert_not_called()
+    assert len(teams) == 1
+    assert teams[0]["name"] == "Arsenal"
+    assert teams[0]["points"] == 48
@@ -0,0 +1,109 @@
+import asyncio
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+from src.app.scrapers.profiles import ProfileCache
+from src.app.scrapers.scheduler import RequestScheduler
+from src.app.models.config import SchedulerConfig
+from src.app.scrapers.ufc_scraper import UFCScraper
+
+def rankings_html(records):
+    rows = "".join(
+        f'<div class="views-row"><span class="views-field-weight-class-rank">{rank}</span>'
+        f'<span class="views-field-title"><a href="/athlete/fighter-{rank}">Fighter {rank}</a></span>'
+        f'<span class="views-field-record">{record}</span></div>'
+        for rank, record in enumerate(records, start=1)
+    )
+    return (
+        '<div class="view-grouping"><div class="view-grouping-header">Lightweight</div>'
+        f'<div class="view-grouping-content">{rows}</div></div>'
+    )
+
+def profile_html(number):
+    return f"""
+    <html><body>
+      <div class="c-bio__field c-bio__field--country"><div class="c-bio__text">Country {number}</div></div>
+      <div class="c-bio__field c-bio__field--age"><div class="c-bio__text">{20 + number}</div></div>
+      <div class="c-bio__field c-bio__field--height"><div class="c-bio__text">70.00</div></div>
+      <div class="c-bio__field c-bio__field--reach"><div class="c-bio__text">72.00</div></div>
+      <div class="c-card-event--athlete-results__date">Mar. 15, 2025</div>
+    </body></html>
+    """
+
+class UFCSite:
+    """Mock ufc.com serving the rankings and slow profile pages"""
+
+    def __init__(self, records, delay=0.01):
+        self.records = records
+        self.delay = delay
+        self.profile_requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request):
+        if request.url.path == "/rankings":
+            return httpx.Response(200, text=rankings_html(self.records))
+        self.profile_requests.append(request.url.path)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        number = int(request.url.path.rsplit("-", 1)[1])
+        return httpx.Response(200, text=profile_html(number))
+
+@pytest.mark.asyncio
+async def test_profiles_fill_fighter_fields(mock_crawler, serve):
+    """Test that each fighter is enriched from their profile page"""
+    site = UFCSite(["20-2-0", "15-3-0"])
+    with serve(site):
+        fighters = await UFCScraper().scrape()
+    assert [f["name"] for f in fighters] == ["Fighter 1", "Fighter 2"]
+    assert fighters[0]["profile_url"] == "https://www.ufc.com/athlete/fighter-1"
+    assert (fighters[1]["country"], fighters[1]["age"], fighters[1]["reach"]) == ("Country 2", 22, "72.00")
+    assert fighters[0]["last_fight"] == "Mar. 15, 2025"
+    mock_crawler.arun.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_profile_fetches_are_capped(mock_crawler, serve):
+    """Test that no more than profile_concurrency profiles load at once"""
+    site = UFCSite(["10-0-0"] * 12, delay=0.02)
+    scraper = UFCScraper()
+    scraper.profile_concurrency = 3
+    # Let the scheduler allow more requests per host than the profile cap
+    scheduler = RequestScheduler(SchedulerConfig(max_per_host=8, default_rate=1000, default_burst=1000))
+    with serve(site), patch('src.app.scrapers.scheduler._shared_scheduler', scheduler):
+        fighters = await scraper.scrape()
+    assert [f["rank"] for f in fighters] == [str(n) for n in range(1, 13)]
+    assert len(site.profile_requests) == 12
+    assert site.max_in_flight == 3
+
+@pytest.mark.asyncio
+async def test_profiles_refresh_after_record_changes(mock_crawler, serve, isolated_profiles, isolated_http_cache):
+    """Test that only fighters whose record changed are refetched"""
+    site = UFCSite(["20-2-0", "15-3-0", "12-1-0"])
+    with serve(site):
+        await UFCScraper().scrape()
+    isolated_http_cache.clear()
+    # A fresh cache object reads what the first run persisted
+    with patch('src.app.scrapers.profiles._shared_cache', ProfileCache(isolated_profiles.path)):
+        site.records = ["20-2-0", "16-3-0", "12-1-0"]
+        site.profile_requests.clear()
+        with serve(site):
+            fighters = await UFCScraper().scrape()
+    assert site.profile_requests == ["/athlete/fighter-2"]
+    assert all(f["country"] for f in fighters)
+
+@pytest.mark.asyncio
+async def test_failed_profile_keeps_ranking_record(mock_crawler, serve):
+    """Test that a fighter whose profile fails to load is still returned"""
+    def handler(request):
+        if request.url.path == "/rankings":
+            return httpx.Response(200, text=rankings_html(["20-2-0"]))
+        return httpx.Response(404)
+    mock_crawler.arun.return_value = AsyncMock(success=False, html="")
+    with serve(handler):
+        fighters = await UFCScraper().scrape()
+    assert fighters[0]["name"] == "Fighter 1"
+    assert fighters[0]["country"] is None
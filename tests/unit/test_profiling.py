@@ -0,0 +1,43 @@
+import threading
+import time
+import tracemalloc
+from src.app.scrapers.profiling import ScrapeProfiler, StackSampler
+
+def spin(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+def test_sampler_counts_running_threads():
+    """Test that busy threads are sampled and idle pool workers are not"""
+    sampler = StackSampler(interval=0.001)
+    worker = threading.Thread(target=spin, args=(0.2,), name="busy")
+    sampler.start()
+    worker.start()
+    worker.join()
+    sampler.stop()
+    busy = [stack for stack in sampler.stacks if stack.startswith("busy;")]
+    assert busy and all(stack.rsplit(";", 1)[-1].startswith("spin (") for stack in busy)
+    assert not any("stack-sampler" in stack for stack in sampler.stacks)
+    assert sampler.top_functions(1)[0][0].startswith("spin (")
+
+def test_profile_writes_folded_stacks_and_allocations(tmp_path):
+    """Test that a profiled run writes flame graph input and its allocation sites"""
+    profiler = ScrapeProfiler(str(tmp_path), interval=0.001)
+    with profiler.profile("Source") as sampler:
+        kept = [bytearray(1024) for _ in range(2000)]
+        spin(0.05)
+    assert sampler.samples > 0
+    assert not tracemalloc.is_tracing()
+
+    lines = (tmp_path / "Source.folded").read_text().splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0 and ";" in stack
+    assert any("spin (" in line for line in lines)
+
+    report = (tmp_path / "Source.allocations.txt").read_text().splitlines()
+    assert report[0].startswith("Peak traced memory:")
+    assert "test_profiling.py" in report[2]
+    assert len(kept) == 2000
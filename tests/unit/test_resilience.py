@@ -0,0 +1,99 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.app.services.resilience import (
+    CircuitBreaker, CircuitOpenError, RetryBudget, RetryPolicy, call_with_retry
+)
+from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
+
+NO_DELAY = RetryPolicy(max_retries=2, base_delay=0)
+
+def test_backoff_is_bounded_and_jittered():
+    """Test that delays stay within the exponential envelope"""
+    policy = RetryPolicy(max_retries=5, base_delay=1.0, max_delay=4.0)
+    for attempt in range(6):
+        assert 0 <= policy.delay(attempt) <= min(4.0, 2 ** attempt)
+
+def test_retry_budget_limits_retries():
+    """Test that retries stop once the budget is spent"""
+    budget = RetryBudget(ratio=0.5, min_tokens=1)
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_spend()
+
+def test_circuit_breaker_opens_and_half_opens():
+    """Test the closed -> open -> half-open -> closed cycle"""
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+@pytest.mark.asyncio
+async def test_call_with_retry_recovers():
+    """Test that a transient failure is retried until it succeeds"""
+    operation = AsyncMock(side_effect=[None, RuntimeError("boom"), "ok"])
+    assert await call_with_retry(operation, NO_DELAY) == "ok"
+    assert operation.await_count == 3
+
+@pytest.mark.asyncio
+async def test_call_with_retry_reraises_last_error():
+    """Test that the final exception propagates when retries run out"""
+    operation = AsyncMock(side_effect=RuntimeError("down"))
+    breaker = CircuitBreaker("test", failure_threshold=1)
+    with pytest.raises(RuntimeError):
+        await call_with_retry(operation, NO_DELAY, breaker=breaker)
+    assert operation.await_count == 3
+    with pytest.raises(CircuitOpenError):
+        await call_with_retry(operation, NO_DELAY, breaker=breaker)
+    assert operation.await_count == 3
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_is_not_a_failure():
+    """Test that a cancelled half-open trial leaves the circuit alone until it expires"""
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+    breaker.opened_at -= 60
+    operation = AsyncMock(side_effect=asyncio.CancelledError())
+    with pytest.raises(asyncio.CancelledError):
+        await call_with_retry(operation, NO_DELAY, breaker=breaker)
+    assert operation.await_count == 1
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.failures == 1
+    with pytest.raises(CircuitOpenError):
+        await call_with_retry(AsyncMock(return_value="ok"), NO_DELAY, breaker=breaker)
+    
+    breaker.opened_at -= 60
+    assert await call_with_retry(AsyncMock(return_value="ok"), NO_DELAY, breaker=breaker) == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_unfinished_trial_expires():
+    """Test that a trial that never reports back is replaced after reset_timeout"""
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+    breaker.opened_at -= 60
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.opened_at -= 60
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+@pytest.mark.asyncio
+async def test_open_circuit_skips_browser(mock_crawler, http_unavailable):
+    """Test that a flapping source stops using browser slots"""
+    failed = MagicMock()
+    failed.success = False
+    mock_crawler.arun.return_value = failed
+    
+    scraper = PremierLeagueScraper()
+    scraper.circuit_breaker.failure_threshold = 1
+    assert await scraper.scrape() == []
+    assert mock_crawler.arun.await_count == 3
+    assert await scraper.scrape() == []
+    assert mock_crawler.arun.await_count == 3
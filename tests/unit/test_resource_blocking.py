@@ -0,0 +1,79 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from src.app.scrapers.browser_pool import BrowserPool
+from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
+from src.app.scrapers.resource_blocking import ResourceBlockRules, block_resources, run_config
+from src.app.models.config import BrowserPoolConfig
+from crawl4ai import AsyncWebCrawler
+
+def test_rules_block_types_and_domains():
+    """Test that rules match resource types and domains including subdomains"""
+    rules = ResourceBlockRules(resource_types={"image"}, domains={"doubleclick.net"},
+                               allow_domains={"cdn.premierleague.com"})
+    assert rules.blocks("image", "https://www.premierleague.com/logo.png")
+    assert rules.blocks("script", "https://securepubads.g.doubleclick.net/tag.js")
+    assert not rules.blocks("script", "https://www.premierleague.com/app.js")
+    assert not rules.blocks("script", "https://notdoubleclick.net/app.js")
+    assert not rules.blocks("image", "https://cdn.premierleague.com/badge.png")
+    assert not rules.blocks("document", "https://ad.doubleclick.net/frame.html")
+
+@pytest.mark.asyncio
+async def test_hook_routes_requests_through_rules():
+    """Test that the page hook aborts blocked requests and continues the rest"""
+    page = MagicMock()
+    page.route = AsyncMock()
+    await block_resources(page, config=run_config(ResourceBlockRules()))
+    pattern, handler = page.route.await_args.args
+    assert pattern == "**/*"
+
+    def route(resource_type, url):
+        r = MagicMock(abort=AsyncMock(), continue_=AsyncMock())
+        r.request.resource_type = resource_type
+        r.request.url = url
+        return r
+
+    font = route("font", "https://www.premierleague.com/font.woff2")
+    analytics = route("script", "https://www.google-analytics.com/analytics.js")
+    table = route("xhr", "https://footballapi.pulselive.com/standings")
+    for r in (font, analytics, table):
+        await handler(r)
+    font.abort.assert_awaited_once()
+    analytics.abort.assert_awaited_once()
+    table.continue_.assert_awaited_once()
+    table.abort.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_hook_without_rules_leaves_page_alone():
+    """Test that runs without rules install no route"""
+    page = MagicMock()
+    page.route = AsyncMock()
+    await block_resources(page, config=None)
+    page.route.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_pool_launches_lightweight_browsers():
+    """Test that pooled browsers get the lightweight profile and the blocking hook"""
+    crawler = MagicMock(spec=AsyncWebCrawler)
+    crawler.__aenter__ = AsyncMock(return_value=crawler)
+    crawler.__aexit__ = AsyncMock(return_value=None)
+    crawler.crawler_strategy = MagicMock()
+    with patch('src.app.scrapers.browser_pool.AsyncWebCrawler', return_value=crawler) as factory:
+        pool = BrowserPool(BrowserPoolConfig())
+        async with pool.lease():
+            pass
+        await pool.shutdown()
+    browser_config = factory.call_args.kwargs["config"]
+    assert browser_config.light_mode
+    assert "--blink-settings=imagesEnabled=false" in browser_config.extra_args
+    assert browser_config.java_script_enabled
+    crawler.crawler_strategy.set_hook.assert_called_once_with("on_page_context_created", block_resources)
+
+@pytest.mark.asyncio
+async def test_browser_fetch_passes_scraper_rules(mock_crawler):
+    """Test that browser navigations carry the scraper's block rules"""
+    mock_crawler.arun.return_value = MagicMock(success=True, html="<html></html>")
+    scraper = PremierLeagueScraper()
+    scraper.block_resources = ResourceBlockRules(resource_types={"image", "stylesheet"})
+    await scraper.fetch("https://www.premierleague.com/tables")
+    config = mock_crawler.arun.await_args.kwargs["config"]
+    assert config.shared_data["resource_block_rules"] is scraper.block_resources
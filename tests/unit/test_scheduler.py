@@ -0,0 +1,83 @@
+import asyncio
+import time
+import pytest
+from src.app.scrapers.scheduler import (
+    PRIORITY_HIGH, PRIORITY_LOW, RequestScheduler, TokenBucket
+)
+from src.app.models.config import SchedulerConfig
+
+def test_token_bucket_refills_over_time():
+    """Test that an empty bucket reports the wait until the next token"""
+    bucket = TokenBucket(rate=2.0, capacity=1)
+    now = bucket.updated_at
+    assert bucket.try_take(now) == 0
+    assert bucket.try_take(now) == pytest.approx(0.5)
+    assert bucket.try_take(now + 0.5) == 0
+
+@pytest.mark.asyncio
+async def test_global_concurrency_cap():
+    """Test that no more than max_concurrency requests run at once"""
+    scheduler = RequestScheduler(SchedulerConfig(
+        max_concurrency=2, max_per_host=10, default_rate=1000, default_burst=1000
+    ))
+    peak = 0
+
+    async def request(i):
+        nonlocal peak
+        async with scheduler.slot(f"https://site{i}.test/"):
+            peak = max(peak, scheduler.active)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(request(i) for i in range(6)))
+    assert peak == 2
+    assert scheduler.active == 0
+
+@pytest.mark.asyncio
+async def test_priority_order_when_saturated():
+    """Test that higher priority waiters are admitted first"""
+    scheduler = RequestScheduler(SchedulerConfig(
+        max_concurrency=1, default_rate=1000, default_burst=1000
+    ))
+    order = []
+
+    async def request(name, priority):
+        async with scheduler.slot("https://a.test/", priority):
+            order.append(name)
+            await asyncio.sleep(0.01)
+
+    blocker = asyncio.create_task(request("first", PRIORITY_LOW))
+    await asyncio.sleep(0)
+    await asyncio.gather(request("low", PRIORITY_LOW), request("high", PRIORITY_HIGH))
+    await blocker
+    assert order == ["first", "high", "low"]
+
+@pytest.mark.asyncio
+async def test_rate_limited_host_does_not_block_others():
+    """Test that a throttled host lets requests to other hosts through"""
+    scheduler = RequestScheduler(SchedulerConfig(
+        default_rate=1000, default_burst=1000, host_rates={"slow.test": 5.0}
+    ))
+    scheduler._bucket("slow.test").tokens = 0
+    order = []
+
+    async def request(url):
+        async with scheduler.slot(url):
+            order.append(url)
+
+    start = time.monotonic()
+    await asyncio.gather(request("https://slow.test/"), request("https://fast.test/"))
+    assert order == ["https://fast.test/", "https://slow.test/"]
+    assert time.monotonic() - start >= 0.15
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_removed():
+    """Test that cancelling a queued request frees its place"""
+    scheduler = RequestScheduler(SchedulerConfig(max_concurrency=1, default_rate=1000, default_burst=1000))
+    async with scheduler.slot("https://a.test/"):
+        waiter = asyncio.create_task(scheduler.slot("https://a.test/").__aenter__())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+    assert scheduler.active == 0
+    assert scheduler._waiters == []
@@ -0,0 +1,99 @@
+import json
+import httpx
+import pytest
+from unittest.mock import patch
+from src.app.models.analytics import PerformanceMetrics
+from src.app.models.config import TelemetryConfig
+from src.app.scrapers.cycle import scrape_source
+from src.app.scrapers.premier_league_scraper import PremierLeagueScraper
+from src.app.scrapers.telemetry import LatencyHistogram, Telemetry
+
+TABLE_HTML = """
+<table><tr class="table-row">
+  <td class="position">1</td><td class="team-name">Arsenal</td><td class="played">20</td>
+  <td class="won">15</td><td class="drawn">3</td><td class="lost">2</td><td class="for">45</td>
+  <td class="against">15</td><td class="goal-difference">30</td><td class="points">48</td>
+  <td class="form">WWWDL</td>
+</tr></table>
+"""
+
+def test_histogram_percentiles_within_precision():
+    """Test that percentiles are exact for small values and within the relative error above"""
+    histogram = LatencyHistogram(precision_bits=7)
+    for micros in range(1, 100001):
+        histogram.record(micros)
+    assert histogram.count == 100000
+    assert histogram.percentile(0.05) == 50
+    for q, expected in ((50, 50000), (90, 90000), (99, 99000)):
+        assert abs(histogram.percentile(q) - expected) <= expected / 64
+    assert histogram.percentile(100) == histogram.max == 100000
+    for index in histogram.counts:
+        low, high = histogram.bounds(index)
+        assert histogram._index(low) == index and histogram._index(high) == index
+
+def test_spans_nest_and_inherit_source():
+    """Test that stages started inside a span share its trace and source"""
+    telemetry = Telemetry(TelemetryConfig())
+    with telemetry.span("scrape", "Source") as root:
+        with telemetry.span("load") as load:
+            pass
+        with pytest.raises(ValueError):
+            with telemetry.span("write", activate=False):
+                raise ValueError("disk full")
+    assert load.parent_id == root.span_id and load.trace_id == root.trace_id
+    assert load.source == "Source"
+    spans = {span.name: span for span in telemetry.drain_spans()}
+    assert spans["write"].error == "ValueError: disk full"
+    assert spans["scrape"].error is None
+    assert telemetry.histogram("load", "Source").count == 1
+
+async def test_scrape_records_every_stage(isolated_telemetry, serve, tmp_path):
+    """Test that a streamed scrape traces load, fetch, extract, validate and write under one root"""
+    with serve(lambda request: httpx.Response(200, text=TABLE_HTML)):
+        result = await scrape_source(PremierLeagueScraper(), None, filename=str(tmp_path / "table.csv"))
+    assert result.written == 1
+
+    spans = isolated_telemetry.drain_spans()
+    by_name = {span.name: span for span in spans}
+    assert set(by_name) == {"scrape", "load", "fetch", "extract", "validate", "write"}
+    root = by_name["scrape"]
+    assert {span.trace_id for span in spans} == {root.trace_id}
+    assert by_name["write"].parent_id == root.span_id
+    assert by_name["fetch"].parent_id == by_name["load"].span_id
+    assert by_name["validate"].busy_ns > 0
+    assert root.attributes == {"status": "changed", "records": 1}
+    for name in by_name:
+        assert isolated_telemetry.histogram(name, "PremierLeagueScraper").count == 1
+
+async def test_export_writes_otlp_traces_and_metrics(isolated_telemetry, serve, tmp_path):
+    """Test that export appends OTLP/JSON spans and PerformanceMetrics records"""
+    with serve(lambda request: httpx.Response(200, text=TABLE_HTML)):
+        await scrape_source(PremierLeagueScraper(), None)
+    assert isolated_telemetry.export() == 5
+
+    directory = tmp_path / "telemetry"
+    [request] = [json.loads(line) for line in (directory / "traces.jsonl").read_text().splitlines()]
+    spans = request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert len(spans) == 5
+    root = next(span for span in spans if span["name"] == "scrape")
+    assert root["parentSpanId"] == "" and len(root["traceId"]) == 32
+    assert int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+    assert {"key": "source", "value": {"stringValue": "PremierLeagueScraper"}} in root["attributes"]
+
+    metrics = [PerformanceMetrics.parse_raw(line) for line in (directory / "metrics.jsonl").read_text().splitlines()]
+    p99 = next(m for m in metrics if m.metric_type == "scrape.fetch.latency.p99")
+    assert p99.unit == "ms" and "source:PremierLeagueScraper" in p99.tags
+    count = next(m for m in metrics if m.metric_type == "scrape.fetch.count")
+    assert count.value == 1 and sum(count.metadata["histogram"]["counts"].values()) == 1
+    assert isolated_telemetry.export() == 0
+
+async def test_disabled_telemetry_records_nothing(serve, tmp_path):
+    """Test that disabled telemetry neither times stages nor writes files"""
+    telemetry = Telemetry(TelemetryConfig(enabled=False, directory=str(tmp_path / "telemetry")))
+    with patch('src.app.scrapers.telemetry._shared_telemetry', telemetry), \
+            serve(lambda request: httpx.Response(200, text=TABLE_HTML)):
+        records = await PremierLeagueScraper().scrape()
+    assert len(records) == 1
+    assert telemetry.histograms == {}
+    assert telemetry.export() == 0
+    assert not (tmp_path / "telemetry").exists()
@@ -1,20 +1,33 @@
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from src.app.scrapers.ufc_scraper import UFCScraper
-from crawl4ai import AsyncWebCrawler
+
+# Pages render in the mock browser (the conftest mock_crawler)
+pytestmark = pytest.mark.usefixtures("http_unavailable")
+
+RANKINGS_HTML = """
+<div class="view-grouping">
+  <div class="view-grouping-header">Heavyweight</div>
+  <div class="view-grouping-content">
+    <div class="views-row"><span class="views-field-weight-class-rank">#1</span>
+      <span class="views-field-title">Fighter One</span><span class="views-field-record">20-2-0</span></div>
+    <div class="views-row"><span class="views-field-weight-class-rank">#2</span>
+      <span class="views-field-title">Fighter Two</span><span class="views-field-record">15-3-0</span></div>
+  </div>
+</div>
+<div class="view-grouping">
+  <div class="view-grouping-header">Lightweight</div>
+  <div class="view-grouping-content">
+    <div class="views-row"><span class="views-field-weight-class-rank">1</span>
+      <span class="views-field-title">Fighter Three</span><span class="views-field-record">25-1-0</span></div>
+  </div>
+</div>
+"""
 
 @pytest.fixture
 def ufc_scraper():
     return UFCScraper()
 
-@pytest.fixture
-def mock_crawler():
-    mock = AsyncMock(spec=AsyncWebCrawler)
-    mock.__aenter__.return_value = mock
-    mock.__aexit__.return_value = None
-    with patch('src.app.scrapers.base_scraper.AsyncWebCrawler', return_value=mock):
-        yield mock
-
 @pytest.mark.asyncio
 async def test_initialization(ufc_scraper, mock_crawler):
     """Test that the scraper initializes correctly"""
@@ -24,6 +37,7 @@ async def test_initialization(ufc_scraper, mock_crawler):
 @pytest.mark.asyncio
 async def test_cleanup(ufc_scraper, mock_crawler):
     """Test that the scraper cleans up resources correctly"""
+    await ufc_scraper.initialize()
     await ufc_scraper.cleanup()
     mock_crawler.__aexit__.assert_awaited_once_with(None, None, None)
 
@@ -42,30 +56,22 @@ async def test_get_required_fields(ufc_scraper):
 async def test_scrape_success(ufc_scraper, mock_crawler):
     """Test successful scraping of UFC data"""
     # Mock the crawler's arun method to return a successful result
-    mock_page = AsyncMock()
-    mock_page.query_selector_all.return_value = [
-        AsyncMock(get_attribute=AsyncMock(return_value="Heavyweight")),
-        AsyncMock(get_attribute=AsyncMock(return_value="Lightweight"))
-    ]
-    
     mock_result = MagicMock()
     mock_result.success = True
-    mock_result.page = mock_page
+    mock_result.html = RANKINGS_HTML
     mock_crawler.arun.return_value = mock_result
     
-    # Mock the fighter data extraction
-    mock_row = AsyncMock()
-    mock_row.query_selector.return_value = AsyncMock(
-        text_content=AsyncMock(return_value="Test Fighter")
-    )
-    mock_page.query_selector_all.return_value = [mock_row]
-    
     # Initialize before scraping
     await ufc_scraper.initialize()
     fighters = await ufc_scraper.scrape()
     
     assert isinstance(fighters, list)
     mock_crawler.arun.assert_called()
+    assert [(f["name"], f["weight_class"], f["rank"]) for f in fighters] == [
+        ("Fighter One", "Heavyweight", "1"),
+        ("Fighter Two", "Heavyweight", "2"),
+        ("Fighter Three", "Lightweight", "1"),
+    ]
 
 @pytest.mark.asyncio
 async def test_scrape_failure(ufc_scraper, mock_crawler):
@@ -112,4 +118,27 @@ async def test_validate_data(ufc_scraper):
         "reach": "76\"",
         "last_fight": "2024-01-01"
     }
-    assert ufc_scraper.validate_data(invalid_data) is False 
\ No newline at end of file
+    assert ufc_scraper.validate_data(invalid_data) is False
+
+@pytest.mark.asyncio
+async def test_scrape_groups_fighters_in_single_evaluation(ufc_scraper, mock_crawler):
+    """Test that all weight classes are read with one in-page evaluation"""
+    mock_page = AsyncMock()
+    mock_page.evaluate.return_value = [
+        {"name": " Fighter One ", "rank": "#1", "record": "20-2-0", "weight_class": " Heavyweight "},
+        {"name": "Fighter Three", "rank": "1", "record": "25-1-0", "weight_class": "Lightweight"},
+    ]
+    mock_result = MagicMock()
+    mock_result.success = True
+    mock_result.page = mock_page
+    mock_crawler.arun.return_value = mock_result
+    
+    ufc_scraper.extraction_mode = "page"
+    await ufc_scraper.initialize()
+    fighters = await ufc_scraper.scrape()
+    
+    mock_page.evaluate.assert_awaited_once()
+    mock_page.query_selector_all.assert_not_called()
+    assert [(f["name"], f["weight_class"]) for f in fighters] == [
+        ("Fighter One", "Heavyweight"), ("Fighter Three", "Lightweight")
+    ]
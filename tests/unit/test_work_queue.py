@@ -0,0 +1,121 @@
+import asyncio
+import csv
+import httpx
+import pytest
+from src.app.models.config import WorkQueueConfig
+from src.app.scrapers.distributed import QueueWorker, enqueue_sources
+from src.app.scrapers.work_queue import (
+    Job, SQLiteWorkQueue, STATE_DEAD, STATE_DONE, STATE_LEASED, STATE_QUEUED, create_work_queue
+)
+
+ROW_HTML = """
+<tr class="table-row"><td class="position">{pos}</td><td class="team-name">Team {pos}</td>
+<td class="played">1</td><td class="won">1</td><td class="drawn">0</td><td class="lost">0</td>
+<td class="for">1</td><td class="against">0</td><td class="goal-difference">1</td>
+<td class="points">3</td><td class="form">WWWWW</td></tr>
+"""
+TABLE_HTML = "<table>" + "".join(ROW_HTML.format(pos=i) for i in range(1, 5)) + "</table>"
+
+@pytest.fixture
+def queue(tmp_path):
+    return create_work_queue(WorkQueueConfig(
+        sqlite_path=str(tmp_path / "queue.db"), visibility_timeout=60, max_attempts=2, retry_delay=0
+    ))
+
+@pytest.mark.asyncio
+async def test_enqueue_deduplicates_pending_jobs(queue):
+    """Test that a source cannot be queued twice while a job for it is pending"""
+    assert isinstance(queue, SQLiteWorkQueue)
+    assert await queue.enqueue(Job("premier_league", "https://example.com/a")) is not None
+    assert await queue.enqueue(Job("premier_league", "https://example.com/a")) is None
+    assert await queue.enqueue(Job("premier_league", "https://example.com/b")) is not None
+    
+    job = await queue.lease("worker-1")
+    assert await queue.ack(job)
+    # Completed jobs no longer block new ones
+    assert await queue.enqueue(Job("premier_league", job.url)) is not None
+
+@pytest.mark.asyncio
+async def test_lease_is_exclusive(queue):
+    """Test that concurrent workers never lease the same job"""
+    for i in range(10):
+        await queue.enqueue(Job("premier_league", f"https://example.com/{i}"))
+    
+    jobs = await asyncio.gather(*(queue.lease(f"worker-{i}") for i in range(15)))
+    leased = [job.job_id for job in jobs if job is not None]
+    assert len(leased) == len(set(leased)) == 10
+    assert await queue.counts() == {STATE_LEASED: 10}
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_redelivered(queue):
+    """Test that a job becomes visible again after its visibility timeout"""
+    queue.config.visibility_timeout = 0
+    await queue.enqueue(Job("premier_league", "https://example.com"))
+    
+    first = await queue.lease("worker-1")
+    second = await queue.lease("worker-2")
+    assert second is not None and second.job_id == first.job_id
+    assert second.attempts == 2
+    # The first worker's lease is no longer valid
+    assert not await queue.ack(first)
+    assert await queue.ack(second)
+    
+@pytest.mark.asyncio
+async def test_expired_lease_out_of_attempts_is_dead(queue):
+    """Test that a job whose leases keep expiring is eventually given up"""
+    queue.config.visibility_timeout = 0
+    await queue.enqueue(Job("premier_league", "https://example.com"))
+    await queue.lease("worker-1")
+    await queue.lease("worker-2")
+    assert await queue.lease("worker-3") is None
+    assert await queue.counts() == {STATE_DEAD: 1}
+
+@pytest.mark.asyncio
+async def test_nack_retries_then_marks_dead(queue):
+    """Test that failed jobs are retried up to max_attempts"""
+    await queue.enqueue(Job("premier_league", "https://example.com"))
+    
+    job = await queue.lease("worker-1")
+    await queue.nack(job, "failed")
+    assert await queue.counts() == {STATE_QUEUED: 1}
+    
+    job = await queue.lease("worker-1")
+    await queue.nack(job, "failed")
+    assert await queue.counts() == {STATE_DEAD: 1}
+    assert await queue.lease("worker-1") is None
+
+@pytest.mark.asyncio
+async def test_extend_keeps_job_hidden(queue):
+    """Test that extending a lease keeps other workers from taking the job"""
+    await queue.enqueue(Job("premier_league", "https://example.com"))
+    job = await queue.lease("worker-1")
+    assert await queue.extend(job)
+    assert await queue.lease("worker-2") is None
+
+@pytest.mark.asyncio
+async def test_worker_runs_queued_jobs(queue, mock_crawler, serve, tmp_path):
+    """Test that a worker scrapes a queued source into a CSV file and acks it"""
+    assert len(await enqueue_sources(queue, ["premier_league"])) == 1
+    worker = QueueWorker(queue, output_dir=str(tmp_path / "out"))
+    
+    with serve(lambda request: httpx.Response(200, text=TABLE_HTML)):
+        job = await queue.lease(worker.worker_id)
+        result = await worker.run_job(job)
+    
+    assert result.written == 4
+    assert await queue.counts() == {STATE_DONE: 1}
+    [output] = (tmp_path / "out").glob("premier_league_standings_*.csv")
+    with open(output) as f:
+        assert len(list(csv.DictReader(f))) == 4
+
+@pytest.mark.asyncio
+async def test_worker_retries_failed_jobs(queue, mock_crawler, http_unavailable, tmp_path):
+    """Test that a failed scrape is handed back to the queue"""
+    mock_crawler.arun.return_value.success = False
+    await enqueue_sources(queue, ["premier_league"])
+    worker = QueueWorker(queue, output_dir=str(tmp_path))
+    
+    result = await worker.run_job(await queue.lease(worker.worker_id))
+    
+    assert result.status == "failed"
+    assert await queue.counts() == {STATE_QUEUED: 1}